@@ -1,40 +1,60 @@
 # mine_ability_patterns.py
 
+import os
 import re
-import pandas as pd
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
 
 PARQUET_PATH = "MTGCardLibrary.parquet"
 OUTPUT_PATH  = "ability_patterns_all_tiers.csv"
+LIBRARY_PATH = "ability_pattern_library.csv"
+
+# only these columns are touched by the miner; parquet lets us skip the rest
+CARD_COLUMNS = ["name", "oracle_id", "type_line", "oracle_text"]
+BATCH_SIZE   = 8192
+OUT_COLUMNS  = ["name", "oracle_id", "type_line", "tier", "clause", "normalized_clause"]
+PATTERN_KEY  = ["tier", "normalized_clause"]
+# Arrow quotes every string field; the parsed values match the old to_csv output
+CSV_OPTIONS  = pacsv.WriteOptions(quoting_style="needed")
+
+_CLAUSE_RE = re.compile(r"[^.\n;]+")   # one run between sentence/line breaks
+_BREAKS_PAT = r"[.\n;]+"               # the breaks themselves, for Arrow splitting
+_MANA_RE   = re.compile(r"\{[0-9wubrgc/]+\}")
+_NUM_RE    = re.compile(r"\d+")
+_WS_RE     = re.compile(r"\s+")
 
 
 def split_clauses(text: str) -> list[str]:
     if not text:
         return []
     # crude sentence/line splitter
-    return [c.strip() for c in re.split(r"[.\n;]+", text) if c.strip()]
+    return [m.group(0).strip() for m in _CLAUSE_RE.finditer(text) if not m.group(0).isspace()]
 
 
 def normalize_clause(c: str) -> str:
     """
-    Normalize to group similar patterns:
-    - lowercase
+    Normalize an already-lowercased clause to group similar patterns:
     - normalize mana symbols
     - normalize numbers
     - compress whitespace
     """
-    c = c.lower()
-
-    # replace mana symbols {1}{w}{u/b} -> {COST}
-    c = re.sub(r"\{[0-9wubrgc/]+\}", "{COST}", c)
+    # brace symbols only need handling when the clause has any
+    if "{" in c:
+        # replace mana symbols {1}{w}{u/b} -> {COST}
+        c = _MANA_RE.sub("{COST}", c)
 
-    # replace tap symbol specifically
-    c = c.replace("{t}", "{TAP}")
+        # replace tap symbol specifically
+        c = c.replace("{t}", "{TAP}")
 
     # replace plain integers with {N}
-    c = re.sub(r"\d+", "{N}", c)
+    c = _NUM_RE.sub("{N}", c)
 
-    # normalize spacing
-    c = re.sub(r"\s+", " ", c).strip()
+    # normalize spacing (split() also drops leading/trailing whitespace)
+    c = " ".join(c.split())
 
     return c
 
@@ -43,63 +63,51 @@ def normalize_clause(c: str) -> str:
 # Tier heuristics
 # ────────────────────────
 
+# Each tier's markers folded into one alternation, so a clause is checked with
+# a single regex scan. Shared by the scalar helpers and classify_tiers below.
+_REPLACEMENT_EFFECT_RE = re.compile(r" instead|prevent ")
+_REPLACEMENT_COND_RE   = re.compile(r"^if | if |^whenever | whenever |^when | when | would |^as ")
+_TRIGGERED_RE          = re.compile(
+    r"^whenever |^when |^at the beginning| whenever | at the beginning of "
+    r"|at end of combat|at the end of combat"
+)
+# a "{" or a cost marker before the first ":" (and a ":" somewhere after it)
+_ACTIVATED_RE          = re.compile(
+    r"^[^:]*(?:\{|tap |untap |discard a card|discard a creature card"
+    r"|sacrifice a|sacrifice another|pay \{n\} life|pay \{cost\}"
+    r"|exile a|exile this|return|remove a \+1/\+1 counter)[^:]*:"
+)
+
+
+# The is_*_like helpers expect a lowercased clause; classify_tier lowercases
+# once and hands the same string to each of them.
+
 def is_replacement_like(cl: str) -> bool:
-    cl = cl.lower()
-    has_instead_or_prevent = (" instead" in cl) or ("prevent " in cl)
-    has_if_when_would_as = (
-        " if " in cl
-        or cl.startswith("if ")
-        or " whenever " in cl
-        or cl.startswith("whenever ")
-        or " when " in cl
-        or cl.startswith("when ")
-        or " would " in cl
-        or cl.startswith("as ")
+    return (
+        _REPLACEMENT_EFFECT_RE.search(cl) is not None
+        and _REPLACEMENT_COND_RE.search(cl) is not None
     )
-    return has_instead_or_prevent and has_if_when_would_as
 
 
 def is_triggered_like(cl: str) -> bool:
-    cl = cl.lower()
-    return (
-        cl.startswith("whenever ")
-        or cl.startswith("when ")
-        or cl.startswith("at the beginning")
-        or " whenever " in cl
-        or " at the beginning of " in cl
-        or "at end of combat" in cl
-        or "at the end of combat" in cl
-    )
+    return _TRIGGERED_RE.search(cl) is not None
 
 
-def is_activated_like(clause: str) -> bool:
+def is_activated_like(cl: str) -> bool:
     """
-    Look for "COST: effect" style.
+    Look for "COST: effect" style (mana symbols or a common non-mana cost).
     Very rough but good enough for mining.
     """
-    if ":" not in clause:
-        return False
+    return _ACTIVATED_RE.search(cl) is not None
 
-    cost_part, _ = clause.split(":", 1)
-    cl_cost = cost_part.lower()
 
-    if "{" in cost_part:
-        return True  # mana symbols
-
-    # common non-mana costs
-    cost_markers = [
-        "tap ", "untap ", "discard a card", "discard a creature card",
-        "sacrifice a", "sacrifice another", "pay {n} life", "pay {cost}",
-        "exile a", "exile this", "return", "remove a +1/+1 counter",
-    ]
-    return any(m in cl_cost for m in cost_markers)
-
-
-def classify_tier(clause: str) -> str:
+def classify_tier(clause: str, cl_lower: str | None = None) -> str:
     """
     Order matters: replacement > triggered > activated > static/other
+    Pass cl_lower (the stripped, lowercased clause) if the caller already has
+    it, e.g. to reuse for normalize_clause.
     """
-    cl = clause.strip()
+    cl = clause.strip().lower() if cl_lower is None else cl_lower
     if not cl:
         return "none"
 
@@ -112,76 +120,171 @@ def classify_tier(clause: str) -> str:
     return "static_or_other"
 
 
+def classify_tiers(clauses_lower: pa.Array) -> pa.Array:
+    """
+    Vectorized classify_tier over already-stripped, lowercased clauses.
+    Order matters: replacement > triggered > activated > static/other
+    """
+    def has(regex: re.Pattern) -> pa.Array:
+        return pc.match_substring_regex(clauses_lower, regex.pattern)
+
+    return pc.if_else(
+        pc.and_(has(_REPLACEMENT_EFFECT_RE), has(_REPLACEMENT_COND_RE)), "replacement",
+        pc.if_else(
+            has(_TRIGGERED_RE), "triggered",
+            pc.if_else(has(_ACTIVATED_RE), "activated", "static_or_other"),
+        ),
+    )
+
+
 # ────────────────────────
 # Main mining pass
 # ────────────────────────
 
-def mine_all_tiers(parquet_path: str, out_csv: str) -> None:
-    df = pd.read_parquet(parquet_path)
+def explode_clauses(batch: pa.RecordBatch) -> pa.Table:
+    """
+    One row per (card, clause), keeping the card's identity columns.
+    Mirrors split_clauses / classify_tier / normalize_clause, but runs the
+    splitting and normalization as Arrow compute kernels instead of per row.
+    """
+    parts = pc.split_pattern_regex(pc.fill_null(batch.column("oracle_text"), ""), _BREAKS_PAT)
+    clauses = pc.utf8_trim_whitespace(pc.list_flatten(parts))
+
+    # parent index of each clause is its source row, so taking the card
+    # columns at those rows repeats them once per clause
+    keep = pc.not_equal(clauses, "")
+    clauses = clauses.filter(keep)
+    rows = pc.list_parent_indices(parts).filter(keep)
+
+    lower = pc.utf8_lower(clauses)
+
+    normalized = pc.replace_substring_regex(lower, _MANA_RE.pattern, "{COST}")
+    normalized = pc.replace_substring(normalized, "{t}", "{TAP}")
+    normalized = pc.replace_substring_regex(normalized, _NUM_RE.pattern, "{N}")
+    normalized = pc.replace_substring_regex(normalized, _WS_RE.pattern, " ")
+    normalized = pc.utf8_trim_whitespace(normalized)
+
+    return pa.table(
+        {
+            "name": batch.column("name").take(rows),
+            "oracle_id": batch.column("oracle_id").take(rows),
+            "type_line": batch.column("type_line").take(rows),
+            "tier": classify_tiers(lower),   # triggered / activated / replacement / static_or_other
+            "clause": clauses,
+            "normalized_clause": normalized,
+        }
+    )
 
-    rows = []
 
-    for _, row in df.iterrows():
-        oracle_text = row.get("oracle_text")
-        if not isinstance(oracle_text, str) or not oracle_text.strip():
-            continue
+def _mine_batch(batch: pa.RecordBatch) -> tuple[pa.Table, dict[tuple[str, str], tuple[str, str, str, str]]]:
+    """
+    Mine one record batch: per-pattern clause counts, plus the first
+    (name, oracle_id, type_line, clause) seen for each pattern in the batch.
+    Top-level so it can run in a worker process.
+    """
+    cand = explode_clauses(batch)
 
-        for clause in split_clauses(oracle_text):
-            if not clause:
-                continue
+    counts = (
+        cand.select(PATTERN_KEY)
+            .group_by(PATTERN_KEY)
+            .aggregate([([], "count_all")])
+    )
 
-            tier = classify_tier(clause)
-            if tier == "none":
-                continue
+    firsts: dict[tuple[str, str], tuple[str, str, str, str]] = {}
+    col = {name: cand.column(name).to_pylist() for name in OUT_COLUMNS}
+    for key, card in zip(
+        zip(col["tier"], col["normalized_clause"]),
+        zip(col["name"], col["oracle_id"], col["type_line"], col["clause"]),
+    ):
+        firsts.setdefault(key, card)
 
-            norm = normalize_clause(clause)
+    return counts, firsts
 
-            rows.append(
-                {
-                    "name": row.get("name", ""),
-                    "oracle_id": row.get("oracle_id", ""),
-                    "type_line": row.get("type_line", ""),
-                    "tier": tier,                   # triggered / activated / replacement / static_or_other
-                    "clause": clause,
-                    "normalized_clause": norm,
-                }
-            )
 
-    if not rows:
-        print("No clauses found.")
-        return
+def _map_bounded(pool: ProcessPoolExecutor, fn, items, window: int):
+    """
+    Like pool.map(fn, items), but with at most `window` items submitted at
+    once, so a streamed input is not read ahead (and held) in full. Results
+    are yielded in input order.
+    """
+    pending = deque()
+    for item in items:
+        pending.append(pool.submit(fn, item))
+        if len(pending) >= window:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
 
-    cand_df = pd.DataFrame(rows)
 
-    # one row per (tier, normalized_clause) pattern
-    dedup_df = cand_df.drop_duplicates(
-        subset=["tier", "normalized_clause"]
-    ).sort_values(
-        by=["tier", "normalized_clause", "name"]
-    )
+def mine_all_tiers(parquet_path: str, out_csv: str) -> pa.Table | None:
+    """
+    Write one example row per (tier, normalized_clause) pattern to out_csv.
 
-    dedup_df.to_csv(out_csv, index=False, encoding="utf-8")
-    print(f"Found {len(dedup_df)} unique (tier, pattern) combos.")
+    Returns an Arrow table of (tier, normalized_clause, count) with the
+    number of clauses that produced each pattern, or None if nothing
+    was mined.
+    """
+    # (tier, normalized_clause) -> (name, oracle_id, type_line, clause) of the
+    # first clause that produced it
+    seen: dict[tuple[str, str], tuple[str, str, str, str]] = {}
+    partial_counts: list[pa.Table] = []
+
+    # Cards are independent, so record batches are mined in worker processes.
+    # Results come back in batch order, which keeps "first clause wins" the
+    # same as a serial pass; only ~2 batches per worker are in flight, so
+    # memory stays bounded by the batch size rather than the library.
+    workers = os.cpu_count() or 1
+    batches = pq.ParquetFile(parquet_path).iter_batches(batch_size=BATCH_SIZE, columns=CARD_COLUMNS)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for counts, firsts in _map_bounded(pool, _mine_batch, batches, 2 * workers):
+            partial_counts.append(counts)
+            for key, card in firsts.items():
+                seen.setdefault(key, card)
+
+    if not seen:
+        print("No clauses found.")
+        return None
+
+    # one row per (tier, normalized_clause) pattern; already deduplicated,
+    # so this only sorts the unique rows
+    names, oracle_ids, type_lines, clauses = zip(*seen.values())
+    tiers, norms = zip(*seen.keys())
+    dedup = pa.table(
+        {
+            "name": names,
+            "oracle_id": oracle_ids,
+            "type_line": type_lines,
+            "tier": tiers,
+            "clause": clauses,
+            "normalized_clause": norms,
+        }
+    ).sort_by([("tier", "ascending"), ("normalized_clause", "ascending"), ("name", "ascending")])
+
+    pacsv.write_csv(dedup, out_csv, CSV_OPTIONS)
+    print(f"Found {dedup.num_rows} unique (tier, pattern) combos.")
     print(f"Wrote patterns to: {out_csv}")
 
+    return (
+        pa.concat_tables(partial_counts)
+          .group_by(PATTERN_KEY)
+          .aggregate([("count_all", "sum")])
+          .rename_columns(PATTERN_KEY + ["count"])
+    )
 
-if __name__ == "__main__":
-    mine_all_tiers(PARQUET_PATH, OUTPUT_PATH)
-
-
-
-patterns_path = "ability_patterns_all_tiers.csv"
 
-df = pd.read_csv(patterns_path)
+def build_pattern_library(counts: pa.Table, out_csv: str) -> None:
+    """
+    Collapse to unique patterns with counts, most frequent first per tier.
+    """
+    agg = counts.sort_by(
+        [("tier", "ascending"), ("count", "descending"), ("normalized_clause", "ascending")]
+    )
 
-# Collapse to unique patterns with counts
-agg = (
-    df.groupby(["tier", "normalized_clause"])
-      .size()
-      .reset_index(name="count")
-      .sort_values(["tier", "count"], ascending=[True, False])
-)
+    pacsv.write_csv(agg, out_csv, CSV_OPTIONS)
+    print(f"Wrote {out_csv} with", agg.num_rows, "unique patterns.")
 
-agg.to_csv("ability_pattern_library.csv", index=False)
-print("Wrote ability_pattern_library.csv with", len(agg), "unique patterns.")
 
+if __name__ == "__main__":
+    counts = mine_all_tiers(PARQUET_PATH, OUTPUT_PATH)
+    if counts is not None:
+        build_pattern_library(counts, LIBRARY_PATH)
@@ -7,9 +7,14 @@ FILE_PATH = Path("MagicCompRules 20260116.txt")
 OUT_PY = Path("mtg_keywords.py")
 OUT_JSON = Path("mtg_keywords.json")
 
+_TRAILING_PAREN_RE = re.compile(r"\s*\(.*?\)\s*$")
+_WS_RE = re.compile(r"\s+")
+_NON_MEMBER_RE = re.compile(r"[^a-z0-9_]")
+_UNDERSCORES_RE = re.compile(r"_+")
+
 def normalize_label(label: str) -> str:
     # Strip parenthetical trailing notes if present
-    label = re.sub(r"\s*\(.*?\)\s*$", "", label).strip()
+    label = _TRAILING_PAREN_RE.sub("", label).strip()
     # normalize apostrophes/hyphens/spaces for enum member names
     return label
 
@@ -19,39 +24,45 @@ def to_enum_member(label: str) -> str:
     s = s.replace("'", "")
     s = s.replace("-", "_")
     s = s.replace("/", "_")
-    s = re.sub(r"\s+", "_", s)
-    s = re.sub(r"[^a-z0-9_]", "", s)
-    s = re.sub(r"_+", "_", s).strip("_")
+    s = _WS_RE.sub("_", s)
+    s = _NON_MEMBER_RE.sub("", s)
+    s = _UNDERSCORES_RE.sub("_", s).strip("_")
     if not s:
         s = "unknown"
     if s[0].isdigit():
         s = f"k_{s}"
     return s.upper()
 
-def extract_rule_headings(text: str, section: int, skip_nums: set[int] | None = None):
+# 702 = keyword abilities, 701 = keyword actions; group(1) is the section
+_HEAD_RE = re.compile(r"^(70[12])\.(\d+)\.\s+([^\n]+?)\s*$", re.MULTILINE)
+
+def extract_rule_headings(text: str, skip_nums: set[int] | None = None) -> dict[int, list[tuple[int, str]]]:
     """
     Extract headings like:
       702.2. Deathtouch
       701.4. Attach
+    in a single pass, bucketed by section (701 / 702).
     """
     if skip_nums is None:
         skip_nums = set()
 
-    pat = re.compile(rf"^{section}\.(\d+)\.\s+([^\n]+?)\s*$", re.MULTILINE)
-    out = []
-    for m in pat.finditer(text):
-        idx = int(m.group(1))
+    out = {701: [], 702: []}
+    for m in _HEAD_RE.finditer(text):
+        idx = int(m.group(2))
         if idx in skip_nums:
             continue
 
-        raw = normalize_label(m.group(2))
+        raw = normalize_label(m.group(3))
         if raw:
-            out.append((idx, raw))
+            out[int(m.group(1))].append((idx, raw))
+
+    return {section: _dedupe_headings(hits) for section, hits in out.items()}
 
+def _dedupe_headings(headings: list[tuple[int, str]]) -> list[tuple[int, str]]:
     # de-dupe by label while preserving order
     seen = set()
     deduped = []
-    for idx, raw in sorted(out, key=lambda x: x[0]):
+    for idx, raw in sorted(headings, key=lambda x: x[0]):
         key = raw.lower()
         if key in seen:
             continue
@@ -65,15 +76,15 @@ def unique_members(labels):
     Ensure enum member names are unique even if normalization collides.
     """
     base = [to_enum_member(x) for x in labels]
-    counts = Counter(base)
-    used = Counter()
+    dupes = {name for name, count in Counter(base).items() if count > 1}
+    seen = {}
     result = []
     for name in base:
-        if counts[name] == 1:
+        if name not in dupes:
             result.append(name)
         else:
-            used[name] += 1
-            result.append(f"{name}_{used[name]}")
+            seen[name] = seen.get(name, 0) + 1
+            result.append(f"{name}_{seen[name]}")
     return result
 
 def render_enum(enum_name: str, labels):
@@ -91,8 +102,9 @@ def main():
     text = FILE_PATH.read_text(encoding="utf-8")
 
     # 702 = keyword abilities, 701 = keyword actions
-    keyword_abilities = extract_rule_headings(text, 702, skip_nums={1})
-    keyword_actions   = extract_rule_headings(text, 701, skip_nums={1})
+    headings = extract_rule_headings(text, skip_nums={1})
+    keyword_abilities = headings[702]
+    keyword_actions   = headings[701]
 
     ability_labels = [name for _, name in keyword_abilities]
     action_labels = [name for _, name in keyword_actions]
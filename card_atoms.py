@@ -1,12 +1,21 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Optional, Union, FrozenSet
 from mtg_vocab import Source, Step, PermanentStatus, Zone, Cause, ObjKind
 
+# (from_zone, to_zone, obj, cause, source) packed 8 bits apiece into one int,
+# so a fully-specified zone move pattern is checked with a single compare.
+def zone_move_key(from_zone: Zone, to_zone: Zone, obj: ObjKind, cause: Cause, source: Source) -> int:
+    return (
+        (from_zone.value << 32) | (to_zone.value << 24) | (obj.value << 16)
+        | (cause.value << 8) | source.value
+    )
+
+
 # =====================
 # Pattern Atoms (wildcards allowed)
 # =====================
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ZoneMovePattern:
     from_zone: Optional[Zone] = None
     to_zone: Optional[Zone] = None
@@ -16,8 +25,15 @@ class ZoneMovePattern:
     source: Optional[Source] = None
     require_type: Optional[str] = None   # e.g. "Creature"
     forbid_type: Optional[str] = None    # e.g. "Token" if you ever model it as a type
+    # zone_move_key of the five enum fields, or None if any of them is a wildcard
+    _key: Optional[int] = field(init=False, repr=False, compare=False, default=None)
 
-@dataclass(frozen=True)
+    def __post_init__(self):
+        if None not in (self.from_zone, self.to_zone, self.obj, self.cause, self.source):
+            object.__setattr__(self, "_key", zone_move_key(
+                self.from_zone, self.to_zone, self.obj, self.cause, self.source))
+
+@dataclass(frozen=True, slots=True)
 class ResourceDeltaPattern:
     resource: Optional[str] = None
     delta: Optional[int] = None
@@ -26,12 +42,12 @@ class ResourceDeltaPattern:
     cause: Optional[Cause] = None
     source: Optional[Source] = None
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StepChangePattern:
     step: Optional[Step] = None
     source: Optional[Source] = None
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StateDeltaPattern:
     target: Optional[str] = None
     set_mask: Optional[PermanentStatus] = None
@@ -44,7 +60,7 @@ class StateDeltaPattern:
 # Event Atoms
 #============
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ZoneMove:
     from_zone: Zone
     to_zone: Zone
@@ -53,8 +69,13 @@ class ZoneMove:
     controller: Optional[str] = None
     cause: Cause = Cause.OTHER
     source: Source = Source.ANY
+    _key: int = field(init=False, repr=False, compare=False, default=0)
+
+    def __post_init__(self):
+        object.__setattr__(self, "_key", zone_move_key(
+            self.from_zone, self.to_zone, self.obj, self.cause, self.source))
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ResourceDelta:
     resource: str
     delta: int
@@ -63,12 +84,12 @@ class ResourceDelta:
     cause: Cause = Cause.OTHER
     source: Source = Source.ANY
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StepChange:
     step: Step
     source: Source = Source.RULES
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StateDelta:
     target: Optional[str] = None
     set_mask: PermanentStatus = PermanentStatus(0)
@@ -110,45 +131,60 @@ def untap_atom(target="SELF", cause=Cause.EFFECT, source=Source.CARD) -> StateDe
 Atom = Union[ZoneMove, ResourceDelta, StepChange, StateDelta]
 AtomPattern = Union[ZoneMovePattern, ResourceDeltaPattern, StepChangePattern, StateDeltaPattern]
 
-def atom_matches(pattern: AtomPattern, atom: Atom) -> bool:
-    if isinstance(pattern, ZoneMovePattern) and isinstance(atom, ZoneMove):
-        if pattern.require_type is not None and pattern.require_type not in atom.obj_types:
-            return False
-        if pattern.forbid_type is not None and pattern.forbid_type in atom.obj_types:
-            return False
-
-        return (
-            (pattern.from_zone is None or pattern.from_zone == atom.from_zone) and
-            (pattern.to_zone   is None or pattern.to_zone   == atom.to_zone) and
-            (pattern.obj       is None or pattern.obj       == atom.obj) and
-            (pattern.controller is None or pattern.controller == atom.controller) and
-            (pattern.cause     is None or pattern.cause     == atom.cause) and
-            (pattern.source    is None or pattern.source    == atom.source)
-        )
+def _match_zone_move(pattern: ZoneMovePattern, atom: ZoneMove) -> bool:
+    if pattern.require_type is not None and pattern.require_type not in atom.obj_types:
+        return False
+    if pattern.forbid_type is not None and pattern.forbid_type in atom.obj_types:
+        return False
 
-    if isinstance(pattern, ResourceDeltaPattern) and isinstance(atom, ResourceDelta):
-        return (
-            (pattern.resource is None or pattern.resource == atom.resource) and
-            (pattern.delta    is None or pattern.delta    == atom.delta) and
-            (pattern.target   is None or pattern.target   == atom.target) and
-            (pattern.subtype  is None or pattern.subtype  == atom.subtype) and
-            (pattern.cause    is None or pattern.cause    == atom.cause) and
-            (pattern.source   is None or pattern.source   == atom.source)
+    if pattern._key is not None:
+        return pattern._key == atom._key and (
+            pattern.controller is None or pattern.controller == atom.controller
         )
 
-    if isinstance(pattern, StepChangePattern) and isinstance(atom, StepChange):
-        return (
-            (pattern.step   is None or pattern.step   == atom.step) and
-            (pattern.source is None or pattern.source == atom.source)
-        )
+    return (
+        (pattern.from_zone is None or pattern.from_zone is atom.from_zone) and
+        (pattern.to_zone   is None or pattern.to_zone   is atom.to_zone) and
+        (pattern.obj       is None or pattern.obj       is atom.obj) and
+        (pattern.controller is None or pattern.controller == atom.controller) and
+        (pattern.cause     is None or pattern.cause     is atom.cause) and
+        (pattern.source    is None or pattern.source    is atom.source)
+    )
 
-    if isinstance(pattern, StateDeltaPattern) and isinstance(atom, StateDelta):
-        return (
-            (pattern.target     is None or pattern.target     == atom.target) and
-            (pattern.set_mask   is None or (atom.set_mask & pattern.set_mask) == pattern.set_mask) and
-            (pattern.clear_mask is None or (atom.clear_mask & pattern.clear_mask) == pattern.clear_mask) and
-            (pattern.cause      is None or pattern.cause      == atom.cause) and
-            (pattern.source     is None or pattern.source     == atom.source)
-        )
+def _match_resource_delta(pattern: ResourceDeltaPattern, atom: ResourceDelta) -> bool:
+    return (
+        (pattern.resource is None or pattern.resource == atom.resource) and
+        (pattern.delta    is None or pattern.delta    == atom.delta) and
+        (pattern.target   is None or pattern.target   == atom.target) and
+        (pattern.subtype  is None or pattern.subtype  == atom.subtype) and
+        (pattern.cause    is None or pattern.cause    is atom.cause) and
+        (pattern.source   is None or pattern.source   is atom.source)
+    )
+
+def _match_step_change(pattern: StepChangePattern, atom: StepChange) -> bool:
+    return (
+        (pattern.step   is None or pattern.step   is atom.step) and
+        (pattern.source is None or pattern.source is atom.source)
+    )
+
+def _match_state_delta(pattern: StateDeltaPattern, atom: StateDelta) -> bool:
+    return (
+        (pattern.target     is None or pattern.target     == atom.target) and
+        (pattern.set_mask   is None or (atom.set_mask & pattern.set_mask) == pattern.set_mask) and
+        (pattern.clear_mask is None or (atom.clear_mask & pattern.clear_mask) == pattern.clear_mask) and
+        (pattern.cause      is None or pattern.cause      is atom.cause) and
+        (pattern.source     is None or pattern.source     is atom.source)
+    )
+
+# (pattern type, atom type) -> matcher; any other pairing never matches
+_MATCHERS = {
+    (ZoneMovePattern, ZoneMove): _match_zone_move,
+    (ResourceDeltaPattern, ResourceDelta): _match_resource_delta,
+    (StepChangePattern, StepChange): _match_step_change,
+    (StateDeltaPattern, StateDelta): _match_state_delta,
+}
+
+def atom_matches(pattern: AtomPattern, atom: Atom) -> bool:
+    fn = _MATCHERS.get((type(pattern), type(atom)))
+    return False if fn is None else fn(pattern, atom)
 
-    return False
@@ -1,8 +1,14 @@
+from bisect import bisect_left, bisect_right
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
-from typing import List, Set, Optional, Tuple, Dict
-import pandas as pd
-import numpy as np
+from functools import lru_cache
+from itertools import chain
+from typing import TYPE_CHECKING, Callable, FrozenSet, List, Mapping, Set, Optional, Tuple, Dict
+import math
+import os
 import re
+import sys
+from types import MappingProxyType
 from enum import Enum, auto
 
 from card_atoms import (
@@ -14,7 +20,49 @@ from card_atoms import (
 from mtg_vocab import Source, Step, PermanentStatus, Zone, Cause, ObjKind
 
 # External constants (provided elsewhere in your project)
-from constants import THEME_KEYWORDS, KEYWORD_THEME_OVERRIDES, KEYWORD_GLOSSARY
+from constants import THEME_KEYWORDS, KEYWORD_THEME_OVERRIDES, KEYWORD_GLOSSARY, PHRASE_TO_THEMES
+
+# pandas is only needed by the DataFrame entry points below; importing it
+# lazily there keeps `import card_effects` cheap for text-only callers
+if TYPE_CHECKING:
+    import pandas as pd
+
+# THEME_KEYWORDS frozen into tuples for the theme scans below
+_THEME_PATTERNS: Tuple[Tuple[str, Tuple[str, ...]], ...] = tuple(
+    (theme, tuple(patterns)) for theme, patterns in THEME_KEYWORDS.items()
+)
+# flat (phrase, themes) pairs, each shared phrase listed once
+_PHRASE_THEMES: Tuple[Tuple[str, FrozenSet[str]], ...] = tuple(PHRASE_TO_THEMES.items())
+
+
+def _theme_tags_in(text: str) -> Set[str]:
+    """
+    Themes with at least one THEME_KEYWORDS pattern in (lowercased) text.
+    """
+    tags: Set[str] = set()
+    for phrase, themes in _PHRASE_THEMES:
+        if phrase in text:
+            tags |= themes
+    return tags
+
+
+def infer_theme_tags_bulk(texts: "pd.Series") -> "pd.Series":
+    """
+    Vectorized _theme_tags_in over a whole column of oracle texts.
+
+    One str.contains scan per theme instead of a Python-level substring loop
+    per card; returns a Series of tag sets aligned with texts.index.
+    """
+    import numpy as np
+    import pandas as pd
+
+    lowered = texts.fillna("").astype(str).str.lower()
+    tags: List[Set[str]] = [set() for _ in range(len(lowered))]
+    for theme, patterns in _THEME_PATTERNS:
+        mask = lowered.str.contains("|".join(map(re.escape, patterns)), regex=True).to_numpy(dtype=bool)
+        for pos in np.flatnonzero(mask):
+            tags[pos].add(theme)
+    return pd.Series(tags, index=texts.index, dtype=object)
 
 
 # ─────────────────────────────────────────────────────────
@@ -59,7 +107,7 @@ class Scope(Enum):
     ANY_PERMANENT  = auto()
     SELF = auto()
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ActionUnit:
     """
     Minimal grammatical unit extracted from an oracle clause.
@@ -84,7 +132,7 @@ class ActionUnit:
     kind: Optional[str]
     text_span: str
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EventTag:
     """
     Normalized event description used for synergy / combo analysis.
@@ -98,7 +146,7 @@ class EventTag:
         step_str = self.step.name if self.step else "-"
         return f"{self.kind.name}:{self.resource.name}:{self.scope.name}:{step_str}"
 
-@dataclass
+@dataclass(slots=True)
 class KeywordHit:
     """
     One occurrence of a rules keyword in a clause, plus a small window of context.
@@ -118,11 +166,35 @@ class KeywordHit:
         right = " ".join(self.right_words)
         return f"...{left} [{self.keyword}] {right}..."
 
-# Convenience helper for EventTags
-def ev(kind: EventKind, res: Resource, scope: Scope, step=None) -> EventTag:
-    return EventTag(kind, res, scope, step=step)
+# Convenience helper for EventTags. The (kind, resource, scope, step) space is
+# tiny, so tags are flyweights: every call with the same fields returns the
+# same EventTag instance.
+_EV_CACHE: Dict[Tuple[EventKind, Resource, Scope, Optional[Step]], EventTag] = {}
 
-@dataclass
+def ev(kind: EventKind, res: Resource, scope: Scope, step=None) -> EventTag:
+    key = (kind, res, scope, step)
+    tag = _EV_CACHE.get(key)
+    if tag is None:
+        tag = _EV_CACHE[key] = EventTag(kind, res, scope, step=step)
+        # an equal hand-built tag may already own a bit via tag_mask; keep it
+        _TAG_BITS.setdefault(tag, 1 << len(_TAG_BITS))
+    return tag
+
+# One bit per distinct EventTag, handed out when ev() interns it (or on first
+# sight in tag_mask for hand-built tags), so a tag set can be carried as an
+# int and "do these sets share a tag" is a single AND.
+_TAG_BITS: Dict[EventTag, int] = {}
+
+def tag_mask(tags: Set[EventTag]) -> int:
+    mask = 0
+    for t in tags:
+        bit = _TAG_BITS.get(t)
+        if bit is None:
+            bit = _TAG_BITS[t] = 1 << len(_TAG_BITS)
+        mask |= bit
+    return mask
+
+@dataclass(slots=True)
 class Effect:
     raw_text: str
     effect_type: str  # "triggered" | "activated" | "static" | "replacement"
@@ -163,17 +235,23 @@ class Effect:
     # Keyword + context hits from KEYWORD_GLOSSARY
     keyword_hits: List[KeywordHit] = field(default_factory=list)
 
-    def infer_theme_tags(self) -> Set[str]:
-        tags: Set[str] = set()
-        text = self.raw_text.lower()
+    # raw_text.lower() and the tag sets as tag_mask() ints, computed once at
+    # construction (the tag sets are not mutated afterwards)
+    _raw_lower: str = field(init=False, repr=False, compare=False)
+    _trigger_mask: int = field(init=False, repr=False, compare=False)
+    _cost_mask: int = field(init=False, repr=False, compare=False)
+    _result_mask: int = field(init=False, repr=False, compare=False)
 
-        for theme, patterns in THEME_KEYWORDS.items():
-            if any(pat in text for pat in patterns):
-                tags.add(theme)
+    def __post_init__(self):
+        self._raw_lower = self.raw_text.lower()
+        self._trigger_mask = tag_mask(self.trigger_tags)
+        self._cost_mask = tag_mask(self.cost_tags)
+        self._result_mask = tag_mask(self.result_tags)
 
-        return tags
+    def infer_theme_tags(self) -> Set[str]:
+        return _theme_tags_in(self._raw_lower)
 
-@dataclass
+@dataclass(slots=True)
 class Card:
     # Basic identity
     name: str
@@ -199,29 +277,43 @@ class Card:
     # Parsed effects
     effects: List[Effect] = field(default_factory=list)
 
+    # oracle_text.lower(), computed once at construction
+    _oracle_lower: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self._oracle_lower = (self.oracle_text or "").lower()
+
     # Convenience aggregations for synergy / flattening
     def all_trigger_tags(self) -> Set[EventTag]:
-        return {t for e in self.effects for t in e.trigger_tags}
+        return set(chain.from_iterable(e.trigger_tags for e in self.effects))
 
     def all_result_tags(self) -> Set[EventTag]:
-        return {t for e in self.effects for t in e.result_tags}
+        return set(chain.from_iterable(e.result_tags for e in self.effects))
 
     def all_cost_tags(self) -> Set[EventTag]:
-        return {t for e in self.effects for t in e.cost_tags}
+        return set(chain.from_iterable(e.cost_tags for e in self.effects))
 
     def all_actor_tags(self) -> Set[str]:
-        return {t for e in self.effects for t in e.actor_tags}
+        return set(chain.from_iterable(e.actor_tags for e in self.effects))
 
     def all_target_tags(self) -> Set[str]:
-        return {t for e in self.effects for t in e.target_tags}
+        return set(chain.from_iterable(e.target_tags for e in self.effects))
 
-    def infer_theme_tags(self) -> Set[str]:
-        tags: Set[str] = set()
-        text = (self.oracle_text or "").lower()
+    # The same unions as tag_mask() ints (see Effect._*_mask)
+    def trigger_mask(self) -> int:
+        mask = 0
+        for e in self.effects:
+            mask |= e._trigger_mask
+        return mask
+
+    def result_mask(self) -> int:
+        mask = 0
+        for e in self.effects:
+            mask |= e._result_mask
+        return mask
 
-        for theme, patterns in THEME_KEYWORDS.items():
-            if any(pat in text for pat in patterns):
-                tags.add(theme)
+    def infer_theme_tags(self) -> Set[str]:
+        tags = _theme_tags_in(self._oracle_lower)
 
         for kw in self.keywords or []:
             themes = KEYWORD_THEME_OVERRIDES.get(kw.lower())
@@ -237,27 +329,38 @@ class Card:
 
 
 # Lexicon for the micro-grammar
-VERB_LEXICON: Set[str] = {
+VERB_LEXICON: FrozenSet[str] = frozenset({
     "draw", "create", "gain", "lose", "deal", "destroy", "exile",
     "sacrifice", "return", "untap", "tap", "search", "reveal",
     "put", "mill", "copy", "add", "fight", "cast", "play",
     "scry", "proliferate", "remove", "counter",
-}
+})
 
-QUANTITY_WORDS: Set[str] = {
+QUANTITY_WORDS: FrozenSet[str] = frozenset({
     "a", "an", "one", "two", "three", "four", "five", "six",
     "x",
+})
+
+WORD_TO_INT: Dict[str, int] = {
+    "one": 1, "two": 2, "three": 3, "four": 4, "five": 5, "six": 6
 }
 
-OBJECT_WORDS: Set[str] = {
+OBJECT_WORDS: FrozenSet[str] = frozenset({
     "damage", "card", "cards", "token", "tokens", "life",
     "counter", "counters", "land", "lands", "creature", "creatures",
     "permanent", "permanents", "spell", "spells", "mana", "library",
-}
+})
 
-TARGET_MARKERS: Set[str] = {
+TARGET_MARKERS: FrozenSet[str] = frozenset({
     "target", "any", "each", "that", "those", "it", "this",
-}
+})
+
+# Intern every lexicon member so membership tests against interned tokens
+# (see extract_action_units) hit CPython's identity fast path before ==.
+VERB_LEXICON = frozenset(map(sys.intern, VERB_LEXICON))
+QUANTITY_WORDS = frozenset(map(sys.intern, QUANTITY_WORDS))
+OBJECT_WORDS = frozenset(map(sys.intern, OBJECT_WORDS))
+TARGET_MARKERS = frozenset(map(sys.intern, TARGET_MARKERS))
 
 # Canonical action labels used when mapping ActionUnits to EventTags
 ACTION_LIBRARY: Dict[Tuple[str, str], str] = {
@@ -300,6 +403,22 @@ ACTION_LIBRARY: Dict[Tuple[str, str], str] = {
     ("cast", "spell"):         "CAST_SPELL",
 }
 
+# read-only at runtime: keys and labels interned to match the interned tokens
+# coming out of extract_action_units
+ACTION_LIBRARY: Mapping[Tuple[str, str], str] = MappingProxyType({
+    (sys.intern(verb), sys.intern(obj)): sys.intern(kind)
+    for (verb, obj), kind in ACTION_LIBRARY.items()
+})
+
+# ACTION_LIBRARY plus the plural of every object ('cards' -> DRAW_CARD via
+# ('draw', 'card')), so extract_action_units needs a single lookup instead of
+# retrying with the singular. Listed keys win over derived plurals. Kept a
+# plain (private) dict so the hot lookup skips the proxy indirection.
+_ACTION_LIBRARY_FLAT: Dict[Tuple[str, str], str] = {
+    **{(verb, sys.intern(obj + "s")): kind for (verb, obj), kind in ACTION_LIBRARY.items()},
+    **ACTION_LIBRARY,
+}
+
 
 # ─────────────────────────────────────────────────────────
 # Effect parsing → EventTag sets
@@ -310,6 +429,9 @@ TRIGGER_PREFIX_RE = re.compile(
     re.IGNORECASE,
 )
 
+# sentence break inside a static / spell line
+_SENTENCE_SPLIT_RE = re.compile(r"\.\s+")
+
 
 def _split_abilities(oracle_text: str) -> List[str]:
     """
@@ -330,7 +452,7 @@ def _split_abilities(oracle_text: str) -> List[str]:
             abilities.append(line.strip())
         else:
             # Static / spell text → split on sentences
-            parts = re.split(r"\.\s+", line)
+            parts = _SENTENCE_SPLIT_RE.split(line)
             for p in parts:
                 p = p.strip()
                 if p:
@@ -369,53 +491,59 @@ def _split_cost_clause(text: str) -> Tuple[Optional[str], str]:
     return cost_part.strip(), result_part.strip()
 
 
-def _guess_effect_type(clause: str) -> str:
+# Cost-side words that mark "[cost]: [effect]" as an activated ability
+# ("untap" is covered by "tap")
+_ACTIVATED_COST_WORDS: Tuple[str, ...] = ("{", "sacrifice", "discard", "exile", "tap", "pay")
+
+
+def _guess_effect_type(clause: str, lower: Optional[str] = None) -> str:
     """
     Classify an ability into triggered / activated / static / replacement.
+
+    `lower` is clause.lower() when the caller already has it.
     """
-    cl = clause.lower()
+    cl = clause.lower() if lower is None else lower
 
     # Replacement effects: "If X would ..., instead ..."
     if cl.startswith("if ") and " would " in cl and " instead" in cl:
         return "replacement"
 
     # Triggered
-    if cl.startswith("whenever ") or cl.startswith("when ") or cl.startswith("at the beginning"):
+    if cl.startswith(("whenever ", "when ", "at the beginning")):
         return "triggered"
 
     # Activated: anything of the form "[cost stuff]: [effect]"
-    if ":" in clause:
-        left = clause.split(":", 1)[0].lower()
-        if (
-            "{" in left
-            or "sacrifice" in left
-            or "discard" in left
-            or "exile" in left
-            or "tap" in left
-            or "untap" in left
-            or "pay" in left
-        ):
+    if ":" in cl:
+        left = cl.split(":", 1)[0]
+        if any(map(left.__contains__, _ACTIVATED_COST_WORDS)):
             return "activated"
 
     return "static"
 
 
+# whitespace-separated runs, with ',', ':' and '.' split out as their own tokens
+_SIMPLE_TOKEN_RE = re.compile(r"[^\s.,:]+|[.,:]")
+
+
 def _simple_tokens(clause: str) -> List[str]:
     """
     Very simple whitespace/punctuation tokenizer suited to Oracle text.
     """
-    clause = clause.replace(",", " , ").replace(":", " : ").replace(".", " . ")
-    return [t for t in clause.split() if t]
+    return _SIMPLE_TOKEN_RE.findall(clause)
 
 
 def _tokenize_with_spans(text: str) -> List[Tuple[str, int, int]]:
     """
     Tokenize text into (token, start_index, end_index) tuples.
     """
-    tokens: List[Tuple[str, int, int]] = []
-    for m in WORD_TOKEN_RE.finditer(text):
-        tokens.append((m.group(0), m.start(), m.end()))
-    return tokens
+    return [(m.group(0), m.start(), m.end()) for m in WORD_TOKEN_RE.finditer(text)]
+
+
+# (keyword, lowered keyword, whole-word pattern), compiled once at import
+_KEYWORD_PATTERNS: List[Tuple[str, str, "re.Pattern[str]"]] = [
+    (kw, kw.lower(), re.compile(r"\b" + re.escape(kw.lower()) + r"\b"))
+    for kw in KEYWORD_GLOSSARY
+]
 
 
 def _extract_keyword_hits(clause: str) -> List[KeywordHit]:
@@ -427,21 +555,37 @@ def _extract_keyword_hits(clause: str) -> List[KeywordHit]:
     if not clause:
         return []
 
+    return [
+        KeywordHit(keyword=kw, left_words=list(left), right_words=list(right))
+        for kw, left, right in _keyword_hit_windows(clause)
+    ]
+
+
+# Reminder text and evergreen abilities repeat across thousands of cards, so
+# the scan is memoized per clause as immutable (keyword, left, right) tuples;
+# _extract_keyword_hits builds fresh KeywordHits from them on every call.
+@lru_cache(maxsize=100_000)
+def _keyword_hit_windows(clause: str) -> Tuple[Tuple[str, Tuple[str, ...], Tuple[str, ...]], ...]:
     lower = clause.lower()
-    tokens = _tokenize_with_spans(clause)
 
-    hits: List[KeywordHit] = []
+    # Tokens as parallel lists (text / start / end); a char index maps to its
+    # token by bisecting the start offsets.
+    token_text: List[str] = []
+    token_start: List[int] = []
+    token_end: List[int] = []
+    for m in WORD_TOKEN_RE.finditer(clause):
+        token_text.append(m.group(0))
+        token_start.append(m.start())
+        token_end.append(m.end())
+
+    hits: List[Tuple[str, Tuple[str, ...], Tuple[str, ...]]] = []
     seen: Set[Tuple[str, int, int]] = set()
 
-    # Map char index → token index
-    index_to_token: Dict[int, int] = {}
-    for i, (_, start, end) in enumerate(tokens):
-        for pos in range(start, end):
-            index_to_token[pos] = i
-
-    for kw in KEYWORD_GLOSSARY.keys():
-        kw_l = kw.lower()
-        pattern = re.compile(r"\b" + re.escape(kw_l) + r"\b")
+    for kw, kw_l, pattern in _KEYWORD_PATTERNS:
+        # a whole-word hit needs the substring first; most clauses contain
+        # only a handful of the glossary terms
+        if kw_l not in lower:
+            continue
         for m in pattern.finditer(lower):
             start, end = m.start(), m.end()
             key = (kw_l, start, end)
@@ -449,29 +593,30 @@ def _extract_keyword_hits(clause: str) -> List[KeywordHit]:
                 continue
             seen.add(key)
 
-            token_idx = index_to_token.get(start)
-            if token_idx is None:
+            token_idx = bisect_right(token_start, start) - 1
+            if token_idx < 0 or start >= token_end[token_idx]:
                 continue
 
             left_start = max(0, token_idx - 2)
-            right_end = min(len(tokens), token_idx + 1 + 3)
 
-            left_words  = [tokens[i][0] for i in range(left_start, token_idx)]
-            right_words = [tokens[i][0] for i in range(token_idx + 1, right_end)]
+            left_words  = tuple(token_text[left_start:token_idx])
+            right_words = tuple(token_text[token_idx + 1:token_idx + 1 + 3])
 
-            hits.append(KeywordHit(
-                keyword=kw,
-                left_words=left_words,
-                right_words=right_words,
-            ))
+            hits.append((kw, left_words, right_words))
 
-    return hits
+    return tuple(hits)
 
 
 WORD_TOKEN_RE = re.compile(r"\w+|\S", re.UNICODE)
 _MTG_SYMBOL_RE = re.compile(r"\{([^}]+)\}")
-
-def _mana_gain_from_add_clause(text: str) -> tuple[int, str] | None:
+# tap / untap / energy symbols, in either case: never mana
+_NON_MANA_SYMBOLS: FrozenSet[str] = frozenset({"T", "Q", "E", "t", "q", "e"})
+_OR_SPLIT_RE = re.compile(r"\s+or\s+", re.IGNORECASE)
+_PAY_LIFE_RE = re.compile(r"pay\s+(\d+)\s+life")
+_UNTAP_RE = re.compile(r"\buntap\b")
+_TAP_RE = re.compile(r"\btap\b")
+
+def _mana_gain_from_add_clause(text: str, lower: Optional[str] = None) -> tuple[int, str] | None:
     """
     Best-effort mana parsing for results like:
       - "Add {G}{G}."
@@ -482,19 +627,20 @@ def _mana_gain_from_add_clause(text: str) -> tuple[int, str] | None:
     if not text:
         return None
 
-    lower = text.lower()
+    if lower is None:
+        lower = text.lower()
     if " add " not in lower or "{" not in text:
         return None
 
     # Split on " or " to detect choice clauses
-    parts = re.split(r"\s+or\s+", text, flags=re.IGNORECASE)
+    parts = _OR_SPLIT_RE.split(text)
 
     option_amts: list[int] = []
     option_subs: list[str] = []
 
     for part in parts:
         syms = _mana_symbols(part)
-        mana_syms = [s for s in syms if s.upper() not in ("T", "Q", "E")]
+        mana_syms = [s for s in syms if s not in _NON_MANA_SYMBOLS]
         if not mana_syms:
             continue
         option_amts.append(_mana_cost_from_symbols(mana_syms))
@@ -510,14 +656,17 @@ def _mana_gain_from_add_clause(text: str) -> tuple[int, str] | None:
 def _infer_actor_tags(cl: str) -> Set[str]:
     actor_tags: Set[str] = set()
 
-    if cl.startswith("you ") or " you " in cl or " your " in cl:
+    # most clauses name no player at all; one shared-word probe per group
+    # skips its phrase checks
+    if "you" in cl and (cl.startswith("you ") or " you " in cl or " your " in cl):
         actor_tags.add("YOU")
-    if "each opponent" in cl:
-        actor_tags.add("EACH_OPPONENT")
+    if "opponent" in cl:
+        if "each opponent" in cl:
+            actor_tags.add("EACH_OPPONENT")
+        if "target opponent" in cl or "an opponent" in cl:
+            actor_tags.add("OPPONENT")
     if "each player" in cl:
         actor_tags.add("EACH_PLAYER")
-    if "target opponent" in cl or "an opponent" in cl:
-        actor_tags.add("OPPONENT")
 
     return actor_tags
 
@@ -525,34 +674,93 @@ def _infer_actor_tags(cl: str) -> Set[str]:
 def _infer_target_tags(cl: str) -> Set[str]:
     target_tags: Set[str] = set()
 
-    if "another target creature you control" in cl:
-        target_tags.add("ANOTHER_CREATURE_YOU_CONTROL")
-    elif "creature you control" in cl:
-        target_tags.add("CREATURE_YOU_CONTROL")
+    # same shared-word gating as _infer_actor_tags
+    if " you control" in cl:
+        if "another target creature you control" in cl:
+            target_tags.add("ANOTHER_CREATURE_YOU_CONTROL")
+        elif "creature you control" in cl:
+            target_tags.add("CREATURE_YOU_CONTROL")
 
-    if "token you control" in cl or "tokens you control" in cl:
-        target_tags.add("TOKEN_YOU_CONTROL")
+        if "token you control" in cl or "tokens you control" in cl:
+            target_tags.add("TOKEN_YOU_CONTROL")
 
-    if "target creature or enchantment you control" in cl:
-        target_tags.add("CREATURE_OR_ENCHANTMENT_YOU_CONTROL")
+        if "target creature or enchantment you control" in cl:
+            target_tags.add("CREATURE_OR_ENCHANTMENT_YOU_CONTROL")
 
-    if "any target" in cl:
-        target_tags.add("ANY_TARGET")
-    elif "target creature" in cl:
-        target_tags.add("ANY_CREATURE")
+    if "target" in cl:
+        if "any target" in cl:
+            target_tags.add("ANY_TARGET")
+        elif "target creature" in cl:
+            target_tags.add("ANY_CREATURE")
 
-    if "target player" in cl:
-        target_tags.add("ANY_PLAYER")
+        if "target player" in cl:
+            target_tags.add("ANY_PLAYER")
 
     return target_tags
 
 
-def _parse_result_atoms(result_text: str, card_name: Optional[str] = None) -> list[Atom]:
+# ActionUnit.kind -> atoms for that result. Each handler takes
+# (act, lowered result text, atoms) and appends to atoms.
+
+def _h_draw_card(act: ActionUnit, cl: str, atoms: list[Atom]) -> None:
+    n = act.quantity or 1
+    for _ in range(n):
+        atoms.append(ZoneMove(Zone.LIBRARY, Zone.HAND, ObjKind.CARD, controller="YOU", cause=Cause.EFFECT, source=Source.CARD))
+
+def _h_create_token(act: ActionUnit, cl: str, atoms: list[Atom]) -> None:
+    n = act.quantity or 1
+    for _ in range(n):
+        atoms.append(ZoneMove(Zone.COMMAND, Zone.BATTLEFIELD, ObjKind.TOKEN, controller="YOU", cause=Cause.EFFECT, source=Source.CARD))
+
+def _h_gain_life(act: ActionUnit, cl: str, atoms: list[Atom]) -> None:
+    atoms.append(ResourceDelta(resource="life", delta=act.quantity or 1, target="YOU", cause=Cause.EFFECT, source=Source.CARD))
+
+def _h_lose_life(act: ActionUnit, cl: str, atoms: list[Atom]) -> None:
+    tgt = "OPPONENT" if "opponent" in cl else "YOU"
+    atoms.append(ResourceDelta(resource="life", delta=-(act.quantity or 1), target=tgt, cause=Cause.EFFECT, source=Source.CARD))
+
+def _h_deal_damage(act: ActionUnit, cl: str, atoms: list[Atom]) -> None:
+    atoms.append(ResourceDelta(resource="damage", delta=act.quantity or 1, target=act.target or "ANY", cause=Cause.EFFECT, source=Source.CARD))
+
+def _h_add_counter(act: ActionUnit, cl: str, atoms: list[Atom]) -> None:
+    subtype = "+1/+1" if "+1/+1" in cl else None
+    atoms.append(ResourceDelta(resource="counter", delta=act.quantity or 1, target="SELF", subtype=subtype, cause=Cause.EFFECT, source=Source.CARD))
+
+def _h_remove_counter(act: ActionUnit, cl: str, atoms: list[Atom]) -> None:
+    subtype = "+1/+1" if "+1/+1" in cl else None
+    atoms.append(ResourceDelta(resource="counter", delta=-(act.quantity or 1), target="SELF", subtype=subtype, cause=Cause.EFFECT, source=Source.CARD))
+
+def _h_add_mana(act: ActionUnit, cl: str, atoms: list[Atom]) -> None:
+    atoms.append(ResourceDelta(
+        resource="mana",
+        delta=act.quantity or 1,
+        target="YOU",
+        cause=Cause.EFFECT,
+        source=Source.CARD
+    ))
+
+_RESULT_HANDLERS: Dict[str, Callable[[ActionUnit, str, list[Atom]], None]] = {
+    "DRAW_CARD":      _h_draw_card,
+    "CREATE_TOKEN":   _h_create_token,
+    "GAIN_LIFE":      _h_gain_life,
+    "LOSE_LIFE":      _h_lose_life,
+    "DEAL_DAMAGE":    _h_deal_damage,
+    "ADD_COUNTER":    _h_add_counter,
+    "REMOVE_COUNTER": _h_remove_counter,
+    "ADD_MANA":       _h_add_mana,
+}
+
+
+def _parse_result_atoms(
+    result_text: str,
+    card_name: Optional[str] = None,
+    lower: Optional[str] = None,
+) -> list[Atom]:
     atoms: list[Atom] = []
-    cl = (result_text or "").lower()
+    cl = (result_text or "").lower() if lower is None else lower
 
     # Mana production: "Add {G}{G}" / "Add {G} or {U}"
-    mg = _mana_gain_from_add_clause(result_text or "")
+    mg = _mana_gain_from_add_clause(result_text or "", cl)
     if mg:
         mana_amt, subtype = mg
         atoms.append(ResourceDelta(
@@ -568,47 +776,17 @@ def _parse_result_atoms(result_text: str, card_name: Optional[str] = None) -> li
     units = extract_action_units(result_text or "", card_name)
 
     for act in units:
-        if act.kind == "DRAW_CARD":
-            n = act.quantity or 1
-            for _ in range(n):
-                atoms.append(ZoneMove(Zone.LIBRARY, Zone.HAND, ObjKind.CARD, controller="YOU", cause=Cause.EFFECT, source=Source.CARD))
-
-        elif act.kind == "CREATE_TOKEN":
-            n = act.quantity or 1
-            for _ in range(n):
-                atoms.append(ZoneMove(Zone.COMMAND, Zone.BATTLEFIELD, ObjKind.TOKEN, controller="YOU", cause=Cause.EFFECT, source=Source.CARD))
-
-        elif act.kind == "GAIN_LIFE":
-            atoms.append(ResourceDelta(resource="life", delta=act.quantity or 1, target="YOU", cause=Cause.EFFECT, source=Source.CARD))
-
-        elif act.kind == "LOSE_LIFE":
-            tgt = "OPPONENT" if "opponent" in cl else "YOU"
-            atoms.append(ResourceDelta(resource="life", delta=-(act.quantity or 1), target=tgt, cause=Cause.EFFECT, source=Source.CARD))
-
-        elif act.kind == "DEAL_DAMAGE":
-            atoms.append(ResourceDelta(resource="damage", delta=act.quantity or 1, target=act.target or "ANY", cause=Cause.EFFECT, source=Source.CARD))
-
-        elif act.kind == "ADD_COUNTER":
-            subtype = "+1/+1" if "+1/+1" in cl else None
-            atoms.append(ResourceDelta(resource="counter", delta=act.quantity or 1, target="SELF", subtype=subtype, cause=Cause.EFFECT, source=Source.CARD))
-
-        elif act.kind == "REMOVE_COUNTER":
-            subtype = "+1/+1" if "+1/+1" in cl else None
-            atoms.append(ResourceDelta(resource="counter", delta=-(act.quantity or 1), target="SELF", subtype=subtype, cause=Cause.EFFECT, source=Source.CARD))
-        elif act.kind == "ADD_MANA":
-            atoms.append(ResourceDelta(
-                resource="mana",
-                delta=act.quantity or 1,
-                target="YOU",
-                cause=Cause.EFFECT,
-                source=Source.CARD
-            ))
-
-    # Tap/untap as EFFECTS
-    if re.search(r"\buntap\b", cl):
-        atoms.append(untap_atom(target="TARGET", cause=Cause.EFFECT, source=Source.CARD))
-    if re.search(r"\btap\b", cl):
-        atoms.append(tap_atom(target="TARGET", cause=Cause.EFFECT, source=Source.CARD))
+        handler = _RESULT_HANDLERS.get(act.kind)
+        if handler is not None:
+            handler(act, cl, atoms)
+
+    # Tap/untap as EFFECTS (both words contain "tap", so most clauses skip
+    # the word-boundary searches entirely)
+    if "tap" in cl:
+        if _UNTAP_RE.search(cl):
+            atoms.append(untap_atom(target="TARGET", cause=Cause.EFFECT, source=Source.CARD))
+        if _TAP_RE.search(cl):
+            atoms.append(tap_atom(target="TARGET", cause=Cause.EFFECT, source=Source.CARD))
 
     return atoms
 
@@ -617,28 +795,67 @@ def _parse_result_atoms(result_text: str, card_name: Optional[str] = None) -> li
 # ─────────────────────────────────────────────────────────
 
 
-def extract_action_units(clause: str, card_name: Optional[str] = None) -> List[ActionUnit]:
+# target phrases recognised at a TARGET_MARKERS token
+_TARGET_PHRASE_RE = re.compile(r"any target|target (?:creature|opponent|player)|each (?:opponent|player)")
+
+
+def extract_action_units(clause: str, card_name: Optional[str] = None) -> Tuple[ActionUnit, ...]:
     """
-    Extract a list of ActionUnit from a single clause.
+    Extract the ActionUnits from a single clause.
 
     This is deliberately dumb-but-regular: it focuses on verbs, quantities,
     and nearby objects / targets, using ACTION_LIBRARY to label common kinds.
+
+    card_name only matters for the "from <name>" self-reference, so it is
+    resolved here and the parse itself is memoized on (clause, that flag):
+    the result text parsed for an Effect's actions (with its card name) and
+    for its atoms (without) shares one entry unless the clause names the
+    card, and boilerplate clauses are shared across cards. Returns a tuple of
+    frozen ActionUnits so cached results can't be mutated by callers.
     """
+    from_card_name = False
+    if card_name:
+        lc = clause.lower()
+        from_card_name = "from " in lc and f"from {card_name.lower()}" in lc
+    return _action_units(clause, from_card_name)
+
+
+@lru_cache(maxsize=100_000)
+def _action_units(clause: str, from_card_name: bool) -> Tuple[ActionUnit, ...]:
     toks = _simple_tokens(clause)
     n = len(toks)
     i = 0
     results: List[ActionUnit] = []
 
+    # every token is lowered (and interned, to match the lexicons by
+    # identity) once up front, not per window it falls in
+    lower_toks = [sys.intern(t.lower()) for t in toks]
+
     lc = clause.lower()
-    name_l = (card_name or "").lower()
-    
-    WORD_TO_INT = {
-        "one": 1, "two": 2, "three": 3, "four": 4, "five": 5, "six": 6
-    }
-    
+    # clause-level fact behind the implied 'gain/lose' -> life object
+    mentions_life = "life" in lc
+
+    # Self references (this card / this creature / it) depend only on the
+    # clause, not on which verb we're at. ("from this creature" is covered by
+    # "this creature"; "from <card name>" was resolved by the caller.)
+    self_target: Optional[str] = None
+    if "this creature" in lc or from_card_name or ("from " in lc and "from it" in lc):
+        self_target = "self"
+
+    # Otherwise a verb's target comes from the first TARGET_MARKERS token after
+    # its object window. Resolve each marker's phrase once per clause; the
+    # verb loop then just bisects for the next marker.
+    marker_pos: List[int] = []
+    marker_target: List[Optional[str]] = []
+    if self_target is None:
+        for t_idx, t in enumerate(lower_toks):
+            if t in TARGET_MARKERS:
+                m = _TARGET_PHRASE_RE.match(" ".join(lower_toks[t_idx:t_idx + 4]))
+                marker_pos.append(t_idx)
+                marker_target.append(m.group(0) if m else None)
+
     while i < n:
-        raw = toks[i]
-        tok = raw.lower()
+        tok = lower_toks[i]
 
         if tok not in VERB_LEXICON:
             i += 1
@@ -650,7 +867,7 @@ def extract_action_units(clause: str, card_name: Optional[str] = None) -> List[A
         # 1) Quantity (simple integers or 'a', 'an', 'one', 'two', ..., 'x')
         quantity: Optional[int] = None
         if j < n:
-            qtok = toks[j].lower()
+            qtok = lower_toks[j]
             if qtok.isdigit():
                 quantity = int(qtok)
                 j += 1
@@ -665,7 +882,7 @@ def extract_action_units(clause: str, card_name: Optional[str] = None) -> List[A
         obj: Optional[str] = None
         k = j
         while k < min(n, j + 5) and obj is None:
-            otok = toks[k].lower()
+            otok = lower_toks[k]
             if otok in OBJECT_WORDS:
                 obj = otok
             k += 1
@@ -674,52 +891,23 @@ def extract_action_units(clause: str, card_name: Optional[str] = None) -> List[A
         if obj is None:
             if verb == "deal":
                 obj = "damage"
-            elif verb in {"gain", "lose"} and "life" in lc:
+            elif mentions_life and verb in {"gain", "lose"}:
                 obj = "life"
             elif verb == "draw":
                 obj = "card"
 
         # 3) Target
-        target: Optional[str] = None
-
-        # Self references (this card / this creature / it)
-        if name_l and f"from {name_l}" in lc:
-            target = "self"
-        elif "from this creature" in lc or "from it" in lc or "this creature" in lc:
-            target = "self"
+        target: Optional[str] = self_target
 
         if target is None:
-            t_idx = k
-            while t_idx < n:
-                t = toks[t_idx].lower()
-                if t in TARGET_MARKERS:
-                    window = " ".join(toks[t_idx:t_idx + 4]).lower()
-                    if window.startswith("any target"):
-                        target = "any target"
-                    elif window.startswith("target creature"):
-                        target = "target creature"
-                    elif window.startswith("target opponent"):
-                        target = "target opponent"
-                    elif window.startswith("target player"):
-                        target = "target player"
-                    elif window.startswith("each opponent"):
-                        target = "each opponent"
-                    elif window.startswith("each player"):
-                        target = "each player"
-                    break
-                t_idx += 1
+            p = bisect_left(marker_pos, k)
+            if p < len(marker_pos):
+                target = marker_target[p]
 
         # 4) Canonical action kind
         kind: Optional[str] = None
         if obj is not None:
-            key = (verb, obj)
-            if key in ACTION_LIBRARY:
-                kind = ACTION_LIBRARY[key]
-            else:
-                # Try singular form fallback ('cards' -> 'card')
-                singular = obj[:-1] if obj.endswith("s") else obj
-                key2 = (verb, singular)
-                kind = ACTION_LIBRARY.get(key2)
+            kind = _ACTION_LIBRARY_FLAT.get((verb, obj))
 
         # If we have neither object nor kind, this is probably noise; skip
         if obj is None and kind is None:
@@ -739,12 +927,25 @@ def extract_action_units(clause: str, card_name: Optional[str] = None) -> List[A
 
         i += 1
 
-    return results
+    return tuple(results)
+
+
+@lru_cache(maxsize=4096)
+def _svo_pattern(subjects: Tuple[str, ...], verb_root: str, obj_word: str) -> "re.Pattern[str]":
+    # Allow multi-word subjects (e.g. 'each opponent') across any whitespace
+    # run, and several subjects as one alternation
+    subj = "|".join(r"\s+".join(map(re.escape, s.lower().split())) for s in subjects)
+    verb = re.escape(verb_root.lower())
+    obj  = re.escape(obj_word.lower())
+
+    # subject ... verbFamily ... obj; matched case-insensitively on the raw
+    # text instead of re-lowering and re-joining it per call
+    return re.compile(rf"\b(?:{subj})\b[^\.]*\b{verb}\w*\b[^\.]*\b{obj}\b", re.IGNORECASE)
 
 
 def _subject_verb_object(
     text: str,
-    subject: str,
+    subject: str | Tuple[str, ...],
     verb_root: str,
     obj_word: str,
 ) -> bool:
@@ -753,23 +954,15 @@ def _subject_verb_object(
       'you gain life'
       'target opponent loses 3 life'
       'each opponent is dealt 1 damage'
-    - subject: 'you', 'opponent', 'each opponent', 'target opponent', etc.
+    - subject: 'you', 'opponent', 'each opponent', 'target opponent', etc.,
+      or a tuple of them (one search covers every variant)
     - verb_root: base family 'gain', 'lose', 'deal', 'draw', 'sacrifice'
     - obj_word: 'life', 'damage', 'card', 'creature', etc.
 
     It matches any inflection of the verb (gain, gains, gained, gaining).
     """
-    # Normalize whitespace
-    t = " ".join(text.lower().split())
-
-    # Allow multi-word subjects (e.g. 'each opponent')
-    subj = re.escape(subject.lower())
-    verb = re.escape(verb_root.lower())
-    obj  = re.escape(obj_word.lower())
-
-    # subject ... verbFamily ... obj
-    pattern = rf"\b{subj}\b[^\.]*\b{verb}\w*\b[^\.]*\b{obj}\b"
-    return re.search(pattern, t) is not None
+    subjects = (subject,) if isinstance(subject, str) else tuple(subject)
+    return _svo_pattern(subjects, verb_root, obj_word).search(text) is not None
 
 #─────────────────────────────────────────────────────────
 #Atom Parsers
@@ -778,36 +971,55 @@ def _mana_symbols(text: str) -> list[str]:
     return _MTG_SYMBOL_RE.findall(text or "")
 
 
+# Mana value of the common symbol spellings, in both cases. T/Q aren't mana,
+# and variable costs (X/Y/Z) count as 0 for now (or 1 if you prefer).
+_MANA_SYMBOL_VALUE: Dict[str, int] = {
+    **{s: 0 for s in ("T", "Q", "X", "Y", "Z")},
+    **{s: 1 for s in ("W", "U", "B", "R", "G", "C", "S")},
+}
+_MANA_SYMBOL_VALUE.update({k.lower(): v for k, v in _MANA_SYMBOL_VALUE.items()})
+_MANA_SYMBOL_VALUE.update({str(i): i for i in range(21)})
+
+
 def _mana_cost_from_symbols(symbols: list[str]) -> int:
     total = 0
     for s in symbols:
-        u = s.upper().strip()
-        if u in ("T", "Q"):
-            continue
-        if u.isdigit():
-            total += int(u)
-        elif u in ("X", "Y", "Z"):
-            # Variable costs: treat as 0 for now (or 1 if you prefer)
-            total += 0
-        else:
-            # W/U/B/R/G, hybrid, phyrexian, snow, etc.
-            total += 1
+        v = _MANA_SYMBOL_VALUE.get(s)
+        if v is None:
+            u = s.upper().strip()
+            if u.isdigit():
+                v = int(u)
+            else:
+                # W/U/B/R/G, hybrid, phyrexian, snow, etc.
+                v = _MANA_SYMBOL_VALUE.get(u, 1)
+        total += v
     return total
 
 
-def _parse_cost_atoms(cost_text: str) -> list[Atom]:
+# Every word the cost parsers branch on, found in one scan. None of these
+# overlap each other in real text, so a non-overlapping findall sees the
+# same words as separate `in` tests would.
+_COST_HOT_RE = re.compile(r"\{t\}|\{q\}|sacrifice|discard|pay|life|remove|counter|\+1/\+1")
+
+
+def _cost_hot_words(cl: str) -> Set[str]:
+    return set(_COST_HOT_RE.findall(cl))
+
+
+def _parse_cost_atoms(cost_text: str, lower: Optional[str] = None) -> list[Atom]:
     atoms: list[Atom] = []
-    cl = (cost_text or "").lower()
+    cl = (cost_text or "").lower() if lower is None else lower
+    hot = _cost_hot_words(cl)
 
     # Tap/untap symbols (state change, NOT mana)
-    if "{t}" in cl:
+    if "{t}" in hot:
         atoms.append(tap_atom(target="SELF", cause=Cause.COST, source=Source.CARD))
-    if "{q}" in cl:
+    if "{q}" in hot:
         atoms.append(untap_atom(target="SELF", cause=Cause.COST, source=Source.CARD))
 
     # Mana payment (coarse: count symbols excluding T/Q)
     syms = _mana_symbols(cost_text)
-    mana_syms = [s for s in syms if s.upper() not in ("T", "Q", "E")]
+    mana_syms = [s for s in syms if s not in _NON_MANA_SYMBOLS]
     mana_cost = _mana_cost_from_symbols(mana_syms)
     if mana_cost:
         atoms.append(ResourceDelta(
@@ -819,7 +1031,7 @@ def _parse_cost_atoms(cost_text: str) -> list[Atom]:
         ))
 
     # Sacrifice cost → battlefield to graveyard
-    if "sacrifice" in cl:
+    if "sacrifice" in hot:
         atoms.append(ZoneMove(
             from_zone=Zone.BATTLEFIELD,
             to_zone=Zone.GRAVEYARD,
@@ -829,8 +1041,8 @@ def _parse_cost_atoms(cost_text: str) -> list[Atom]:
             source=Source.CARD
         ))
 
-    # Discard cost
-    if "discard" in cl and "card" in cl:
+    # Discard cost ("discard" always contains "card")
+    if "discard" in hot:
         atoms.append(ZoneMove(
             from_zone=Zone.HAND,
             to_zone=Zone.GRAVEYARD,
@@ -841,32 +1053,33 @@ def _parse_cost_atoms(cost_text: str) -> list[Atom]:
         ))
 
     # Pay life cost (keep coarse)
-    if "pay" in cl and "life" in cl:
-        m = re.search(r"pay\s+(\d+)\s+life", cl)
+    if "pay" in hot and "life" in hot:
+        m = _PAY_LIFE_RE.search(cl)
         n = int(m.group(1)) if m else 1
         atoms.append(ResourceDelta(resource="life", delta=-n, target="YOU", cause=Cause.COST, source=Source.CARD))
 
     # Remove counters as cost (coarse)
-    if "remove" in cl and "counter" in cl:
-        subtype = "+1/+1" if "+1/+1" in cl else None
+    if "remove" in hot and "counter" in hot:
+        subtype = "+1/+1" if "+1/+1" in hot else None
         atoms.append(ResourceDelta(resource="counter", delta=-1, target="SELF", subtype=subtype, cause=Cause.COST, source=Source.CARD))
 
     return atoms
 
 
-def _parse_trigger_atoms(cost_text: str) -> list[Atom]:
+def _parse_trigger_atoms(cost_text: str, lower: Optional[str] = None) -> list[Atom]:
     atoms: list[Atom] = []
-    cl = (cost_text or "").lower()
+    cl = (cost_text or "").lower() if lower is None else lower
+    hot = _cost_hot_words(cl)
 
     # Tap/untap symbols (state change, NOT mana)
-    if "{t}" in cl:
+    if "{t}" in hot:
         atoms.append(tap_atom(target="SELF", cause=Cause.COST, source=Source.CARD))
-    if "{q}" in cl:
+    if "{q}" in hot:
         atoms.append(untap_atom(target="SELF", cause=Cause.COST, source=Source.CARD))
 
     # Mana payment (coarse: count symbols excluding T/Q)
     syms = _mana_symbols(cost_text)
-    mana_syms = [s for s in syms if s.upper() not in ("T", "Q", "E")]
+    mana_syms = [s for s in syms if s not in _NON_MANA_SYMBOLS]
     mana_cost = _mana_cost_from_symbols(mana_syms)
     if mana_cost:
         atoms.append(ResourceDelta(
@@ -878,7 +1091,7 @@ def _parse_trigger_atoms(cost_text: str) -> list[Atom]:
         ))
 
     # Sacrifice cost → battlefield to graveyard
-    if "sacrifice" in cl:
+    if "sacrifice" in hot:
         atoms.append(ZoneMove(
             from_zone=Zone.BATTLEFIELD,
             to_zone=Zone.GRAVEYARD,
@@ -888,8 +1101,8 @@ def _parse_trigger_atoms(cost_text: str) -> list[Atom]:
             source=Source.CARD
         ))
 
-    # Discard cost
-    if "discard" in cl and "card" in cl:
+    # Discard cost ("discard" always contains "card")
+    if "discard" in hot:
         atoms.append(ZoneMove(
             from_zone=Zone.HAND,
             to_zone=Zone.GRAVEYARD,
@@ -900,56 +1113,126 @@ def _parse_trigger_atoms(cost_text: str) -> list[Atom]:
         ))
 
     # Pay life cost (keep coarse)
-    if "pay" in cl and "life" in cl:
-        m = re.search(r"pay\s+(\d+)\s+life", cl)
+    if "pay" in hot and "life" in hot:
+        m = _PAY_LIFE_RE.search(cl)
         n = int(m.group(1)) if m else 1
         atoms.append(ResourceDelta(resource="life", delta=-n, target="YOU", cause=Cause.COST, source=Source.CARD))
 
     # Remove counters as cost (coarse)
-    if "remove" in cl and "counter" in cl:
-        subtype = "+1/+1" if "+1/+1" in cl else None
+    if "remove" in hot and "counter" in hot:
+        subtype = "+1/+1" if "+1/+1" in hot else None
         atoms.append(ResourceDelta(resource="counter", delta=-1, target="SELF", subtype=subtype, cause=Cause.COST, source=Source.CARD))
 
     return atoms
 
-def tags_from_atoms(atoms: list[Atom]) -> set[EventTag]:
-    tags: set[EventTag] = set()
+# ZoneMove objects that count as bodies on the battlefield
+_BODY_OBJS: FrozenSet[ObjKind] = frozenset({ObjKind.TOKEN, ObjKind.PERMANENT})
+
+# Every tag tags_from_atoms can emit, interned once at import and picked by
+# table lookup instead of an ev() call per atom.
+_TAG_DRAW_CARD = ev(EventKind.DRAW, Resource.CARD, Scope.YOU)
+
+# (obj, controlled by YOU) -> ENTERS tag
+_TAG_ENTERS: Dict[Tuple[ObjKind, bool], EventTag] = {
+    (obj, mine): ev(
+        EventKind.ENTERS,
+        Resource.TOKEN if obj == ObjKind.TOKEN else Resource.PERMANENT,
+        Scope.YOUR_PERMANENT if mine else Scope.ANY_PERMANENT,
+    )
+    for obj in (ObjKind.TOKEN, ObjKind.PERMANENT)
+    for mine in (True, False)
+}
+
+# controlled by YOU -> DIES tag
+_TAG_DIES: Dict[bool, EventTag] = {
+    True: ev(EventKind.DIES, Resource.PERMANENT, Scope.YOUR_PERMANENT),
+    False: ev(EventKind.DIES, Resource.PERMANENT, Scope.ANY_PERMANENT),
+}
+
+# (ResourceDelta.resource, delta > 0) -> tag
+_TAG_RESOURCE_DELTA: Dict[Tuple[str, bool], EventTag] = {
+    ("mana", True):     ev(EventKind.ADD,  Resource.MANA,    Scope.YOU),
+    ("mana", False):    ev(EventKind.LOSE, Resource.MANA,    Scope.YOU),
+    ("life", True):     ev(EventKind.GAIN, Resource.LIFE,    Scope.YOU),
+    ("life", False):    ev(EventKind.LOSE, Resource.LIFE,    Scope.YOU),
+    ("counter", True):  ev(EventKind.ADD,  Resource.COUNTER, Scope.YOUR_PERMANENT),
+    ("counter", False): ev(EventKind.LOSE, Resource.COUNTER, Scope.YOUR_PERMANENT),
+    ("damage", True):   ev(EventKind.DEAL, Resource.DAMAGE,  Scope.ANY_PLAYER),
+    ("damage", False):  ev(EventKind.DEAL, Resource.DAMAGE,  Scope.ANY_PLAYER),
+}
+
+
+def tags_from_atoms(atoms: list[Atom], out: Optional[Set[EventTag]] = None) -> set[EventTag]:
+    """
+    EventTags implied by atoms, added into `out` when given (so callers can
+    fill an Effect's tag set directly) and returned.
+    """
+    tags: set[EventTag] = set() if out is None else out
 
     for a in atoms:
         if isinstance(a, ZoneMove):
+            # The three moves are told apart by destination, so branch on
+            # it once instead of re-testing zones in three independent ifs
+            to_zone = a.to_zone
+
             # Draw: library -> hand (YOU)
-            if a.from_zone == Zone.LIBRARY and a.to_zone == Zone.HAND and a.obj == ObjKind.CARD:
-                tags.add(ev(EventKind.DRAW, Resource.CARD, Scope.YOU))
+            if to_zone == Zone.HAND:
+                if a.from_zone == Zone.LIBRARY and a.obj == ObjKind.CARD:
+                    tags.add(_TAG_DRAW_CARD)
 
             # Tokens/permanents entering battlefield under you
-            if a.to_zone == Zone.BATTLEFIELD and a.obj in {ObjKind.TOKEN, ObjKind.PERMANENT}:
-                sc = Scope.YOUR_PERMANENT if (a.controller == "YOU") else Scope.ANY_PERMANENT
-                res = Resource.TOKEN if a.obj == ObjKind.TOKEN else Resource.PERMANENT
-                tags.add(ev(EventKind.ENTERS, res, sc))
+            elif to_zone == Zone.BATTLEFIELD:
+                if a.obj in _BODY_OBJS:
+                    tags.add(_TAG_ENTERS[(a.obj, a.controller == "YOU")])
 
             # Dies: battlefield -> graveyard
-            if a.from_zone == Zone.BATTLEFIELD and a.to_zone == Zone.GRAVEYARD and a.obj in {ObjKind.PERMANENT, ObjKind.TOKEN}:
-                sc = Scope.YOUR_PERMANENT if (a.controller == "YOU") else Scope.ANY_PERMANENT
-                tags.add(ev(EventKind.DIES, Resource.PERMANENT, sc))
+            elif to_zone == Zone.GRAVEYARD:
+                if a.from_zone == Zone.BATTLEFIELD and a.obj in _BODY_OBJS:
+                    tags.add(_TAG_DIES[a.controller == "YOU"])
 
         elif isinstance(a, ResourceDelta):
-            if a.resource == "mana":
-                tags.add(ev(EventKind.ADD if a.delta > 0 else EventKind.LOSE, Resource.MANA, Scope.YOU))
-            elif a.resource == "life":
-                tags.add(ev(EventKind.GAIN if a.delta > 0 else EventKind.LOSE, Resource.LIFE, Scope.YOU))
-            elif a.resource == "counter":
-                tags.add(ev(EventKind.ADD if a.delta > 0 else EventKind.LOSE, Resource.COUNTER, Scope.YOUR_PERMANENT))
-            elif a.resource == "damage":
-                tags.add(ev(EventKind.DEAL, Resource.DAMAGE, Scope.ANY_PLAYER))
+            tag = _TAG_RESOURCE_DELTA.get((a.resource, a.delta > 0))
+            if tag is not None:
+                tags.add(tag)
 
     return tags
 
 
+# Evergreen keyword abilities with no parseable effect of their own. Oracle
+# text made only of these ("Flying", "First strike, lifelink", one per line)
+# yields no Effects, so it skips the ability pipeline entirely.
+_VANILLA_KEYWORDS: Tuple[str, ...] = (
+    "flying", "vigilance", "trample", "haste", "lifelink", "menace", "reach",
+    "defender", "deathtouch", "hexproof", "indestructible", "first strike",
+    "double strike", "flash", "shroud", "fear", "intimidate", "prowess",
+    "skulk", "shadow", "horsemanship", "wither", "infect",
+)
+_VANILLA_KW_ALT = "|".join(kw.replace(" ", r"\s+") for kw in _VANILLA_KEYWORDS)
+_VANILLA_RE = re.compile(rf"(?:{_VANILLA_KW_ALT})(?:(?:,\s*|\s*\n\s*)(?:{_VANILLA_KW_ALT}))*", re.IGNORECASE)
+
+
 def parse_effects_from_text(
     oracle_text: str,
     type_line: str,
     card_name: Optional[str] = None,
 ) -> List[Effect]:
+    """
+    Structured effect parser; see _parse_effects_cached.
+
+    Memoized on (oracle_text, type_line, card_name): the text is static, so
+    re-parsing a card (repeated test runs, reprints, combo lookups) is a cache
+    hit. Each call gets a fresh list, but the Effects in it are shared between
+    calls and must be treated as read-only.
+    """
+    return list(_parse_effects_cached(oracle_text, type_line, card_name))
+
+
+@lru_cache(maxsize=200_000)
+def _parse_effects_cached(
+    oracle_text: str,
+    type_line: str,
+    card_name: Optional[str] = None,
+) -> Tuple[Effect, ...]:
     """
     Structured effect parser:
 
@@ -964,8 +1247,8 @@ def parse_effects_from_text(
       - ActionUnits for trigger / cost / result
       - KeywordHit context windows
     """
-    if not oracle_text:
-        return []
+    if not oracle_text or _VANILLA_RE.fullmatch(oracle_text.strip()):
+        return ()
 
     abilities = _split_abilities(oracle_text)
     effects: List[Effect] = []
@@ -975,8 +1258,10 @@ def parse_effects_from_text(
         if not clause:
             continue
 
+        # Lowered once per ability; the trigger/cost splitters are case-blind,
+        # so splitting `cl` the same way yields the lowered halves directly.
         cl = clause.lower()
-        effect_type = _guess_effect_type(clause)
+        effect_type = _guess_effect_type(clause, cl)
 
         trigger_text: Optional[str] = None
         cost_text:    Optional[str] = None
@@ -1000,30 +1285,32 @@ def parse_effects_from_text(
         # --- classify and split ---
         if effect_type == "triggered":
             trigger_text, result_text = _split_trigger_clause(clause)
+            trigger_lower, result_lower = _split_trigger_clause(cl)
             if trigger_text:
-                trigger_actions = extract_action_units(trigger_text, card_name)
-                trigger_atoms = _parse_trigger_atoms(trigger_text)
-                trigger_tags |= tags_from_atoms(trigger_atoms)
+                trigger_actions = list(extract_action_units(trigger_text, card_name))
+                trigger_atoms = _parse_trigger_atoms(trigger_text, trigger_lower)
+                tags_from_atoms(trigger_atoms, trigger_tags)
             if result_text:
-                result_actions = extract_action_units(result_text, card_name)
-                result_atoms = _parse_result_atoms(result_text)
-                result_tags |= tags_from_atoms(result_atoms)
+                result_actions = list(extract_action_units(result_text, card_name))
+                result_atoms = _parse_result_atoms(result_text, lower=result_lower)
+                tags_from_atoms(result_atoms, result_tags)
 
         elif effect_type == "activated":
             cost_text, result_text = _split_cost_clause(clause)
+            cost_lower, result_lower = _split_cost_clause(cl)
             if cost_text:
-                cost_actions = extract_action_units(cost_text, card_name)
-                cost_atoms = _parse_cost_atoms(cost_text)
-                cost_tags |= tags_from_atoms(cost_atoms)
+                cost_actions = list(extract_action_units(cost_text, card_name))
+                cost_atoms = _parse_cost_atoms(cost_text, cost_lower)
+                tags_from_atoms(cost_atoms, cost_tags)
             if result_text:
-                result_actions = extract_action_units(result_text, card_name)
-                result_atoms = _parse_result_atoms(result_text)
-                result_tags |= tags_from_atoms(result_atoms)
+                result_actions = list(extract_action_units(result_text, card_name))
+                result_atoms = _parse_result_atoms(result_text, lower=result_lower)
+                tags_from_atoms(result_atoms, result_tags)
 
         else:  # static / spell text
-            result_actions = extract_action_units(result_text, card_name)
-            result_atoms = _parse_result_atoms(result_text)
-            result_tags |= tags_from_atoms(result_atoms)
+            result_actions = list(extract_action_units(result_text, card_name))
+            result_atoms = _parse_result_atoms(result_text, lower=cl)
+            tags_from_atoms(result_atoms, result_tags)
 
         # --- actors / targets ---
         actor_tags  = _infer_actor_tags(cl)
@@ -1064,47 +1351,86 @@ def parse_effects_from_text(
             )
         )
 
-    return effects
+    return tuple(effects)
 
 
-def card_from_row(row: pd.Series) -> Card:
+def card_from_row(row: "pd.Series") -> Card:
     """
     Convert a Scryfall-like DataFrame row into a Card object with parsed effects.
     """
-    type_line = str(row.get("type_line", "") or "")
-    oracle_text = str(row.get("oracle_text", "") or "")
-    name = str(row.get("name", "") or "")
+    return _card_from_fields(
+        name=row.get("name", ""),
+        type_line=row.get("type_line", ""),
+        oracle_text=row.get("oracle_text", ""),
+        cmc=row.get("cmc", 0),
+        raw_kw=row.get("keywords", []),
+        raw_colors=row.get("color_identity", []),
+        mana_cost=row.get("mana_cost", ""),
+    )
+
+
+# (column, default when the column is missing) for _card_from_fields, in
+# argument order. Missing list columns default to None (-> []) so cards never
+# share one default list.
+_CARD_COLUMNS: Tuple[Tuple[str, object], ...] = (
+    ("name", ""),
+    ("type_line", ""),
+    ("oracle_text", ""),
+    ("cmc", 0),
+    ("keywords", None),
+    ("color_identity", None),
+    ("mana_cost", ""),
+)
+
 
-    # --- keywords (robust) ---
-    raw_kw = row.get("keywords", [])
+_COLOR_SET: FrozenSet[str] = frozenset("WUBRG")
+
+
+def _normalize_keywords(raw_kw) -> List[str]:
+    """
+    Keywords cell (list / comma string / None / NaN / anything else) -> list.
+    """
     if isinstance(raw_kw, list):
-        keywords = raw_kw
-    elif raw_kw is None or (isinstance(raw_kw, float) and pd.isna(raw_kw)):
-        keywords = []
-    elif isinstance(raw_kw, str):
-        keywords = [s.strip() for s in raw_kw.split(",") if s.strip()]
-    else:
-        keywords = []
+        return raw_kw
+    if raw_kw is None or (isinstance(raw_kw, float) and math.isnan(raw_kw)):
+        return []
+    if isinstance(raw_kw, str):
+        return [s.strip() for s in raw_kw.split(",") if s.strip()]
+    return []
 
-    # --- colors / color_identity (robust) ---
-    raw_colors = row.get("color_identity", [])
+
+def _normalize_colors(raw_colors) -> List[str]:
+    """
+    color_identity cell (list / array / "['W', 'U']" / "WU" / None / NaN) -> list.
+    """
+    # (numpy arrays from parquet list columns take the list() fallback)
     if isinstance(raw_colors, list):
-        colors = raw_colors
-    elif isinstance(raw_colors, np.ndarray):
-        colors = list(raw_colors)
-    elif raw_colors is None or (isinstance(raw_colors, float) and pd.isna(raw_colors)):
-        colors = []
-    elif isinstance(raw_colors, str):
+        return raw_colors
+    if raw_colors is None or (isinstance(raw_colors, float) and math.isnan(raw_colors)):
+        return []
+    if isinstance(raw_colors, str):
         if raw_colors.startswith("[") and raw_colors.endswith("]"):
             inner = raw_colors[1:-1]
-            colors = [c.strip(" '\"") for c in inner.split(",") if c.strip()]
-        else:
-            colors = [c for c in raw_colors if c in {"W", "U", "B", "R", "G"}]
-    else:
-        try:
-            colors = list(raw_colors)
-        except TypeError:
-            colors = []
+            return [c.strip(" '\"") for c in inner.split(",") if c.strip()]
+        return [c for c in raw_colors if c in _COLOR_SET]
+    try:
+        return list(raw_colors)
+    except TypeError:
+        return []
+
+
+def _card_from_fields(name, type_line, oracle_text, cmc, raw_kw, raw_colors, mana_cost) -> Card:
+    """
+    card_from_row on raw column values, so table builders can feed it from
+    column arrays instead of materializing a Series per row.
+    """
+    type_line = str(type_line or "")
+    oracle_text = str(oracle_text or "")
+    name = str(name or "")
+
+    # (already-normalized lists, as build_engine_table passes, return as-is)
+    keywords = _normalize_keywords(raw_kw)
+    colors = _normalize_colors(raw_colors)
 
     # Crude type split; you may already have better logic elsewhere
     types = [t for t in type_line.replace("—", "-").split() if t and t[0].isupper()]
@@ -1119,7 +1445,7 @@ def card_from_row(row: pd.Series) -> Card:
     is_permanent = not ("Instant" in type_line or "Sorcery" in type_line)
 
     try:
-        mana_value = float(row.get("cmc", 0) or 0.0)
+        mana_value = float(cmc or 0.0)
     except Exception:
         mana_value = 0.0
 
@@ -1128,7 +1454,7 @@ def card_from_row(row: pd.Series) -> Card:
     return Card(
         name=name,
         mana_value=mana_value,
-        mana_cost=str(row.get("mana_cost", "") or ""),
+        mana_cost=str(mana_cost or ""),
         colors=colors,
         types=types,
         subtypes=[],  # can be populated if you care
@@ -1155,6 +1481,27 @@ def summarize_card_engine(card: Card) -> dict:
     }
 
 
+# Scope / (kind, resource) groups the scoring heuristics test against, built
+# once instead of as set displays on every tag
+_SCOPE_OWN_OR_ANY_PERM: FrozenSet[Scope] = frozenset({Scope.YOUR_PERMANENT, Scope.ANY_PERMANENT})
+_SCOPE_YOU_OR_YOURS: FrozenSet[Scope] = frozenset({Scope.YOU, Scope.YOUR_PERMANENT})
+
+# outputs that stack nicely when two cards both produce them for YOU
+_GOOD_RESOURCES: FrozenSet[Tuple[EventKind, Resource]] = frozenset({
+    (EventKind.DRAW,   Resource.CARD),
+    (EventKind.CREATE, Resource.TOKEN),
+    (EventKind.ADD,    Resource.COUNTER),
+    (EventKind.ADD,    Resource.MANA),
+    (EventKind.GAIN,   Resource.LIFE),
+})
+
+# scarce costs two cards compete for
+_BAD_COST_PAIRS: FrozenSet[Tuple[EventKind, Resource]] = frozenset({
+    (EventKind.SACRIFICE, Resource.PERMANENT),
+    (EventKind.LOSE,      Resource.LIFE),
+})
+
+
 def engine_score(card: Card) -> float:
     """
     Rough heuristic: high if it repeatedly produces cards/tokens/life
@@ -1169,7 +1516,7 @@ def engine_score(card: Card) -> float:
                 score += 1.5
             if t.kind == EventKind.GAIN and t.resource == Resource.LIFE:
                 score += 1.5
-            if t.kind == EventKind.ENTERS and t.scope in {Scope.YOUR_PERMANENT, Scope.ANY_PERMANENT}:
+            if t.kind == EventKind.ENTERS and t.scope in _SCOPE_OWN_OR_ANY_PERM:
                 score += 1.0
             if t.kind == EventKind.DIES:
                 score += 1.0
@@ -1192,6 +1539,53 @@ def engine_score(card: Card) -> float:
     return score
 
 
+def _effect_produces_mana(e: Effect) -> bool:
+    return any(isinstance(a, ResourceDelta) and a.resource == "mana" and a.delta > 0 for a in e.result_atoms)
+
+
+def _effect_consumes_mana(e: Effect) -> bool:
+    return any(isinstance(a, ResourceDelta) and a.resource == "mana" and a.delta < 0 for a in e.cost_atoms)
+
+
+def _effect_produces_bodies(e: Effect) -> bool:
+    return any(
+        isinstance(a, ZoneMove)
+        and a.to_zone == Zone.BATTLEFIELD
+        and a.obj in _BODY_OBJS
+        and a.controller == "YOU"
+        for a in e.result_atoms
+    )
+
+
+def _effect_sacs_creatures(e: Effect) -> bool:
+    return any(
+        isinstance(a, ZoneMove)
+        and a.from_zone == Zone.BATTLEFIELD
+        and a.to_zone == Zone.GRAVEYARD
+        and a.obj == ObjKind.PERMANENT
+        and a.controller == "YOU"
+        and a.cause == Cause.SACRIFICE
+        for a in e.cost_atoms
+    )
+
+
+def _good_output_pairs(res_tags: Set[EventTag]) -> Set[tuple[EventKind, Resource]]:
+    return {
+        (t.kind, t.resource)
+        for t in res_tags
+        if (t.kind, t.resource) in _GOOD_RESOURCES
+        and t.scope in _SCOPE_YOU_OR_YOURS
+    }
+
+
+def _bad_costs(cost_tags: Set[EventTag]) -> Set[tuple[EventKind, Resource]]:
+    return {
+        (t.kind, t.resource)
+        for t in cost_tags
+        if (t.kind, t.resource) in _BAD_COST_PAIRS
+    }
+
+
 def card_synergy(a: Card, b: Card) -> float:
     """
     Symmetric-ish synergy score between two cards.
@@ -1206,12 +1600,11 @@ def card_synergy(a: Card, b: Card) -> float:
         based on Effect-level structure.
     """
 
-    # Card-level aggregations (fine for cheap heuristics)
-    a_trig = a.all_trigger_tags()
+    # Card-level aggregations (fine for cheap heuristics); trigger/result
+    # feeds use the masks below instead
     a_res  = a.all_result_tags()
     a_cost = a.all_cost_tags()
 
-    b_trig = b.all_trigger_tags()
     b_res  = b.all_result_tags()
     b_cost = b.all_cost_tags()
 
@@ -1221,8 +1614,10 @@ def card_synergy(a: Card, b: Card) -> float:
     # 1) Direct event feeds (card-level, still useful)
     #    "Result of A matches trigger of B" and vice versa.
     # ─────────────────────────────────────────────────────────
-    feeds_ab = len(a_res & b_trig)
-    feeds_ba = len(b_res & a_trig)
+    # popcount of the shared bits counts the shared tags without building
+    # the intersection sets
+    feeds_ab = (a.result_mask() & b.trigger_mask()).bit_count()
+    feeds_ba = (b.result_mask() & a.trigger_mask()).bit_count()
     score += 3.0 * (feeds_ab + feeds_ba)
 
     # ─────────────────────────────────────────────────────────
@@ -1231,112 +1626,57 @@ def card_synergy(a: Card, b: Card) -> float:
     #    card as "consumes mana" or "produces mana" in the abstract.
     # ─────────────────────────────────────────────────────────
 
-    def effect_produces_mana(e: Effect) -> bool:
-        return any(isinstance(a, ResourceDelta) and a.resource == "mana" and a.delta > 0 for a in e.result_atoms)
-
-    def effect_consumes_mana(e: Effect) -> bool:
-        return any(isinstance(a, ResourceDelta) and a.resource == "mana" and a.delta < 0 for a in e.cost_atoms)
-
-    def effect_produces_bodies(e: Effect) -> bool:
-        return any(
-            isinstance(a, ZoneMove)
-            and a.to_zone == Zone.BATTLEFIELD
-            and a.obj in {ObjKind.TOKEN, ObjKind.PERMANENT}
-            and a.controller == "YOU"
-            for a in e.result_atoms
-        )
-
-    def effect_sacs_creatures(e: Effect) -> bool:
-        return any(
-            isinstance(a, ZoneMove)
-            and a.from_zone == Zone.BATTLEFIELD
-            and a.to_zone == Zone.GRAVEYARD
-            and a.obj == ObjKind.PERMANENT
-            and a.controller == "YOU"
-            and a.cause == Cause.SACRIFICE
-            for a in e.cost_atoms
-        )
-
     # Per-effect synergy passes
     for ea in a.effects:
         for eb in b.effects:
             # 2a) Effect-level trigger feeds: A's result tags -> B's triggers
-            if ea.result_tags & eb.trigger_tags:
+            if ea._result_mask & eb._trigger_mask:
                 score += 3.0
-            if eb.result_tags & ea.trigger_tags:
+            if eb._result_mask & ea._trigger_mask:
                 score += 3.0
 
             # 2b) Resource feeding: mana engines
-            if effect_produces_mana(ea) and effect_consumes_mana(eb):
+            if _effect_produces_mana(ea) and _effect_consumes_mana(eb):
                 score += 2.0
-            if effect_produces_mana(eb) and effect_consumes_mana(ea):
+            if _effect_produces_mana(eb) and _effect_consumes_mana(ea):
                 score += 2.0
 
             # 2c) Resource feeding: bodies → sac outlets
-            if effect_produces_bodies(ea) and effect_sacs_creatures(eb):
+            if _effect_produces_bodies(ea) and _effect_sacs_creatures(eb):
                 score += 2.0
-            if effect_produces_bodies(eb) and effect_sacs_creatures(ea):
+            if _effect_produces_bodies(eb) and _effect_sacs_creatures(ea):
                 score += 2.0
 
     # ─────────────────────────────────────────────────────────
     # 3) Shared outputs for YOU at card-level
     #    Engines that stack nicely (double draw, double tokens, etc.)
     # ─────────────────────────────────────────────────────────
-    good_resources = {
-        (EventKind.DRAW,   Resource.CARD),
-        (EventKind.CREATE, Resource.TOKEN),
-        (EventKind.ADD,    Resource.COUNTER),
-        (EventKind.ADD,    Resource.MANA),
-        (EventKind.GAIN,   Resource.LIFE),
-    }
-
-    def good_output_pairs(res_tags: Set[EventTag]) -> Set[tuple[EventKind, Resource]]:
-        return {
-            (t.kind, t.resource)
-            for t in res_tags
-            if (t.kind, t.resource) in good_resources
-            and t.scope in {Scope.YOU, Scope.YOUR_PERMANENT}
-        }
-
-    a_good = good_output_pairs(a_res)
-    b_good = good_output_pairs(b_res)
-    shared_good = len(a_good & b_good)
+    a_good = _good_output_pairs(a_res)
+    b_good = _good_output_pairs(b_res)
+    shared_good = sum(1 for p in a_good if p in b_good)
     score += 1.5 * shared_good
 
     # ─────────────────────────────────────────────────────────
     # 4) Shared scarce costs (card-level)
     #    Two cards that both demand the same scarce thing hurt each other a bit.
     # ─────────────────────────────────────────────────────────
-    bad_cost_pairs = {
-        (EventKind.SACRIFICE, Resource.PERMANENT),
-        (EventKind.LOSE,      Resource.LIFE),
-    }
-
-    def bad_costs(cost_tags: Set[EventTag]) -> Set[tuple[EventKind, Resource]]:
-        return {
-            (t.kind, t.resource)
-            for t in cost_tags
-            if (t.kind, t.resource) in bad_cost_pairs
-        }
-
-    a_bad = bad_costs(a_cost)
-    b_bad = bad_costs(b_cost)
-    shared_bad = len(a_bad & b_bad)
+    a_bad = _bad_costs(a_cost)
+    b_bad = _bad_costs(b_cost)
+    shared_bad = sum(1 for p in a_bad if p in b_bad)
     score -= 1.0 * shared_bad
 
     return score
 
 
-def build_engine_table(df: pd.DataFrame) -> pd.DataFrame:
+def _engine_rows(records: List[tuple]) -> List[dict]:
     """
-    Take a Scryfall-like DataFrame and return a table of:
-      name, colors, mana_value, engine_score, triggers, results, costs
-    for all cards that have at least one parsed effect.
+    build_engine_table rows for a chunk of _card_from_fields argument tuples.
+    Module-level so worker processes can run it; parse caches are per process.
     """
     rows = []
 
-    for _, row in df.iterrows():
-        card = card_from_row(row)
+    for fields in records:
+        card = _card_from_fields(*fields)
         if not card.effects:
             continue
 
@@ -1355,6 +1695,49 @@ def build_engine_table(df: pd.DataFrame) -> pd.DataFrame:
             }
         )
 
+    return rows
+
+
+# below this many rows, worker start-up and pickling outweigh the parse work
+_PARALLEL_MIN_ROWS = 2000
+
+
+def build_engine_table(df: "pd.DataFrame", workers: Optional[int] = None) -> "pd.DataFrame":
+    """
+    Take a Scryfall-like DataFrame and return a table of:
+      name, colors, mana_value, engine_score, triggers, results, costs
+    for all cards that have at least one parsed effect.
+
+    Rows are parsed across `workers` processes (default: one per CPU); small
+    frames, or workers=1, stay in-process.
+    """
+    # one array per column up front instead of a boxed Series per row
+    n = len(df)
+    columns = {
+        col: df[col].to_numpy() if col in df.columns else [default] * n
+        for col, default in _CARD_COLUMNS
+    }
+    # list cells normalized in one pass per column; _card_from_fields then
+    # takes its list fast path
+    columns["keywords"] = list(map(_normalize_keywords, columns["keywords"]))
+    columns["color_identity"] = list(map(_normalize_colors, columns["color_identity"]))
+
+    records = list(zip(*columns.values()))
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers <= 1 or n < _PARALLEL_MIN_ROWS:
+        rows = _engine_rows(records)
+    else:
+        # map() yields chunks in order, so the row order (and the tie order
+        # after sorting) matches a serial pass
+        chunksize = max(1, n // (workers * 8))
+        chunks = [records[i:i + chunksize] for i in range(0, n, chunksize)]
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            rows = list(chain.from_iterable(pool.map(_engine_rows, chunks)))
+
+    import pandas as pd
+
     eng_df = pd.DataFrame(rows)
     eng_df.sort_values("engine_score", ascending=False, inplace=True)
     eng_df.reset_index(drop=True, inplace=True)
@@ -1419,11 +1802,7 @@ def _atoms_for_clause(clause: str, card_name: str | None = None):
         trigger_text, result_text = _split_trigger_clause(clause)
 
         if trigger_text:
-            # Your local signature might be _parse_trigger_atoms(text) or _parse_trigger_atoms(text, card_name)
-            try:
-                trigger_atoms = _parse_trigger_atoms(trigger_text, card_name)
-            except TypeError:
-                trigger_atoms = _parse_trigger_atoms(trigger_text)
+            trigger_atoms = _parse_trigger_atoms(trigger_text)
 
         if result_text:
             result_atoms = _parse_result_atoms(result_text, card_name)
@@ -1453,6 +1832,8 @@ def test_random_cards_atoms(num_samples: int = 20, seed: int = 42) -> None:
 
     Ignores tags and ActionUnits entirely.
     """
+    import pandas as pd
+
     df = pd.read_parquet("MTGCardLibrary.parquet")
 
     if len(df) == 0:
@@ -1537,6 +1918,8 @@ def test_random_cards(num_samples: int = 20, seed: int = 42) -> None:
     Pull a random subset of cards from the library and print their parsed
     engine structure for eyeballing.
     """
+    import pandas as pd
+
     df = pd.read_parquet("MTGCardLibrary.parquet")
 
     if len(df) == 0:
@@ -1548,48 +1931,53 @@ def test_random_cards(num_samples: int = 20, seed: int = 42) -> None:
         card = card_from_row(row)
         type_line = str(row.get("type_line", "") or "")
 
-        print("=" * 80)
-        print(f"{card.name} — {type_line}")
-        print(f"MV: {card.mana_value} | Cost: {card.mana_cost} | Colors: {''.join(card.colors) or 'Colorless'}")
-        print()
-        print("Oracle Text:")
-        print(card.oracle_text or "(no oracle text)")
-        print()
-        print(f"Engine score (rough): {engine_score(card):.2f}")
-        print()
+        # one write per card instead of a print() per line
+        buf: List[str] = [
+            "=" * 80,
+            f"{card.name} — {type_line}",
+            f"MV: {card.mana_value} | Cost: {card.mana_cost} | Colors: {''.join(card.colors) or 'Colorless'}",
+            "",
+            "Oracle Text:",
+            card.oracle_text or "(no oracle text)",
+            "",
+            f"Engine score (rough): {engine_score(card):.2f}",
+            "",
+        ]
 
         if not card.effects:
-            print("No parsed effects.")
+            buf.append("No parsed effects.")
+            sys.stdout.write("\n".join(buf) + "\n")
             continue
 
-        print("Effects:")
+        buf.append("Effects:")
         for e in card.effects:
-            print(f"  · [{e.effect_type}] {e.raw_text}")
+            buf.append(f"  · [{e.effect_type}] {e.raw_text}")
             if e.trigger_text:
-                print(f"     trigger_text: {e.trigger_text}")
+                buf.append(f"     trigger_text: {e.trigger_text}")
             if e.cost_text:
-                print(f"     cost_text:    {e.cost_text}")
+                buf.append(f"     cost_text:    {e.cost_text}")
             if e.result_text and e.result_text != e.raw_text:
-                print(f"     result_text:  {e.result_text}")
+                buf.append(f"     result_text:  {e.result_text}")
 
             if e.trigger_tags:
-                print("     trigger_tags:", ", ".join(t.short() for t in e.trigger_tags))
+                buf.append("     trigger_tags: " + ", ".join(t.short() for t in e.trigger_tags))
             if e.cost_tags:
-                print("     cost_tags:   ", ", ".join(t.short() for t in e.cost_tags))
+                buf.append("     cost_tags:    " + ", ".join(t.short() for t in e.cost_tags))
             if e.result_tags:
-                print("     result_tags: ", ", ".join(t.short() for t in e.result_tags))
+                buf.append("     result_tags:  " + ", ".join(t.short() for t in e.result_tags))
 
             if e.trigger_actions:
-                print("     trigger_actions:", [a.kind or a.verb for a in e.trigger_actions])
+                buf.append(f"     trigger_actions: {[a.kind or a.verb for a in e.trigger_actions]}")
             if e.cost_actions:
-                print("     cost_actions:   ", [a.kind or a.verb for a in e.cost_actions])
+                buf.append(f"     cost_actions:    {[a.kind or a.verb for a in e.cost_actions]}")
             if e.result_actions:
-                print("     result_actions: ", [a.kind or a.verb for a in e.result_actions])
-        print()
+                buf.append(f"     result_actions:  {[a.kind or a.verb for a in e.result_actions]}")
+        buf.append("")
 
-        print("Card summary:")
-        print(summarize_card_engine(card))
-        print()
+        buf.append("Card summary:")
+        buf.append(str(summarize_card_engine(card)))
+        buf.append("")
+        sys.stdout.write("\n".join(buf) + "\n")
 
 
 def test_known_combos() -> None:
@@ -1602,6 +1990,8 @@ def test_known_combos() -> None:
       - Shows which EventTags from one card's results feed the other's triggers
       - Shows a simple synergy score
     """
+    import pandas as pd
+
     LIB_PATH = "MTGCardLibrary.parquet"
     df = pd.read_parquet(LIB_PATH)
 
@@ -1634,33 +2024,35 @@ def test_known_combos() -> None:
     df_by_name = df.set_index("name", drop=False)
 
     for label, names in combo_defs.items():
-        print("=" * 80)
-        print(f"Testing combo: {label}")
+        # one write per combo instead of a print() per line
+        buf: List[str] = ["=" * 80, f"Testing combo: {label}"]
 
         missing = [n for n in names if n not in df_by_name.index]
         if missing:
-            print(f"  Skipping combo; missing in library: {', '.join(missing)}")
+            buf.append(f"  Skipping combo; missing in library: {', '.join(missing)}")
+            sys.stdout.write("\n".join(buf) + "\n")
             continue
 
         # Build Card objects
         cards: List[Card] = [card_from_row(df_by_name.loc[n]) for n in names]
 
         # Per-card engine summary
-        print("  Card engines:")
+        buf.append("  Card engines:")
         for c in cards:
             trig = {t.short() for t in c.all_trigger_tags()}
             res  = {t.short() for t in c.all_result_tags()}
             cost = {t.short() for t in c.all_cost_tags()}
-            print(f"    - {c.name}")
-            print(f"        engine_score = {engine_score(c):.2f}")
-            print(f"        triggers     = {trig or '{}'}")
-            print(f"        results      = {res or '{}'}")
-            print(f"        costs        = {cost or '{}'}")
+            buf.append(f"    - {c.name}")
+            buf.append(f"        engine_score = {engine_score(c):.2f}")
+            buf.append(f"        triggers     = {trig or '{}'}")
+            buf.append(f"        results      = {res or '{}'}")
+            buf.append(f"        costs        = {cost or '{}'}")
 
         if len(cards) < 2:
+            sys.stdout.write("\n".join(buf) + "\n")
             continue
 
-        print("\n  Pairwise synergy and event feeds:")
+        buf.append("\n  Pairwise synergy and event feeds:")
         for i in range(len(cards)):
             for j in range(i + 1, len(cards)):
                 a = cards[i]
@@ -1676,18 +2068,19 @@ def test_known_combos() -> None:
                 feeds_ab = {t.short() for t in (a_res & b_trig)}
                 feeds_ba = {t.short() for t in (b_res & a_trig)}
 
-                print(f"    {a.name} ↔ {b.name}")
-                print(f"        synergy score   = {s:.2f}")
-                print(f"        A → B feeds     = {feeds_ab or '{}'}")
-                print(f"        B → A feeds     = {feeds_ba or '{}'}")
+                buf.append(f"    {a.name} ↔ {b.name}")
+                buf.append(f"        synergy score   = {s:.2f}")
+                buf.append(f"        A → B feeds     = {feeds_ab or '{}'}")
+                buf.append(f"        B → A feeds     = {feeds_ba or '{}'}")
 
                 if feeds_ab and feeds_ba:
-                    print("        -> Potential 2-card loop (both directions feed).")
+                    buf.append("        -> Potential 2-card loop (both directions feed).")
                 elif feeds_ab or feeds_ba:
-                    print("        -> One-direction engine (could be part of a larger loop).")
+                    buf.append("        -> One-direction engine (could be part of a larger loop).")
                 else:
-                    print("        -> No direct event-tag feed detected.")
-        print()
+                    buf.append("        -> No direct event-tag feed detected.")
+        buf.append("")
+        sys.stdout.write("\n".join(buf) + "\n")
 
 
 if __name__ == "__main__":
@@ -28,10 +28,18 @@ def _s(v: Any) -> str:
         return ""
     return str(v).lower()
 
+# Bulk callers can precompute these columns once (see lowercase_columns)
+# so every detector doesn't re-lower the same strings.
 def _type(row) -> str:
+    lc = row.get("_type_lc")
+    if lc is not None:
+        return lc
     return _s(row.get("type_line", ""))
 
 def _text(row) -> str:
+    lc = row.get("_oracle_lc")
+    if lc is not None:
+        return lc
     return _s(row.get("oracle_text", ""))
 
 def _name(row) -> str:
@@ -66,6 +74,10 @@ def is_instant_or_sorcery(row) -> bool:
     tl = _type(row)
     return ("instant" in tl) or ("sorcery" in tl)
 
+def is_permanent_card(row) -> bool:
+    # "Permanent" = not instant/sorcery
+    return not is_instant_or_sorcery(row)
+
 
 # -------------------------
 # Ramp / Draw / Removal / Wipes
@@ -75,13 +87,16 @@ _RAMP_PATTERNS = [
     r"\badd\s*\{",                         # "Add {G}"
     r"\badd\s+\w+\s+mana\b",               # "add one mana"
     r"\badd\s+\w+\s+mana\s+of\s+any\s+color\b",
-    r"\bsearch your library for (a|two|up to two) land",  # land ramp
-    r"\bput (a|two|up to two) land card[s]? from your (hand|graveyard|library) onto the battlefield\b",
+    r"\bsearch your library for (?:a|two|up to two) land",  # land ramp
+    r"\bput (?:a|two|up to two) land card[s]? from your (?:hand|graveyard|library) onto the battlefield\b",
     r"\btreasure token\b",
-    r"\bcreate (a|two|three|x) treasure\b",
-    r"\buntap (up to )?\w+ lands?\b",
+    r"\bcreate (?:a|two|three|x) treasure\b",
+    r"\buntap (?:up to )?\w+ lands?\b",
     r"\breveal.*land card.*put.*onto the battlefield\b",
 ]
+_RAMP_RE = re.compile("|".join(f"(?:{p})" for p in _RAMP_PATTERNS))
+# Every ramp pattern contains one of these, so texts without any skip the regex.
+_RAMP_HINTS = ("add", "treasure", "land")
 
 def is_ramp(row) -> bool:
     if is_land(row):
@@ -91,10 +106,12 @@ def is_ramp(row) -> bool:
     if "add a +1/+1 counter" in t or "add a counter" in t:
         # still might be mana in text, but this kills the worst FP.
         pass
-    return any(re.search(p, t) for p in _RAMP_PATTERNS)
+    if not any(h in t for h in _RAMP_HINTS):
+        return False
+    return _RAMP_RE.search(t) is not None
 
 _DRAW_PATTERNS = [
-    r"\bdraw (a|two|three|four|x) card",
+    r"\bdraw (?:a|two|three|four|x) card",
     r"\bdraw cards\b",
     r"\blook at the top \d+ cards? of your library\b",
     r"\breveal the top \d+ cards? of your library\b",
@@ -104,6 +121,8 @@ _DRAW_PATTERNS = [
     r"\bat the beginning of your upkeep\b.*\bdraw\b",
     r"\bwhenever .* attacks?\b.*\bdraw\b",
 ]
+_DRAW_RE = re.compile("|".join(f"(?:{p})" for p in _DRAW_PATTERNS))
+_DRAW_HINTS = ("draw", "the top")
 
 def is_card_draw(row) -> bool:
     if is_land(row):
@@ -111,27 +130,33 @@ def is_card_draw(row) -> bool:
     t = _text(row)
     # Don't count "each opponent draws" as your draw; but if it says "each player draws", it can still be CA parity.
     # We'll be permissive for now; refine later if needed.
-    return any(re.search(p, t) for p in _DRAW_PATTERNS)
+    if not any(h in t for h in _DRAW_HINTS):
+        return False
+    return _DRAW_RE.search(t) is not None
 
 _REMOVAL_PATTERNS = [
     r"\bdestroy target\b",
     r"\bexile target\b",
     r"\breturn target\b.*\bto its owner's hand\b",
-    r"\b(counter|counter target)\b",
+    r"\b(?:counter|counter target)\b",
     r"\bfight target\b",
     r"\bdeals? \d+ damage to target\b",
     r"\btarget creature gets -\d+/-\d+\b",
     r"\bsacrifice\b.*\btarget\b",  # edicts
 ]
+_REMOVAL_RE = re.compile("|".join(f"(?:{p})" for p in _REMOVAL_PATTERNS))
+_REMOVAL_HINTS = ("target", "counter")
 
 def is_removal(row) -> bool:
     if is_land(row):
         return False
     t = _text(row)
+    if not any(h in t for h in _REMOVAL_HINTS):
+        return False
     # If it's clearly a wipe, don't double-count as single-target removal.
     if is_board_wipe(row):
         return False
-    return any(re.search(p, t) for p in _REMOVAL_PATTERNS)
+    return _REMOVAL_RE.search(t) is not None
 
 _WIPE_PATTERNS = [
     r"\bdestroy all\b",
@@ -141,31 +166,46 @@ _WIPE_PATTERNS = [
     r"\beach nonland permanent\b",
     r"\ball creatures get -\d+/-\d+\b",
 ]
+_WIPE_RE = re.compile("|".join(f"(?:{p})" for p in _WIPE_PATTERNS))
+_WIPE_HINTS = ("all", "each")
 
 def is_board_wipe(row) -> bool:
     if is_land(row):
         return False
     t = _text(row)
-    return any(re.search(p, t) for p in _WIPE_PATTERNS)
+    if not any(h in t for h in _WIPE_HINTS):
+        return False
+    return _WIPE_RE.search(t) is not None
 
 
 # -------------------------
 # High-impact / "game changer" heuristics
 # -------------------------
 
+_EXTRA_TURN_RE = re.compile(r"\btake an extra turn\b")
+_MLD_RE = re.compile(r"\bdestroy all lands\b|\beach player sacrifices (?:all|a) lands?\b")
+_DONT_UNTAP_RE = re.compile(r"\b(?:lands?|permanents?) don't untap\b")
+_LAND_TUTOR_RE = re.compile(r"\bsearch your library for (?:a|an) land\b")
+_NONLAND_TUTOR_RE = re.compile(
+    r"\bsearch your library for (?:a|an) (?:card|creature|artifact|enchantment|instant|sorcery|planeswalker)\b"
+    r"|\bsearch your library for a nonland card\b"
+)
+_WIN_RE = re.compile(r"\bwin the game\b")
+
 def is_extra_turn(row) -> bool:
     t = _text(row)
-    return bool(re.search(r"\btake an extra turn\b", t))
+    return bool(_EXTRA_TURN_RE.search(t))
 
 def is_mass_land_denial(row) -> bool:
     t = _text(row)
+    # every pattern below names lands or permanents
+    if "land" not in t and "permanent" not in t:
+        return False
     # Armageddon-style, or heavy stax on lands
-    if re.search(r"\bdestroy all lands\b", t):
-        return True
-    if re.search(r"\beach player sacrifices (all|a) lands?\b", t):
+    if _MLD_RE.search(t):
         return True
     # Winter Orb / Stasis-like effects
-    if re.search(r"\b(lands?|permanents?) don't untap\b", t) and ("each" in t or "players" in t):
+    if _DONT_UNTAP_RE.search(t) and ("each" in t or "players" in t):
         return True
     return False
 
@@ -174,13 +214,10 @@ def is_nonland_tutor(row) -> bool:
     # Land tutors are usually ramp; we want "find any card / nonland card"
     if "search your library" not in t:
         return False
-    if re.search(r"\bsearch your library for (a|an) land\b", t):
+    if _LAND_TUTOR_RE.search(t):
         return False
     # Common nonland tutor phrasings
-    return bool(
-        re.search(r"\bsearch your library for (a|an) (card|creature|artifact|enchantment|instant|sorcery|planeswalker)\b", t)
-        or re.search(r"\bsearch your library for a nonland card\b", t)
-    )
+    return _NONLAND_TUTOR_RE.search(t) is not None
 
 def is_game_changer(row) -> bool:
     """
@@ -189,7 +226,7 @@ def is_game_changer(row) -> bool:
     """
     t = _text(row)
     # Auto-wins / alt-wins
-    if re.search(r"\byou win the game\b", t) or re.search(r"\bwin the game\b", t):
+    if _WIN_RE.search(t):
         return True
     # Extra turns
     if is_extra_turn(row):
@@ -210,6 +247,12 @@ def is_game_changer(row) -> bool:
 # Persistent output / engines
 # -------------------------
 
+_TRIGGER_RE = re.compile(r"\bwhenever\b|\bat the beginning of\b")
+_TAP_ADD_RE = re.compile(r"\{t\}:\s*add\s*\{")
+_TAP_DRAW_RE = re.compile(r"\{t\}:\s*draw\b")
+_ACTIVATED_TOKEN_RE = re.compile(r":\s*create\b.*token")
+_ENGINE_OUTPUT_WORDS = ("draw", "create", "add {", "treasure", "token", "return", "exile the top")
+
 def has_persistent_output(row) -> bool:
     """
     Detect *repeatable* advantage sources:
@@ -228,17 +271,17 @@ def has_persistent_output(row) -> bool:
         return False
 
     # Trigger-based repetition
-    if re.search(r"\bwhenever\b", t) or re.search(r"\bat the beginning of\b", t):
-        if any(x in t for x in ["draw", "create", "add {", "treasure", "token", "return", "exile the top"]):
+    if _TRIGGER_RE.search(t):
+        if any(x in t for x in _ENGINE_OUTPUT_WORDS):
             return True
 
     # Activated abilities with a repeatable output
     # e.g., "{T}: Add {G}", "{2}, {T}: Draw a card"
-    if re.search(r"\{t\}:\s*add\s*\{", t):
+    if _TAP_ADD_RE.search(t):
         return True
-    if re.search(r"\{t\}:\s*draw\b", t):
+    if _TAP_DRAW_RE.search(t):
         return True
-    if re.search(r":\s*create\b.*token", t):
+    if _ACTIVATED_TOKEN_RE.search(t):
         return True
 
     # Continuous / replacement engines (Rhystic Study style)
@@ -284,3 +327,120 @@ def persistence_score(row) -> float:
 
     # Soft cap so sorting doesn't go nuts
     return float(min(score, 5.0))
+
+
+# -------------------------
+# Vectorized (whole-DataFrame) layer
+# -------------------------
+
+LOWERCASE_COLUMNS = ("_oracle_lc", "_type_lc")
+
+def arrow_string_dtype():
+    """
+    Arrow-backed string dtype whose missing value is NaN (not pd.NA), for
+    whichever pandas 2.x/3.x is installed. pandas 2.0 has no such dtype, so
+    it gets plain object strings: same results, just without Arrow kernels.
+    """
+    import pandas as pd
+    try:
+        return pd.StringDtype("pyarrow", na_value=float("nan"))   # pandas >= 2.3
+    except TypeError:
+        pass
+    try:
+        return pd.StringDtype("pyarrow_numpy")                    # pandas 2.1 / 2.2
+    except (TypeError, ValueError):
+        return object
+
+def _arrow_lower(s):
+    # Arrow-backed strings make .str.contains run on pyarrow's compiled RE2
+    # kernels instead of calling Python re once per row (~10x on the detector
+    # bank). Every pattern above therefore has to stay RE2-compatible: no
+    # lookarounds, no backreferences.
+    return s.fillna("").astype(str).astype(arrow_string_dtype()).str.lower()
+
+def lowercase_columns(df) -> None:
+    """Add the cached _oracle_lc / _type_lc columns read by _text / _type."""
+    df["_oracle_lc"] = _arrow_lower(df["oracle_text"])
+    df["_type_lc"] = _arrow_lower(df["type_line"])
+
+def feature_columns(df) -> dict:
+    """
+    Column-at-a-time twin of the row detectors above, for bulk passes like
+    cleanAndAnalyzeData. Returns {column_name: Series} aligned to df.index;
+    results match df.apply(<detector>, axis=1). Flags are numpy bool
+    columns (never object/nullable), persistence_score is float64.
+
+    Matching runs straight on the Arrow arrays via pyarrow.compute
+    (match_substring / RE2 match_substring_regex), and the flags are
+    combined as plain numpy bool arrays.
+    """
+    import numpy as np
+    import pandas as pd
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    if "_oracle_lc" not in df:
+        df = df.copy()
+        lowercase_columns(df)
+    ol = pa.array(df["_oracle_lc"])
+    tl = pa.array(df["_type_lc"])
+
+    def _match(arr, pat) -> Any:
+        if isinstance(pat, str):
+            hit = pc.match_substring(arr, pat)
+        else:
+            hit = pc.match_substring_regex(arr, pat.pattern)
+        return hit.to_numpy(zero_copy_only=False)
+
+    def has(pat) -> Any:
+        return _match(ol, pat)
+
+    land = _match(tl, "land")
+    nonland = ~land
+    inst_or_sorc = _match(tl, "instant") | _match(tl, "sorcery")
+
+    wipe = nonland & has(_WIPE_RE)
+    extra_turn = has(_EXTRA_TURN_RE)
+    mld = has(_MLD_RE) | (has(_DONT_UNTAP_RE) & (has("each") | has("players")))
+    tutor = has("search your library") & ~has(_LAND_TUTOR_RE) & has(_NONLAND_TUTOR_RE)
+    cmc = np.fromiter((_cmc({"cmc": v}) for v in df["cmc"]), dtype=float, count=len(df))
+
+    whenever = has("whenever")
+    at_beginning = has("at the beginning of")
+    draw_word = has("draw")
+    persistent = ~inst_or_sorc & (
+        (has(_TRIGGER_RE) & has(re.compile("|".join(map(re.escape, _ENGINE_OUTPUT_WORDS)))))
+        | has(_TAP_ADD_RE)
+        | has(_TAP_DRAW_RE)
+        | has(_ACTIVATED_TOKEN_RE)
+        | (has("whenever an opponent") & draw_word)
+    )
+
+    score = (
+        1.0
+        + 0.75 * _match(tl, "enchantment")
+        + 0.75 * land
+        + 0.25 * _match(tl, "artifact")
+        + 1.25 * draw_word
+        + 0.75 * (has("create") & has("token"))
+        + 0.5 * (has("add {") | has("treasure"))
+        + 0.5 * whenever
+        + 0.25 * at_beginning
+    )
+    score = np.where(persistent, np.minimum(score, 5.0), 0.0)
+
+    flags = {
+        "is_land": land,
+        "is_ramp": nonland & has(_RAMP_RE),
+        "is_card_draw": nonland & has(_DRAW_RE),
+        "is_board_wipe": wipe,
+        "is_removal": nonland & ~wipe & has(_REMOVAL_RE),
+        "is_game_changer": has(_WIN_RE) | extra_turn | mld | (tutor & (cmc <= 3.0)) | has("infinite"),
+        "is_mass_land_denial": mld,
+        "is_extra_turn": extra_turn,
+        "is_nonland_tutor": tutor,
+        "is_permanent_card": ~inst_or_sorc,
+        "has_persistent_output": persistent,
+        "persistence_score": score,
+    }
+    return {col: pd.Series(values, index=df.index) for col, values in flags.items()}
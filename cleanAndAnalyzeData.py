@@ -1,129 +1,233 @@
 # cleanAndAnalyzeData.py
 from __future__ import annotations
-from typing import Dict, Any
+import hashlib
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain
+from pathlib import Path
 import pandas as pd
 
-from themes import detect_card_themes
+import card_features
+from themes import detect_card_themes_bulk
 from roles import get_card_roles
-from card_features import (
-    is_land,
-    is_ramp,
-    is_card_draw,
-    is_board_wipe,
-    is_removal,
-    is_game_changer,
-    is_mass_land_denial,
-    is_extra_turn,
-    is_nonland_tutor,
-    is_permanent_card,
-    has_persistent_output,
-    persistence_score,
-)
+from card_features import LOWERCASE_COLUMNS, arrow_string_dtype, feature_columns, lowercase_columns
 
-# --- Load base data ---
-df_raw = pd.read_parquet("MTGCardLibrary.parquet")
+# CSV copies of the outputs are slow to write and rarely read; set EMIT_CSV=1
+# to get them alongside the parquet files.
+EMIT_CSV = bool(os.environ.get("EMIT_CSV"))
+
+
+def write_output(df: pd.DataFrame, stem: str) -> None:
+    """Write df to <stem>.parquet (zstd, 50k-row groups) and optionally CSV."""
+    df.to_parquet(
+        f"{stem}.parquet",
+        engine="pyarrow",
+        compression="zstd",
+        compression_level=3,
+        row_group_size=50_000,
+    )
+    if EMIT_CSV:
+        df.to_csv(f"{stem}.csv", index=False)
 
-df_cmdr = df_raw[df_raw["legalities.commander"] == "legal"].copy()
 
+# --- Load base data ---
 cols = [
     "name", "mana_cost", "cmc", "type_line", "oracle_text", "keywords",
     "colors", "color_identity", "edhrec_rank", "prices.usd",
     "set", "rarity", "released_at"
 ]
 
-df_cmdr = df_cmdr[cols].copy()
+# Only decode the columns we use (the library has 120+), then filter once.
+df_raw = pd.read_parquet("MTGCardLibrary.parquet", columns=cols + ["legalities.commander"])
+
+df_cmdr = df_raw.loc[df_raw["legalities.commander"] == "legal", cols].copy()
+del df_raw
+
+# Text columns as Arrow-backed strings, so the lower()/contains() passes run
+# on Arrow's C++ kernels (pandas >= 3 already reads parquet strings this way;
+# arrow_string_dtype picks the equivalent dtype on 2.1-2.2 and falls back to
+# object strings on 2.0, so any pandas 2.x still runs). Missing values stay
+# NaN on purpose: dtype_backend="pyarrow" would turn the ~750 missing oracle
+# texts into pd.NA, which breaks the `value or ""` handling in roles.py, and
+# would also move cmc and the list columns onto ArrowDtype.
+TEXT_DTYPE = arrow_string_dtype()
+for col in ("name", "mana_cost", "type_line", "oracle_text"):
+    df_cmdr[col] = df_cmdr[col].astype(TEXT_DTYPE)
+
+# Numeric columns coerced once; everything below reads them as floats.
+df_cmdr["cmc"] = pd.to_numeric(df_cmdr["cmc"], errors="coerce").fillna(0.0)
+# some cards may have NaN or None – kept as NaN so medians ignore them
+df_cmdr["edhrec_rank"] = pd.to_numeric(df_cmdr["edhrec_rank"], errors="coerce")
+
+# Lowercased oracle_text / type_line, computed once for every detector below.
+lowercase_columns(df_cmdr)
 
 # --- Themes & roles ---
-df_cmdr["themes"] = df_cmdr.apply(detect_card_themes, axis=1)
-df_cmdr["roles"]  = df_cmdr.apply(get_card_roles, axis=1)
+# frozensets: immutable, hashable label sets (exploded into slices below).
+def _role_rows(records):
+    return [frozenset(get_card_roles(r) or ()) for r in records]
 
-# --- Feature flags ---
-feature_funcs = {
-    "is_land": is_land,
-    "is_ramp": is_ramp,
-    "is_card_draw": is_card_draw,
-    "is_board_wipe": is_board_wipe,
-    "is_removal": is_removal,
-    "is_game_changer": is_game_changer,
-    "is_mass_land_denial": is_mass_land_denial,
-    "is_extra_turn": is_extra_turn,
-    "is_nonland_tutor": is_nonland_tutor,
-    "is_permanent_card": is_permanent_card,
-    "has_persistent_output": has_persistent_output,
-}
-
-for col, func in feature_funcs.items():
-    df_cmdr[col] = df_cmdr.apply(func, axis=1)
-
-df_cmdr["persistence_score"] = df_cmdr.apply(persistence_score, axis=1)
-
-def summarize_slice(df_slice: pd.DataFrame, label: str, kind: str) -> Dict[str, Any]:
+def label_roles(df: pd.DataFrame, workers: int | None = None):
     """
-    Summarize a subset of cards (by theme/role/etc.).
-    kind = "theme", "role", or "theme+role" just for labeling.
+    Role set per row, split across `workers` processes (default: one per
+    CPU). Only forked workers are used: this is a flat script, and a
+    spawned worker (the Windows default) would re-run it top to bottom on
+    import, so without fork the rows are labelled in-process.
     """
-    n = len(df_slice)
-    if n == 0:
-        return {}
+    records = df.to_dict("records")
+    n = len(records)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers <= 1 or n < 2000 or "fork" not in multiprocessing.get_all_start_methods():
+        return _role_rows(records)
+    # map() yields chunks in order, so labels line up with df's rows
+    chunksize = max(1, n // (workers * 8))
+    chunks = [records[i:i + chunksize] for i in range(0, n, chunksize)]
+    ctx = multiprocessing.get_context("fork")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=ctx) as pool:
+        return list(chain.from_iterable(pool.map(_role_rows, chunks)))
+
+# Themes are all substring checks against fixed phrase lists, so they run
+# column-wise; roles stay per row (measured: one pandas contains pass per
+# phrase is slower than get_card_roles' plain `in` tests).
+df_cmdr["themes"] = detect_card_themes_bulk(df_cmdr).map(frozenset)
+df_cmdr["roles"]  = label_roles(df_cmdr)
 
-    cmc = pd.to_numeric(df_slice["cmc"], errors="coerce").fillna(0.0)
+# --- Feature flags ---
+# Vectorized over the whole frame (same results as applying each
+# card_features detector row by row), and memoized between runs: flags are
+# keyed by a hash of the detector inputs, and the whole cache is dropped
+# whenever card_features.py itself changes.
+FEATURE_CACHE = "card_features_cache.parquet"
+FEATURE_INPUTS = ["oracle_text", "type_line", "cmc"]
+
+def cached_feature_columns(df: pd.DataFrame) -> pd.DataFrame:
+    detector_sig = hashlib.sha1(Path(card_features.__file__).read_bytes()).hexdigest()
+    keys = pd.util.hash_pandas_object(df[FEATURE_INPUTS], index=False).to_numpy()
+
+    cache = None
+    if os.path.exists(FEATURE_CACHE):
+        cache = pd.read_parquet(FEATURE_CACHE)
+        if cache.attrs.get("detector_sig") != detector_sig:
+            cache = None
+
+    if cache is None:
+        flags = pd.DataFrame(feature_columns(df), index=df.index)
+    else:
+        flags = cache.reindex(keys).set_axis(df.index)
+        fresh = flags.isna().any(axis=1).to_numpy()
+        if fresh.any():
+            # only new/changed cards go through the detectors
+            computed = pd.DataFrame(feature_columns(df[fresh]), index=df.index[fresh])
+            hits = flags[~fresh].astype(computed.dtypes.to_dict())
+            flags = pd.concat([hits, computed]).loc[df.index]
+        print(f"Feature cache: {int((~fresh).sum())} hits, {int(fresh.sum())} recomputed")
+
+    stored = flags.set_axis(keys)
+    stored = stored[~stored.index.duplicated()]
+    stored.attrs["detector_sig"] = detector_sig
+    stored.to_parquet(FEATURE_CACHE)
+    return flags
+
+for col, values in cached_feature_columns(df_cmdr).items():
+    df_cmdr[col] = values
+
+def slice_measures(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Per-card numeric/bool columns that the slice statistics aggregate over.
+    Built once for the whole table and then grouped by theme/role.
+    """
+    cmc = df["cmc"]
 
-    type_lines = df_slice["type_line"].fillna("").str.lower()
+    type_lines = df["_type_lc"]
     inst_mask  = type_lines.str.contains("instant")
     sorc_mask  = type_lines.str.contains("sorcery")
-    creature_mask = type_lines.str.contains("creature")
-    # “Permanent” = not instant/sorcery
-    perm_mask  = ~(inst_mask | sorc_mask)
 
-    persistence = df_slice.get("persistence_score")
+    persistence = df.get("persistence_score")
     if persistence is not None:
         persistence = persistence.fillna(0).astype(float)
     else:
-        persistence = pd.Series([0.0] * n, index=df_slice.index)
+        persistence = pd.Series(0.0, index=df.index)
+
+    edh_valid = df.get("edhrec_rank")
+    if edh_valid is None:
+        edh_valid = pd.Series(float("nan"), index=df.index)
+
+    measures = pd.DataFrame({
+        "cmc": cmc,
+        "cheap": cmc <= 2,
+        "heavy": cmc >= 6,
+        "instant": inst_mask,
+        "sorcery": sorc_mask,
+        "creature": type_lines.str.contains("creature"),
+        # “Permanent” = not instant/sorcery
+        "permanent": ~(inst_mask | sorc_mask),
+        "persistence": persistence,
+        "edh": edh_valid,
+    }, index=df.index)
 
-    edh = df_slice.get("edhrec_rank")
-    if edh is not None:
-        # some cards may have NaN or None – ignore in medians
-        edh_valid = pd.to_numeric(edh, errors="coerce")
-    else:
-        edh_valid = pd.Series([float("nan")] * n, index=df_slice.index)
+    # --- General feature coverage (this is the important new bit) ---
+    # Any boolean-ish feature column like is_ramp, is_card_draw, has_persistent_output, etc.
+    # feature_columns already yields plain bool columns, so no per-slice casting.
+    for col in df.columns:
+        if col.startswith("is_") or col.startswith("has_"):
+            measures[col] = df[col]
 
-    stats: Dict[str, Any] = {
-        "label": label,
+    return measures
+
+def summarize_slices(measures: pd.DataFrame, by, kind: str, min_count: int = 50) -> pd.DataFrame:
+    """
+    Summarize every slice of cards at once (by theme/role/etc.).
+    `measures` is slice_measures() exploded to one row per (card, label);
+    `by` is the label column(s). Slices under min_count cards are dropped.
+    kind = "theme", "role", or "theme+role" just for labeling.
+    """
+    g = measures.groupby(by, sort=True)
+    count = g.size()
+    keep = count >= min_count
+    if not keep.any():
+        return pd.DataFrame()
+
+    def agg(col, how, *args):
+        return getattr(g[col], how)(*args)[keep]
+
+    labels = count.index[keep]
+    if isinstance(labels, pd.MultiIndex):
+        labels = ["__".join(parts) for parts in labels]
+
+    edh_any = g["edh"].count()[keep] > 0
+    stats = {
+        "label": list(labels),
         "kind": kind,
-        "count": n,
-        "cmc_mean": float(cmc.mean()),
-        "cmc_median": float(cmc.median()),
-        "cmc_p25": float(cmc.quantile(0.25)),
-        "cmc_p75": float(cmc.quantile(0.75)),
-        "cmc_std": float(cmc.std(ddof=0)),
-        "cheap_frac_<=2": float((cmc <= 2).mean()),
-        "heavy_frac_>=6": float((cmc >= 6).mean()),
-        "instant_frac": float(inst_mask.mean()),
-        "sorcery_frac": float(sorc_mask.mean()),
-        "creature_frac": float(creature_mask.mean()),
-        "permanent_frac": float(perm_mask.mean()),
-        "persistence_mean": float(persistence.mean()),
-        "persistence_median": float(persistence.median()),
-        "edhrec_median": float(edh_valid.median()) if edh_valid.notna().any() else None,
-        "edhrec_p25": float(edh_valid.quantile(0.25)) if edh_valid.notna().any() else None,
-        "edhrec_p75": float(edh_valid.quantile(0.75)) if edh_valid.notna().any() else None,
+        "count": count[keep],
+        "cmc_mean": agg("cmc", "mean"),
+        "cmc_median": agg("cmc", "median"),
+        "cmc_p25": agg("cmc", "quantile", 0.25),
+        "cmc_p75": agg("cmc", "quantile", 0.75),
+        "cmc_std": agg("cmc", "std", 0),
+        "cheap_frac_<=2": agg("cheap", "mean"),
+        "heavy_frac_>=6": agg("heavy", "mean"),
+        "instant_frac": agg("instant", "mean"),
+        "sorcery_frac": agg("sorcery", "mean"),
+        "creature_frac": agg("creature", "mean"),
+        "permanent_frac": agg("permanent", "mean"),
+        "persistence_mean": agg("persistence", "mean"),
+        "persistence_median": agg("persistence", "median"),
+        "edhrec_median": agg("edh", "median").where(edh_any),
+        "edhrec_p25": agg("edh", "quantile", 0.25).where(edh_any),
+        "edhrec_p75": agg("edh", "quantile", 0.75).where(edh_any),
     }
 
-    # --- General feature coverage (this is the important new bit) ---
-    # Any boolean-ish feature column like is_ramp, is_card_draw, has_persistent_output, etc.
     feature_cols = [
-        c for c in df_slice.columns
+        c for c in measures.columns
         if c.startswith("is_") or c.startswith("has_")
     ]
-
     for col in feature_cols:
-        # cast to bool to be safe (some may be 0/1 or NaN)
-        bool_series = df_slice[col].fillna(False).astype(bool)
-        stats[f"{col}_frac"] = float(bool_series.mean())
-        stats[f"{col}_count"] = int(bool_series.sum())
+        stats[f"{col}_frac"] = agg(col, "mean")
+        stats[f"{col}_count"] = agg(col, "sum")
 
-    return stats
+    return pd.DataFrame({k: v.to_numpy() if isinstance(v, pd.Series) else v for k, v in stats.items()})
 
 def speed_bucket(z: float) -> str:
     if z <= -0.75:
@@ -132,54 +236,33 @@ def speed_bucket(z: float) -> str:
         return "slow"
     return "midrange"
 
-def _collect_labels(series):
-    labels = set()
-    for s in series:
-        if not s:
-            continue
-        for x in s:
-            labels.add(x)
-    return sorted(labels)
-
-all_themes = _collect_labels(df_cmdr["themes"])
-all_roles  = _collect_labels(df_cmdr["roles"])
-
-summary_rows = []
-
-# --- Per-theme stats ---
-for theme in all_themes:
-    mask = df_cmdr["themes"].apply(lambda ts: theme in (ts or set()))
-    slice_df = df_cmdr[mask]
-    if len(slice_df) < 50:
-        continue  # ignore tiny sample sizes for now
-    summary_rows.append(summarize_slice(slice_df, label=theme, kind="theme"))
-
-# --- Per-role stats ---
-for role in all_roles:
-    mask = df_cmdr["roles"].apply(lambda rs: role in (rs or set()))
-    slice_df = df_cmdr[mask]
-    if len(slice_df) < 50:
-        continue
-    summary_rows.append(summarize_slice(slice_df, label=role, kind="role"))
-
-# --- Theme+role combos (the spicy part) ---
-for theme in all_themes:
-    tmask = df_cmdr["themes"].apply(lambda ts: theme in (ts or set()))
-    for role in all_roles:
-        rmask = df_cmdr["roles"].apply(lambda rs: role in (rs or set()))
-        combo_mask = tmask & rmask
-        slice_df = df_cmdr[combo_mask]
-        if len(slice_df) < 50:
-            continue  # threshold so we don't drown in noise
-        combo_label = f"{theme}__{role}"
-        summary_rows.append(summarize_slice(slice_df, label=combo_label, kind="theme+role"))
-
-df_slices = pd.DataFrame(summary_rows)
+measures = slice_measures(df_cmdr)
+
+# One row per (card, theme), (card, role) and (card, theme, role); cards
+# with an empty label set drop out here.
+card_themes = df_cmdr["themes"].explode().dropna().rename("theme")
+card_roles  = df_cmdr["roles"].explode().dropna().rename("role")
+card_pairs  = pd.merge(card_themes, card_roles, left_index=True, right_index=True)
+
+df_slices = pd.concat([
+    # --- Per-theme stats ---
+    summarize_slices(measures.join(card_themes, how="inner"), "theme", kind="theme"),
+    # --- Per-role stats ---
+    summarize_slices(measures.join(card_roles, how="inner"), "role", kind="role"),
+    # --- Theme+role combos (the spicy part) ---
+    summarize_slices(measures.join(card_pairs, how="inner"), ["theme", "role"], kind="theme+role"),
+], ignore_index=True)
+
+# Scratch columns only; keep them out of the per-card outputs below.
+df_cmdr = df_cmdr.drop(columns=list(LOWERCASE_COLUMNS))
+# pyarrow can't serialize frozenset, so the card-level outputs get plain sets.
+df_cmdr["themes"] = df_cmdr["themes"].map(set)
+df_cmdr["roles"]  = df_cmdr["roles"].map(set)
 
 # --- Global baseline for nonland spells (commander-legal) ---
 
 nonland = df_cmdr[~df_cmdr["is_land"]].copy()
-global_cmc = pd.to_numeric(nonland["cmc"], errors="coerce").fillna(0.0)
+global_cmc = nonland["cmc"]
 
 global_cmc_mean = float(global_cmc.mean())
 global_cmc_std  = float(global_cmc.std(ddof=0))  # population std
@@ -192,54 +275,47 @@ df_slices["cmc_mean_z_global"] = (
     (df_slices["cmc_mean"] - global_cmc_mean) / global_cmc_std
 )
 
-df_slices.to_parquet("theme_role_feature_summary.parquet")
-df_slices.to_csv("theme_role_feature_summary.csv", index=False)
+write_output(df_slices, "theme_role_feature_summary")
 
 print("Wrote", len(df_slices), "theme/role slices to theme_role_feature_summary.*")
 
 
 # ROLE-normalized metrics
-df_role_slices = df_slices[df_slices["kind"] == "role"].copy()
-df_role_slices = df_role_slices.rename(columns={"label": "role"})
+# Only each slice's cmc_mean / cmc_std are needed per card, so they are looked
+# up by label instead of merging every summary column onto every row (the
+# full per-slice stats stay in theme_role_feature_summary.*).
+def slice_baseline(kind: str):
+    s = df_slices[df_slices["kind"] == kind].set_index("label")
+    return s["cmc_mean"], s["cmc_std"].replace(0, float("nan"))
 
-# explode roles on the card table
-df_roles_expanded = df_cmdr.explode("roles")
-df_roles_expanded = df_roles_expanded.dropna(subset=["roles"]).copy()
-df_roles_expanded = df_roles_expanded.rename(columns={"roles": "role"})
+role_mean, role_std = slice_baseline("role")
 
-# join card -> role baseline
-df_card_role = df_roles_expanded.merge(df_role_slices, on="role", how="left")
+# explode roles on the card table
+df_card_role = df_cmdr.explode("roles").dropna(subset=["roles"])
+df_card_role = df_card_role.rename(columns={"roles": "role"})
 
 # compute card-level CMC z-score vs its role slice
-cmc_card = pd.to_numeric(df_card_role["cmc"], errors="coerce").fillna(0.0)
-cmc_mean_role = df_card_role["cmc_mean"]
-cmc_std_role  = df_card_role["cmc_std"].replace(0, pd.NA)
-
-df_card_role["cmc_z_vs_role"] = (cmc_card - cmc_mean_role) / cmc_std_role
+df_card_role["cmc_z_vs_role"] = (
+    (df_card_role["cmc"] - df_card_role["role"].map(role_mean))
+    / df_card_role["role"].map(role_std)
+)
 
 # you now have: one row per (card, role) pair with normalized CMC
-df_card_role.to_parquet("card_role_cmc_norm.parquet")
-df_card_role.to_csv("card_role_cmc_norm.csv", index=False)
+write_output(df_card_role, "card_role_cmc_norm")
 print("Wrote", len(df_card_role), "card-role rows to card_role_cmc_norm.*")
 
 # --- Card-level normalization vs theme baselines ---
 
-df_theme_slices = df_slices[df_slices["kind"] == "theme"].copy()
-df_theme_slices = df_theme_slices.rename(columns={"label": "theme"})
-
-df_themes_expanded = df_cmdr.explode("themes")
-df_themes_expanded = df_themes_expanded.dropna(subset=["themes"]).copy()
-df_themes_expanded = df_themes_expanded.rename(columns={"themes": "theme"})
+theme_mean, theme_std = slice_baseline("theme")
 
-df_card_theme = df_themes_expanded.merge(df_theme_slices, on="theme", how="left")
+df_card_theme = df_cmdr.explode("themes").dropna(subset=["themes"])
+df_card_theme = df_card_theme.rename(columns={"themes": "theme"})
 
-cmc_card_t = pd.to_numeric(df_card_theme["cmc"], errors="coerce").fillna(0.0)
-cmc_mean_theme = df_card_theme["cmc_mean"]
-cmc_std_theme  = df_card_theme["cmc_std"].replace(0, pd.NA)
-
-df_card_theme["cmc_z_vs_theme"] = (cmc_card_t - cmc_mean_theme) / cmc_std_theme
+df_card_theme["cmc_z_vs_theme"] = (
+    (df_card_theme["cmc"] - df_card_theme["theme"].map(theme_mean))
+    / df_card_theme["theme"].map(theme_std)
+)
 
-df_card_theme.to_parquet("card_theme_cmc_norm.parquet")
-df_card_theme.to_csv("card_theme_cmc_norm.csv", index=False)
+write_output(df_card_theme, "card_theme_cmc_norm")
 
 print("Wrote", len(df_card_theme), "card-theme rows to card_theme_cmc_norm.*")
\ No newline at end of file
@@ -1,4 +1,8 @@
+import sys
+
 #Dictionary
+# Phrases use ASCII apostrophes only; card text has smart quotes normalized
+# when it is ingested (downloadLibrary.py, deck_io.py).
 THEME_KEYWORDS = {
     "tokens": [
         # Core token language
@@ -11,7 +15,6 @@ THEME_KEYWORDS = {
         "artifact token",
         "enchantment token",
         "token that's a copy",
-        "token that’s a copy",
         "tokens you control",
         # Specific token types (overlaps with artifacts / lands)
         "treasure token",
@@ -266,21 +269,16 @@ THEME_KEYWORDS = {
         "all creatures get -",
         # Lock / tax effects
         "players can't cast more than one spell each turn",
-        "players can’t cast more than one spell each turn",
         "players can't draw more than one card each turn",
-        "players can’t draw more than one card each turn",
         "spells your opponents cast cost",
         "spells your opponent casts cost",
         "spells your opponents cast cost {1} more",
         "creatures your opponents control get",
         "creatures your opponents control enter the battlefield tapped",
-        "players can’t gain life",
+        "players can't gain life",
         "your opponents can't gain life",
-        "your opponents can’t gain life",
         "players can't search libraries",
-        "players can’t search libraries",
         "your opponents can't search libraries",
-        "your opponents can’t search libraries",
         "each opponent sacrifices a creature",
         "each opponent sacrifices a permanent",
         "each player sacrifices a creature",
@@ -288,17 +286,14 @@ THEME_KEYWORDS = {
         "skip your draw step",
         # Tap / stun / freeze and untap denial
         "tapped creatures don't untap",
-        "tapped creatures don’t untap",
         "skip your untap step",
         "doesn't untap during its controller's untap step",
-        "doesn’t untap during its controller’s untap step",
         "can't attack or block",
         "can't attack you or a planeswalker you control",
         "can't attack you or planeswalkers you control",
         # Repeatable upkeep / attrition triggers
         "at the beginning of each opponent's upkeep",
-        "at the beginning of each opponent’s upkeep",
-        "at the beginning of each player’s upkeep",
+        "at the beginning of each player's upkeep",
 
     ],
 
@@ -333,299 +328,257 @@ THEME_KEYWORDS = {
     ],
 }
 
-KEYWORD_THEME_OVERRIDES: dict[str, set[str]] = {
+# The phrase lists are never mutated: freeze them into tuples of interned
+# strings, so a phrase listed under several themes is a single object.
+THEME_KEYWORDS: dict[str, tuple[str, ...]] = {
+    theme: tuple(map(sys.intern, phrases)) for theme, phrases in THEME_KEYWORDS.items()
+}
+
+# (keyword, themes) pairs; built into KEYWORD_THEME_OVERRIDES below so a
+# repeated keyword is caught at import instead of silently overwriting.
+_KEYWORD_THEME_PAIRS: list[tuple[str, set[str]]] = [
     # Evergreen combat & protection
-    "deathtouch": {"control", "voltron"},
-    "defender": {"control"},
-    "double strike": {"voltron"},
-    "enchant": {"voltron", "control"},
-    "equip": {"artifacts", "voltron"},
-    "first strike": {"voltron"},
-    "flash": {"control", "spellslinger"},
-    "flying": {"voltron", "control"},
-    "haste": {"voltron"},
-    "hexproof": {"voltron", "control"},
-    "indestructible": {"voltron", "control"},
-    "intimidate": {"voltron"},
-    "landwalk": {"lands", "voltron"},
-    "lifelink": {"lifegain", "voltron"},
-    "protection": {"voltron", "control"},
-    "reach": {"control"},
-    "shroud": {"voltron", "control"},
-    "trample": {"voltron", "counters"},
-    "vigilance": {"voltron", "control"},
-    "ward": {"voltron", "control"},
+    ("deathtouch", {"control", "voltron"}),
+    ("defender", {"control"}),
+    ("double strike", {"voltron"}),
+    ("enchant", {"voltron", "control"}),
+    ("equip", {"artifacts", "voltron"}),
+    ("first strike", {"voltron"}),
+    ("flash", {"control", "spellslinger"}),
+    ("flying", {"voltron", "control"}),
+    ("haste", {"voltron"}),
+    ("hexproof", {"voltron", "control"}),
+    ("indestructible", {"voltron", "control"}),
+    ("intimidate", {"voltron"}),
+    ("landwalk", {"lands", "voltron"}),
+    ("lifelink", {"lifegain", "voltron"}),
+    ("protection", {"voltron", "control"}),
+    ("reach", {"control"}),
+    ("shroud", {"voltron", "control"}),
+    ("trample", {"voltron", "counters"}),
+    ("vigilance", {"voltron", "control"}),
+    ("ward", {"voltron", "control"}),
 
     # Old/weird combat stuff
-    "banding": {"voltron"},
-    "rampage": {"voltron"},
-    "cumulative upkeep": {"control"},
-    "flanking": {"voltron"},
-    "phasing": {"control"},
+    ("banding", {"voltron"}),
+    ("rampage", {"voltron"}),
+    ("cumulative upkeep", {"control"}),
+    ("flanking", {"voltron"}),
+    ("phasing", {"control"}),
 
     # Spell recursion / cost tweaks / spellstorm
-    "buyback": {"spellslinger", "control"},
-    "cycling": {"spellslinger", "graveyard"},
-    "echo": {"control"},
-    "kicker": {"spellslinger"},
-    "flashback": {"spellslinger", "graveyard"},
-    "madness": {"spellslinger", "graveyard"},
-    "storm": {"spellslinger", "control"},
-    "entwine": {"spellslinger"},
-    "splice": {"spellslinger"},
-    "replicate": {"spellslinger"},
-    "forecast": {"control", "spellslinger"},
-    "ripple": {"spellslinger"},
-    "split second": {"control"},
-    "suspend": {"spellslinger", "control"},
-    "vanishing": {"control"},
-    "delve": {"spellslinger", "graveyard"},
-    "conspire": {"spellslinger"},
-    "retrace": {"spellslinger", "graveyard"},
-    "cascade": {"spellslinger"},
-    "rebound": {"spellslinger"},
-    "miracle": {"spellslinger"},
-    "overload": {"spellslinger", "control"},
-    "fuse": {"spellslinger"},
-    "unddaunted": {"spellslinger"} if False else set(),  # typo guard; real one below
-    "undaunted": {"spellslinger"},
-    "assist": {"spellslinger"},
-    "jump-start": {"spellslinger", "graveyard"},
-    "surge": {"spellslinger"},
-    "escalate": {"spellslinger"},
-    "foretell": {"spellslinger", "control"},
-    "demonstrate": {"spellslinger"},
-    "plot": {"spellslinger"},
-    "spree": {"spellslinger"},
-    "freerunning": {"spellslinger", "voltron"},
+    ("buyback", {"spellslinger", "control"}),
+    ("cycling", {"spellslinger", "graveyard"}),
+    ("echo", {"control"}),
+    ("kicker", {"spellslinger"}),
+    ("flashback", {"spellslinger", "graveyard"}),
+    ("madness", {"spellslinger", "graveyard"}),
+    ("storm", {"spellslinger", "control"}),
+    ("entwine", {"spellslinger"}),
+    ("splice", {"spellslinger"}),
+    ("replicate", {"spellslinger"}),
+    ("forecast", {"control", "spellslinger"}),
+    ("ripple", {"spellslinger"}),
+    ("split second", {"control"}),
+    ("suspend", {"spellslinger", "control"}),
+    ("vanishing", {"control"}),
+    ("delve", {"spellslinger", "graveyard"}),
+    ("conspire", {"spellslinger"}),
+    ("retrace", {"spellslinger", "graveyard"}),
+    ("cascade", {"spellslinger"}),
+    ("rebound", {"spellslinger"}),
+    ("miracle", {"spellslinger"}),
+    ("overload", {"spellslinger", "control"}),
+    ("fuse", {"spellslinger"}),
+    ("undaunted", {"spellslinger"}),
+    ("assist", {"spellslinger"}),
+    ("jump-start", {"spellslinger", "graveyard"}),
+    ("surge", {"spellslinger"}),
+    ("escalate", {"spellslinger"}),
+    ("foretell", {"spellslinger", "control"}),
+    ("demonstrate", {"spellslinger"}),
+    ("plot", {"spellslinger"}),
+    ("spree", {"spellslinger"}),
+    ("freerunning", {"spellslinger", "voltron"}),
 
     # Artifacts / vehicles / equipment
-    "affinity": {"artifacts"},
-    "modular": {"artifacts", "counters"},
-    "sunburst": {"artifacts", "counters", "lands"},
-    "fortify": {"artifacts", "lands"},
-    "living weapon": {"artifacts", "tokens", "voltron"},
-    "improvise": {"artifacts", "spellslinger"},
-    "crew": {"artifacts", "voltron"},
-    "fabricate": {"artifacts", "tokens"},
-    "reconfigure": {"artifacts", "voltron"},
-    "prototype": {"artifacts"},
-    "living metal": {"artifacts", "voltron"},
-    "more than meets the eye": {"artifacts", "voltron", "spellslinger"},
-    "for mirrodin!": {"artifacts", "tokens", "voltron"},
-    "craft": {"artifacts", "graveyard"},
+    ("affinity", {"artifacts"}),
+    ("modular", {"artifacts", "counters"}),
+    ("sunburst", {"artifacts", "counters", "lands"}),
+    ("fortify", {"artifacts", "lands"}),
+    ("living weapon", {"artifacts", "tokens", "voltron"}),
+    ("improvise", {"artifacts", "spellslinger"}),
+    ("crew", {"artifacts", "voltron"}),
+    ("fabricate", {"artifacts", "tokens"}),
+    ("reconfigure", {"artifacts", "voltron"}),
+    ("prototype", {"artifacts"}),
+    ("living metal", {"artifacts", "voltron"}),
+    ("more than meets the eye", {"artifacts", "voltron", "spellslinger"}),
+    ("for mirrodin!", {"artifacts", "tokens", "voltron"}),
+    ("craft", {"artifacts", "graveyard"}),
 
     # Counters-focused mechanics
-    "amplify": {"counters"},
-    "graft": {"counters"},
-    "level up": {"counters"},
-    "evolve": {"counters"},
-    "outlast": {"counters"},
-    "mentor": {"counters", "voltron"},
-    "riot": {"counters", "voltron"},
-    "training": {"counters", "voltron"},
-    "compleated": {"counters"},
-    "backup": {"counters", "voltron"},
-    "ravenous": {"counters"},
-    "offspring": {"counters", "tokens"},
+    ("amplify", {"counters"}),
+    ("graft", {"counters"}),
+    ("level up", {"counters"}),
+    ("evolve", {"counters"}),
+    ("outlast", {"counters"}),
+    ("mentor", {"counters", "voltron"}),
+    ("riot", {"counters", "voltron"}),
+    ("training", {"counters", "voltron"}),
+    ("compleated", {"counters"}),
+    ("backup", {"counters", "voltron"}),
+    ("ravenous", {"counters"}),
+    ("offspring", {"counters", "tokens"}),
 
     # Lifegain / drain
-    "lifelink": {"lifegain", "voltron"},
-    "absorb": {"lifegain", "control"},
-    "extort": {"lifegain", "control"},
+    ("absorb", {"lifegain", "control"}),
+    ("extort", {"lifegain", "control"}),
 
     # Lands / land-based
-    "landwalk": {"lands", "voltron"},
-    "awaken": {"lands", "counters"},
-    "landcycling": {"lands", "graveyard"},
-    "basic landcycling": {"lands", "graveyard"},
-    "domain": {"lands", "control"},
+    ("awaken", {"lands", "counters"}),
+    ("landcycling", {"lands", "graveyard"}),
+    ("basic landcycling", {"lands", "graveyard"}),
+    ("domain", {"lands", "control"}),
     # (Landcycling is detected via text already in THEME_KEYWORDS)
 
     # Graveyard mechanics
-    "dredge": {"graveyard"},
-    "recover": {"graveyard"},
-    "soulshift": {"graveyard"},
-    "unearthed": set(),  # guard; real key is "unearth"
-    "unearth": {"graveyard"},
-    "persist": {"graveyard", "sacrifice", "counters"},
-    "wither": {"control", "voltron"},
-    "devour": {"sacrifice", "counters", "tokens"},
-    "undying": {"graveyard", "counters"},
-    "scavenge": {"graveyard", "counters"},
-    "soulshift": {"graveyard"},
-    "escape": {"graveyard", "spellslinger"},
-    "embalm": {"graveyard", "tokens"},
-    "eternalize": {"graveyard", "tokens"},
-    "disturb": {"graveyard", "tokens"},
-    "aftermath": {"graveyard", "spellslinger"},
-    "escape": {"graveyard", "spellslinger"},
-    "exploit": {"sacrifice", "graveyard"},
-    "casualty": {"sacrifice", "spellslinger"},
-    "bargain": {"sacrifice", "spellslinger"},
-    "craft": {"graveyard", "artifacts"},
-    "impending": {"control", "spellslinger"},
-    "surveil": {"graveyard", "control"},
-    "connive": {"graveyard", "counters"},  
-    "descend": {"graveyard"},              
-    "craft": {"graveyard", "artifacts"}, 
+    ("dredge", {"graveyard"}),
+    ("recover", {"graveyard"}),
+    ("soulshift", {"graveyard"}),
+    ("unearthed", set()),  # guard; real key is "unearth"
+    ("unearth", {"graveyard"}),
+    ("persist", {"graveyard", "sacrifice", "counters"}),
+    ("wither", {"control", "voltron"}),
+    ("devour", {"sacrifice", "counters", "tokens"}),
+    ("undying", {"graveyard", "counters"}),
+    ("scavenge", {"graveyard", "counters"}),
+    ("escape", {"graveyard", "spellslinger"}),
+    ("embalm", {"graveyard", "tokens"}),
+    ("eternalize", {"graveyard", "tokens"}),
+    ("disturb", {"graveyard", "tokens"}),
+    ("aftermath", {"graveyard", "spellslinger"}),
+    ("exploit", {"sacrifice", "graveyard"}),
+    ("casualty", {"sacrifice", "spellslinger"}),
+    ("bargain", {"sacrifice", "spellslinger"}),
+    ("impending", {"control", "spellslinger"}),
+    ("surveil", {"graveyard", "control"}),
+    ("connive", {"graveyard", "counters"}),
+    ("descend", {"graveyard"}),
 
     # Sacrifice / aristocrats-adjacent
-    "exploit": {"sacrifice", "graveyard"},
-    "devour": {"sacrifice", "tokens", "counters"},
-    "champion": {"sacrifice", "graveyard"},
-    "aftermath": {"graveyard", "spellslinger"},
-    "casualty": {"sacrifice", "spellslinger"},
-    "bargain": {"sacrifice", "spellslinger"},
-    "offering": {"sacrifice", "spellslinger"},
-    "afterlife": {"tokens", "graveyard", "sacrifice"},
+    ("champion", {"sacrifice", "graveyard"}),
+    ("offering", {"sacrifice", "spellslinger"}),
+    ("afterlife", {"tokens", "graveyard", "sacrifice"}),
 
     # Tokens / go-wide / bodies
-    "myriad": {"tokens"},
-    "fabricate": {"tokens", "artifacts"},
-    "devour": {"tokens", "sacrifice", "counters"},
-    "battle cry": {"tokens", "voltron"},
-    "living weapon": {"tokens", "artifacts", "voltron"},
-    "embalm": {"tokens", "graveyard"},
-    "eternalize": {"tokens", "graveyard"},
-    "encore": {"tokens", "graveyard"},
-    "afterlife": {"tokens", "graveyard", "sacrifice"},
-    "squad": {"tokens"},
-    "saddle": {"tokens", "voltron"},
-    "gift": {"tokens", "lifegain"},  # set-specific, but fits “gifts with bodies”
-    "offspring": {"tokens", "counters"},
-    "convoke": {"tokens", "spellslinger"},
-    "battalion": {"tokens", "voltron"},
-    "pack tactics": {"tokens", "voltron"},
-    "celebrate": {"tokens"},
+    ("myriad", {"tokens"}),
+    ("battle cry", {"tokens", "voltron"}),
+    ("encore", {"tokens", "graveyard"}),
+    ("squad", {"tokens"}),
+    ("saddle", {"tokens", "voltron"}),
+    ("gift", {"tokens", "lifegain"}),  # set-specific, but fits “gifts with bodies”
+    ("convoke", {"tokens", "spellslinger"}),
+    ("battalion", {"tokens", "voltron"}),
+    ("pack tactics", {"tokens", "voltron"}),
+    ("celebrate", {"tokens"}),
 
     # Voltron / tall strategy
-    "double strike": {"voltron"},
-    "first strike": {"voltron"},
-    "haste": {"voltron"},
-    "flying": {"voltron", "control"},
-    "trample": {"voltron", "counters"},
-    "vigilance": {"voltron", "control"},
-    "intimidate": {"voltron"},
-    "bushido": {"voltron"},
-    "bloodthirst": {"counters", "voltron"},
-    "exalted": {"voltron"},
-    "annihilator": {"voltron", "control"},
-    "umbra armor": {"voltron"},
-    "infect": {"voltron", "counters"},
-    "battle cry": {"voltron", "tokens"},
-    "soulbond": {"voltron"},
-    "bestow": {"voltron"},
-    "tribute": {"voltron", "counters"},
-    "dethrone": {"voltron"},
-    "prowess": {"spellslinger"},  # spellslinger wincon, but often on creatures
-    "dash": {"voltron"},
-    "menace": {"voltron"},
-    "renown": {"voltron"},
-    "melee": {"voltron"},
-    "crew": {"voltron", "artifacts"},
-    "partner": {"voltron", "control"},
-    "mentor": {"voltron", "counters"},
-    "riot": {"voltron", "counters"},
-    "boast": {"voltron"},
-    "daybound": {"control"},
-    "nightbound": {"control"},
-    "training": {"voltron", "counters"},
-    "reconfigure": {"voltron", "artifacts"},
-    "blitz": {"voltron", "graveyard"},
-    "enlist": {"voltron"},
-    "living metal": {"voltron", "artifacts"},
-    "more than meets the eye": {"voltron", "artifacts", "spellslinger"},
-    "for mirrodin!": {"voltron", "artifacts", "tokens"},
-    "toxic": {"voltron", "control"},
-    "backup": {"voltron", "counters"},
-    "disguise": {"voltron", "control"},
+    ("bushido", {"voltron"}),
+    ("bloodthirst", {"counters", "voltron"}),
+    ("exalted", {"voltron"}),
+    ("annihilator", {"voltron", "control"}),
+    ("umbra armor", {"voltron"}),
+    ("infect", {"voltron", "counters"}),
+    ("soulbond", {"voltron"}),
+    ("bestow", {"voltron"}),
+    ("tribute", {"voltron", "counters"}),
+    ("dethrone", {"voltron"}),
+    ("prowess", {"spellslinger"}),  # spellslinger wincon, but often on creatures
+    ("dash", {"voltron"}),
+    ("menace", {"voltron"}),
+    ("renown", {"voltron"}),
+    ("melee", {"voltron"}),
+    ("partner", {"voltron", "control"}),
+    ("boast", {"voltron"}),
+    ("daybound", {"control"}),
+    ("nightbound", {"control"}),
+    ("blitz", {"voltron", "graveyard"}),
+    ("enlist", {"voltron"}),
+    ("toxic", {"voltron", "control"}),
+    ("disguise", {"voltron", "control"}),
 
     # Control / prison / disruption
-    "deathtouch": {"control", "voltron"},
-    "defender": {"control"},
-    "flash": {"control", "spellslinger"},
-    "flying": {"control", "voltron"},
-    "hexproof": {"control", "voltron"},
-    "indestructible": {"control", "voltron"},
-    "ward": {"control", "voltron"},
-    "cumulative upkeep": {"control"},
-    "phasing": {"control"},
-    "storm": {"control", "spellslinger"},
-    "split second": {"control"},
-    "suspend": {"control", "spellslinger"},
-    "vanishing": {"control"},
-    "echo": {"control"},
-    "ninjutsu": {"control", "voltron"},
-    "epic": {"control", "spellslinger"},
-    "haunt": {"control", "graveyard"},
-    "shadow": {"voltron"},
-    "ascend": {"control"},
-    "companion": {"control"},
-    "afflict": {"control"},
-    "hidden agenda": {"control"},
-    "daybound": {"control"},
-    "nightbound": {"control"},
-    "space sculptor": {"control"},
-    "visit": {"control"},
-    "solved": {"control", "spellslinger"},
-    "impending": {"control", "spellslinger"},
+    ("ninjutsu", {"control", "voltron"}),
+    ("epic", {"control", "spellslinger"}),
+    ("haunt", {"control", "graveyard"}),
+    ("shadow", {"voltron"}),
+    ("ascend", {"control"}),
+    ("companion", {"control"}),
+    ("afflict", {"control"}),
+    ("hidden agenda", {"control"}),
+    ("space sculptor", {"control"}),
+    ("visit", {"control"}),
+    ("solved", {"control", "spellslinger"}),
 
     # Misc / oddballs that still get *some* theme
-    "horsemanship": {"voltron"},
-    "fading": {"control"},
-    "fear": {"voltron"},
-    "morph": {"control"},
-    "provoke": {"voltron"},
-    "bushido": {"voltron"},
-    "soulshift": {"graveyard"},
-    "offering": {"sacrifice", "spellslinger"},
-    "ninjutsu": {"voltron", "control"},
-    "epic": {"spellslinger", "control"},
-    "bloodthirst": {"counters", "voltron"},
-    "haunt": {"graveyard", "control"},
-    "transmute": {"spellslinger", "control"},
-    "absorb": {"lifegain", "control"},
-    "poisonous": {"voltron", "control"},
-    "transfigure": {"spellslinger", "graveyard"},
-    "changeling": {"control"},  # really tribal glue; treat as generic
-    "evoke": {"graveyard", "spellslinger"},
-    "hideaway": {"control"},
-    "prowl": {"voltron"},
-    "reinforce": {"counters"},
-    "devour": {"sacrifice", "tokens", "counters"},
-    "exalted": {"voltron"},
-    "annihilator": {"voltron", "control"},
-    "soulbond": {"voltron"},
-    "mutate": {"counters", "graveyard"},
-    "encore": {"tokens", "graveyard"},
-    "skulk": {"voltron"},
-    "emerge": {"graveyard", "artifacts"},
-    "partner": {"voltron", "control"},
-    "ascend": {"control"},
-    "escape": {"graveyard", "spellslinger"},
-    "companion": {"control"},
-    "mutate": {"counters", "graveyard"},
-    "boast": {"voltron"},
-    "decayed": {"tokens", "graveyard"},
-    "cleave": {"spellslinger"},
-    "read ahead": {"control"},
-    "squad": {"tokens"},
-    "space sculptor": {"control"},
-    "visit": {"control"},
-    "saddle": {"tokens", "voltron"},
+    ("horsemanship", {"voltron"}),
+    ("fading", {"control"}),
+    ("fear", {"voltron"}),
+    ("morph", {"control"}),
+    ("provoke", {"voltron"}),
+    ("transmute", {"spellslinger", "control"}),
+    ("poisonous", {"voltron", "control"}),
+    ("transfigure", {"spellslinger", "graveyard"}),
+    ("changeling", {"control"}),  # really tribal glue; treat as generic
+    ("evoke", {"graveyard", "spellslinger"}),
+    ("hideaway", {"control"}),
+    ("prowl", {"voltron"}),
+    ("reinforce", {"counters"}),
+    ("mutate", {"counters", "graveyard"}),
+    ("skulk", {"voltron"}),
+    ("emerge", {"graveyard", "artifacts"}),
+    ("decayed", {"tokens", "graveyard"}),
+    ("cleave", {"spellslinger"}),
+    ("read ahead", {"control"}),
+]
+
+assert len({kw for kw, _ in _KEYWORD_THEME_PAIRS}) == len(_KEYWORD_THEME_PAIRS), \
+    "duplicate keyword in _KEYWORD_THEME_PAIRS"
+
+# Most keywords share one of a handful of theme sets; intern them so equal
+# sets are a single frozenset object.
+_theme_intern: dict[frozenset[str], frozenset[str]] = {}
+
+def _fs(*names: str) -> frozenset[str]:
+    key = frozenset(names)
+    return _theme_intern.setdefault(key, key)
+
+KEYWORD_THEME_OVERRIDES: dict[str, frozenset[str]] = {
+    kw: _fs(*themes) for kw, themes in _KEYWORD_THEME_PAIRS
 }
 
-BASIC_LAND_NAMES = {
+# THEME_KEYWORDS inverted: phrase -> every theme listing it ("treasure token"
+# is both tokens and artifacts), so one pass over the phrases yields themes.
+def _invert_theme_keywords() -> dict[str, frozenset[str]]:
+    inverted: dict[str, list[str]] = {}
+    for theme, phrases in THEME_KEYWORDS.items():
+        for phrase in phrases:
+            inverted.setdefault(phrase, []).append(theme)
+    return {phrase: _fs(*themes) for phrase, themes in inverted.items()}
+
+PHRASE_TO_THEMES: dict[str, frozenset[str]] = _invert_theme_keywords()
+
+BASIC_LAND_NAMES: frozenset[str] = frozenset({
     "Plains",
     "Island",
     "Swamp",
     "Mountain",
     "Forest",
     "Wastes",
-}
+})
 
-MASS_LAND_DENIAL_NAMES = {
+MASS_LAND_DENIAL_NAMES: frozenset[str] = frozenset({
     "Armageddon",
     "Ravages of War",
     "Ruination",
@@ -634,13 +587,13 @@ MASS_LAND_DENIAL_NAMES = {
     "Static Orb",
     "Blood Moon",
     "Magus of the Moon",
-}
+})
 
-COMBO_FLAG_CARDS = {
+COMBO_FLAG_CARDS: frozenset[str] = frozenset({
     "Ad Nauseam",
     "Underworld Breach",
     "Thassa's Oracle",
-}
+})
 
 KEYWORD_GLOSSARY: dict[str, dict[str, str]] = {
     # Symbols / costs
@@ -822,4 +775,4 @@ KEYWORD_GLOSSARY: dict[str, dict[str, str]] = {
     "you": {
         "kind": "rules_term",
     },
-}
\ No newline at end of file
+}
@@ -5,10 +5,14 @@
 # Modules
 import requests
 import pandas as pd
+import sys
 import time
 from collections import defaultdict
+from functools import lru_cache
 
 #Dictionary
+# Phrases use ASCII apostrophes only; fetched card text goes through
+# _QUOTE_TBL below before any matching.
 THEME_KEYWORDS = {
     "tokens": [
         # Core token language
@@ -21,7 +25,6 @@ THEME_KEYWORDS = {
         "artifact token",
         "enchantment token",
         "token that's a copy",
-        "token that’s a copy",
         "tokens you control",
         # Specific token types (overlaps with artifacts / lands)
         "treasure token",
@@ -276,9 +279,7 @@ THEME_KEYWORDS = {
         "all creatures get -",
         # Lock / tax effects
         "players can't cast more than one spell each turn",
-        "players can’t cast more than one spell each turn",
         "players can't draw more than one card each turn",
-        "players can’t draw more than one card each turn",
         "spells your opponents cast cost",
         "spells your opponent casts cost",
         "spells your opponents cast cost {1} more",
@@ -286,17 +287,14 @@ THEME_KEYWORDS = {
         "creatures your opponents control enter the battlefield tapped",
         # Tap / stun / freeze and untap denial
         "tapped creatures don't untap",
-        "tapped creatures don’t untap",
         "skip your untap step",
         "doesn't untap during its controller's untap step",
-        "doesn’t untap during its controller’s untap step",
         "can't attack or block",
         "can't attack you or a planeswalker you control",
         "can't attack you or planeswalkers you control",
         # Repeatable upkeep / attrition triggers
         "at the beginning of each opponent's upkeep",
-        "at the beginning of each opponent’s upkeep",
-        "at the beginning of each player’s upkeep",
+        "at the beginning of each player's upkeep",
     ],
 
     "voltron": [
@@ -330,291 +328,236 @@ THEME_KEYWORDS = {
     ],
 }
 
-KEYWORD_THEME_OVERRIDES: dict[str, set[str]] = {
+# The phrase lists are never mutated: freeze them into tuples of interned
+# strings, so a phrase listed under several themes is a single object.
+THEME_KEYWORDS: dict[str, tuple[str, ...]] = {
+    theme: tuple(map(sys.intern, phrases)) for theme, phrases in THEME_KEYWORDS.items()
+}
+
+# (keyword, themes) pairs; built into KEYWORD_THEME_OVERRIDES below so a
+# repeated keyword is caught at import instead of silently overwriting.
+_KEYWORD_THEME_PAIRS: list[tuple[str, set[str]]] = [
     # Evergreen combat & protection
-    "deathtouch": {"control", "voltron"},
-    "defender": {"control"},
-    "double strike": {"voltron"},
-    "enchant": {"voltron", "control"},
-    "equip": {"artifacts", "voltron"},
-    "first strike": {"voltron"},
-    "flash": {"control", "spellslinger"},
-    "flying": {"voltron", "control"},
-    "haste": {"voltron"},
-    "hexproof": {"voltron", "control"},
-    "indestructible": {"voltron", "control"},
-    "intimidate": {"voltron"},
-    "landwalk": {"lands", "voltron"},
-    "lifelink": {"lifegain", "voltron"},
-    "protection": {"voltron", "control"},
-    "reach": {"control"},
-    "shroud": {"voltron", "control"},
-    "trample": {"voltron", "counters"},
-    "vigilance": {"voltron", "control"},
-    "ward": {"voltron", "control"},
+    ("deathtouch", {"control", "voltron"}),
+    ("defender", {"control"}),
+    ("double strike", {"voltron"}),
+    ("enchant", {"voltron", "control"}),
+    ("equip", {"artifacts", "voltron"}),
+    ("first strike", {"voltron"}),
+    ("flash", {"control", "spellslinger"}),
+    ("flying", {"voltron", "control"}),
+    ("haste", {"voltron"}),
+    ("hexproof", {"voltron", "control"}),
+    ("indestructible", {"voltron", "control"}),
+    ("intimidate", {"voltron"}),
+    ("landwalk", {"lands", "voltron"}),
+    ("lifelink", {"lifegain", "voltron"}),
+    ("protection", {"voltron", "control"}),
+    ("reach", {"control"}),
+    ("shroud", {"voltron", "control"}),
+    ("trample", {"voltron", "counters"}),
+    ("vigilance", {"voltron", "control"}),
+    ("ward", {"voltron", "control"}),
 
     # Old/weird combat stuff
-    "banding": {"voltron"},
-    "rampage": {"voltron"},
-    "cumulative upkeep": {"control"},
-    "flanking": {"voltron"},
-    "phasing": {"control"},
+    ("banding", {"voltron"}),
+    ("rampage", {"voltron"}),
+    ("cumulative upkeep", {"control"}),
+    ("flanking", {"voltron"}),
+    ("phasing", {"control"}),
 
     # Spell recursion / cost tweaks / spellstorm
-    "buyback": {"spellslinger", "control"},
-    "cycling": {"spellslinger", "graveyard"},
-    "echo": {"control"},
-    "kicker": {"spellslinger"},
-    "flashback": {"spellslinger", "graveyard"},
-    "madness": {"spellslinger", "graveyard"},
-    "storm": {"spellslinger", "control"},
-    "entwine": {"spellslinger"},
-    "splice": {"spellslinger"},
-    "replicate": {"spellslinger"},
-    "forecast": {"control", "spellslinger"},
-    "ripple": {"spellslinger"},
-    "split second": {"control"},
-    "suspend": {"spellslinger", "control"},
-    "vanishing": {"control"},
-    "delve": {"spellslinger", "graveyard"},
-    "conspire": {"spellslinger"},
-    "retrace": {"spellslinger", "graveyard"},
-    "cascade": {"spellslinger"},
-    "rebound": {"spellslinger"},
-    "miracle": {"spellslinger"},
-    "overload": {"spellslinger", "control"},
-    "fuse": {"spellslinger"},
-    "unddaunted": {"spellslinger"} if False else set(),  # typo guard; real one below
-    "undaunted": {"spellslinger"},
-    "assist": {"spellslinger"},
-    "jump-start": {"spellslinger", "graveyard"},
-    "surge": {"spellslinger"},
-    "escalate": {"spellslinger"},
-    "foretell": {"spellslinger", "control"},
-    "demonstrate": {"spellslinger"},
-    "plot": {"spellslinger"},
-    "spree": {"spellslinger"},
-    "freerunning": {"spellslinger", "voltron"},
+    ("buyback", {"spellslinger", "control"}),
+    ("cycling", {"spellslinger", "graveyard"}),
+    ("echo", {"control"}),
+    ("kicker", {"spellslinger"}),
+    ("flashback", {"spellslinger", "graveyard"}),
+    ("madness", {"spellslinger", "graveyard"}),
+    ("storm", {"spellslinger", "control"}),
+    ("entwine", {"spellslinger"}),
+    ("splice", {"spellslinger"}),
+    ("replicate", {"spellslinger"}),
+    ("forecast", {"control", "spellslinger"}),
+    ("ripple", {"spellslinger"}),
+    ("split second", {"control"}),
+    ("suspend", {"spellslinger", "control"}),
+    ("vanishing", {"control"}),
+    ("delve", {"spellslinger", "graveyard"}),
+    ("conspire", {"spellslinger"}),
+    ("retrace", {"spellslinger", "graveyard"}),
+    ("cascade", {"spellslinger"}),
+    ("rebound", {"spellslinger"}),
+    ("miracle", {"spellslinger"}),
+    ("overload", {"spellslinger", "control"}),
+    ("fuse", {"spellslinger"}),
+    ("undaunted", {"spellslinger"}),
+    ("assist", {"spellslinger"}),
+    ("jump-start", {"spellslinger", "graveyard"}),
+    ("surge", {"spellslinger"}),
+    ("escalate", {"spellslinger"}),
+    ("foretell", {"spellslinger", "control"}),
+    ("demonstrate", {"spellslinger"}),
+    ("plot", {"spellslinger"}),
+    ("spree", {"spellslinger"}),
+    ("freerunning", {"spellslinger", "voltron"}),
 
     # Artifacts / vehicles / equipment
-    "affinity": {"artifacts"},
-    "modular": {"artifacts", "counters"},
-    "sunburst": {"artifacts", "counters", "lands"},
-    "fortify": {"artifacts", "lands"},
-    "living weapon": {"artifacts", "tokens", "voltron"},
-    "improvise": {"artifacts", "spellslinger"},
-    "crew": {"artifacts", "voltron"},
-    "fabricate": {"artifacts", "tokens"},
-    "reconfigure": {"artifacts", "voltron"},
-    "prototype": {"artifacts"},
-    "living metal": {"artifacts", "voltron"},
-    "more than meets the eye": {"artifacts", "voltron", "spellslinger"},
-    "for mirrodin!": {"artifacts", "tokens", "voltron"},
-    "craft": {"artifacts", "graveyard"},
+    ("affinity", {"artifacts"}),
+    ("modular", {"artifacts", "counters"}),
+    ("sunburst", {"artifacts", "counters", "lands"}),
+    ("fortify", {"artifacts", "lands"}),
+    ("living weapon", {"artifacts", "tokens", "voltron"}),
+    ("improvise", {"artifacts", "spellslinger"}),
+    ("crew", {"artifacts", "voltron"}),
+    ("fabricate", {"artifacts", "tokens"}),
+    ("reconfigure", {"artifacts", "voltron"}),
+    ("prototype", {"artifacts"}),
+    ("living metal", {"artifacts", "voltron"}),
+    ("more than meets the eye", {"artifacts", "voltron", "spellslinger"}),
+    ("for mirrodin!", {"artifacts", "tokens", "voltron"}),
+    ("craft", {"artifacts", "graveyard"}),
 
     # Counters-focused mechanics
-    "amplify": {"counters"},
-    "graft": {"counters"},
-    "sunburst": {"counters", "artifacts", "lands"},
-    "level up": {"counters"},
-    "evolve": {"counters"},
-    "outlast": {"counters"},
-    "mentor": {"counters", "voltron"},
-    "riot": {"counters", "voltron"},
-    "training": {"counters", "voltron"},
-    "compleated": {"counters"},
-    "backup": {"counters", "voltron"},
-    "ravenous": {"counters"},
-    "offspring": {"counters", "tokens"},
+    ("amplify", {"counters"}),
+    ("graft", {"counters"}),
+    ("level up", {"counters"}),
+    ("evolve", {"counters"}),
+    ("outlast", {"counters"}),
+    ("mentor", {"counters", "voltron"}),
+    ("riot", {"counters", "voltron"}),
+    ("training", {"counters", "voltron"}),
+    ("compleated", {"counters"}),
+    ("backup", {"counters", "voltron"}),
+    ("ravenous", {"counters"}),
+    ("offspring", {"counters", "tokens"}),
 
     # Lifegain / drain
-    "lifelink": {"lifegain", "voltron"},
-    "absorb": {"lifegain", "control"},
-    "extort": {"lifegain", "control"},
+    ("absorb", {"lifegain", "control"}),
+    ("extort", {"lifegain", "control"}),
 
     # Lands / land-based
-    "landwalk": {"lands", "voltron"},
-    "sunburst": {"lands", "artifacts", "counters"},
-    "awaken": {"lands", "counters"},
+    ("awaken", {"lands", "counters"}),
     # (Landcycling is detected via text already in THEME_KEYWORDS)
 
     # Graveyard mechanics
-    "dredge": {"graveyard"},
-    "recover": {"graveyard"},
-    "soulshift": {"graveyard"},
-    "unearthed": set(),  # guard; real key is "unearth"
-    "unearth": {"graveyard"},
-    "persist": {"graveyard", "sacrifice", "counters"},
-    "wither": {"control", "voltron"},
-    "devour": {"sacrifice", "counters", "tokens"},
-    "undying": {"graveyard", "counters"},
-    "scavenge": {"graveyard", "counters"},
-    "soulshift": {"graveyard"},
-    "escape": {"graveyard", "spellslinger"},
-    "embalm": {"graveyard", "tokens"},
-    "eternalize": {"graveyard", "tokens"},
-    "disturb": {"graveyard", "tokens"},
-    "aftermath": {"graveyard", "spellslinger"},
-    "escape": {"graveyard", "spellslinger"},
-    "exploit": {"sacrifice", "graveyard"},
-    "casualty": {"sacrifice", "spellslinger"},
-    "bargain": {"sacrifice", "spellslinger"},
-    "craft": {"graveyard", "artifacts"},
-    "impending": {"control", "spellslinger"},
+    ("dredge", {"graveyard"}),
+    ("recover", {"graveyard"}),
+    ("soulshift", {"graveyard"}),
+    ("unearthed", set()),  # guard; real key is "unearth"
+    ("unearth", {"graveyard"}),
+    ("persist", {"graveyard", "sacrifice", "counters"}),
+    ("wither", {"control", "voltron"}),
+    ("devour", {"sacrifice", "counters", "tokens"}),
+    ("undying", {"graveyard", "counters"}),
+    ("scavenge", {"graveyard", "counters"}),
+    ("escape", {"graveyard", "spellslinger"}),
+    ("embalm", {"graveyard", "tokens"}),
+    ("eternalize", {"graveyard", "tokens"}),
+    ("disturb", {"graveyard", "tokens"}),
+    ("aftermath", {"graveyard", "spellslinger"}),
+    ("exploit", {"sacrifice", "graveyard"}),
+    ("casualty", {"sacrifice", "spellslinger"}),
+    ("bargain", {"sacrifice", "spellslinger"}),
+    ("impending", {"control", "spellslinger"}),
 
     # Sacrifice / aristocrats-adjacent
-    "exploit": {"sacrifice", "graveyard"},
-    "devour": {"sacrifice", "tokens", "counters"},
-    "champion": {"sacrifice", "graveyard"},
-    "aftermath": {"graveyard", "spellslinger"},
-    "casualty": {"sacrifice", "spellslinger"},
-    "bargain": {"sacrifice", "spellslinger"},
-    "offering": {"sacrifice", "spellslinger"},
-    "afterlife": {"tokens", "graveyard", "sacrifice"},
+    ("champion", {"sacrifice", "graveyard"}),
+    ("offering", {"sacrifice", "spellslinger"}),
+    ("afterlife", {"tokens", "graveyard", "sacrifice"}),
 
     # Tokens / go-wide / bodies
-    "myriad": {"tokens"},
-    "fabricate": {"tokens", "artifacts"},
-    "devour": {"tokens", "sacrifice", "counters"},
-    "battle cry": {"tokens", "voltron"},
-    "living weapon": {"tokens", "artifacts", "voltron"},
-    "embalm": {"tokens", "graveyard"},
-    "eternalize": {"tokens", "graveyard"},
-    "encore": {"tokens", "graveyard"},
-    "afterlife": {"tokens", "graveyard", "sacrifice"},
-    "squad": {"tokens"},
-    "saddle": {"tokens", "voltron"},
-    "gift": {"tokens", "lifegain"},  # set-specific, but fits “gifts with bodies”
-    "offspring": {"tokens", "counters"},
+    ("myriad", {"tokens"}),
+    ("battle cry", {"tokens", "voltron"}),
+    ("encore", {"tokens", "graveyard"}),
+    ("squad", {"tokens"}),
+    ("saddle", {"tokens", "voltron"}),
+    ("gift", {"tokens", "lifegain"}),  # set-specific, but fits “gifts with bodies”
 
     # Voltron / tall strategy
-    "double strike": {"voltron"},
-    "first strike": {"voltron"},
-    "haste": {"voltron"},
-    "flying": {"voltron", "control"},
-    "trample": {"voltron", "counters"},
-    "vigilance": {"voltron", "control"},
-    "intimidate": {"voltron"},
-    "bushido": {"voltron"},
-    "bloodthirst": {"counters", "voltron"},
-    "exalted": {"voltron"},
-    "annihilator": {"voltron", "control"},
-    "umbra armor": {"voltron"},
-    "infect": {"voltron", "counters"},
-    "battle cry": {"voltron", "tokens"},
-    "soulbond": {"voltron"},
-    "bestow": {"voltron"},
-    "tribute": {"voltron", "counters"},
-    "dethrone": {"voltron"},
-    "prowess": {"spellslinger"},  # spellslinger wincon, but often on creatures
-    "dash": {"voltron"},
-    "menace": {"voltron"},
-    "renown": {"voltron"},
-    "melee": {"voltron"},
-    "crew": {"voltron", "artifacts"},
-    "partner": {"voltron", "control"},
-    "mentor": {"voltron", "counters"},
-    "riot": {"voltron", "counters"},
-    "boast": {"voltron"},
-    "daybound": {"control"},
-    "nightbound": {"control"},
-    "training": {"voltron", "counters"},
-    "reconfigure": {"voltron", "artifacts"},
-    "blitz": {"voltron", "graveyard"},
-    "enlist": {"voltron"},
-    "living metal": {"voltron", "artifacts"},
-    "more than meets the eye": {"voltron", "artifacts", "spellslinger"},
-    "for mirrodin!": {"voltron", "artifacts", "tokens"},
-    "toxic": {"voltron", "control"},
-    "backup": {"voltron", "counters"},
-    "disguise": {"voltron", "control"},
+    ("bushido", {"voltron"}),
+    ("bloodthirst", {"counters", "voltron"}),
+    ("exalted", {"voltron"}),
+    ("annihilator", {"voltron", "control"}),
+    ("umbra armor", {"voltron"}),
+    ("infect", {"voltron", "counters"}),
+    ("soulbond", {"voltron"}),
+    ("bestow", {"voltron"}),
+    ("tribute", {"voltron", "counters"}),
+    ("dethrone", {"voltron"}),
+    ("prowess", {"spellslinger"}),  # spellslinger wincon, but often on creatures
+    ("dash", {"voltron"}),
+    ("menace", {"voltron"}),
+    ("renown", {"voltron"}),
+    ("melee", {"voltron"}),
+    ("partner", {"voltron", "control"}),
+    ("boast", {"voltron"}),
+    ("daybound", {"control"}),
+    ("nightbound", {"control"}),
+    ("blitz", {"voltron", "graveyard"}),
+    ("enlist", {"voltron"}),
+    ("toxic", {"voltron", "control"}),
+    ("disguise", {"voltron", "control"}),
 
     # Control / prison / disruption
-    "deathtouch": {"control", "voltron"},
-    "defender": {"control"},
-    "flash": {"control", "spellslinger"},
-    "flying": {"control", "voltron"},
-    "hexproof": {"control", "voltron"},
-    "indestructible": {"control", "voltron"},
-    "ward": {"control", "voltron"},
-    "cumulative upkeep": {"control"},
-    "phasing": {"control"},
-    "storm": {"control", "spellslinger"},
-    "split second": {"control"},
-    "suspend": {"control", "spellslinger"},
-    "vanishing": {"control"},
-    "echo": {"control"},
-    "ninjutsu": {"control", "voltron"},
-    "epic": {"control", "spellslinger"},
-    "haunt": {"control", "graveyard"},
-    "shadow": {"voltron"},
-    "ascend": {"control"},
-    "companion": {"control"},
-    "afflict": {"control"},
-    "hidden agenda": {"control"},
-    "daybound": {"control"},
-    "nightbound": {"control"},
-    "space sculptor": {"control"},
-    "visit": {"control"},
-    "solved": {"control", "spellslinger"},
-    "impending": {"control", "spellslinger"},
+    ("ninjutsu", {"control", "voltron"}),
+    ("epic", {"control", "spellslinger"}),
+    ("haunt", {"control", "graveyard"}),
+    ("shadow", {"voltron"}),
+    ("ascend", {"control"}),
+    ("companion", {"control"}),
+    ("afflict", {"control"}),
+    ("hidden agenda", {"control"}),
+    ("space sculptor", {"control"}),
+    ("visit", {"control"}),
+    ("solved", {"control", "spellslinger"}),
 
     # Misc / oddballs that still get *some* theme
-    "horsemanship": {"voltron"},
-    "fading": {"control"},
-    "fear": {"voltron"},
-    "morph": {"control"},
-    "provoke": {"voltron"},
-    "sunburst": {"counters", "artifacts", "lands"},
-    "bushido": {"voltron"},
-    "soulshift": {"graveyard"},
-    "offering": {"sacrifice", "spellslinger"},
-    "ninjutsu": {"voltron", "control"},
-    "epic": {"spellslinger", "control"},
-    "bloodthirst": {"counters", "voltron"},
-    "haunt": {"graveyard", "control"},
-    "transmute": {"spellslinger", "control"},
-    "absorb": {"lifegain", "control"},
-    "poisonous": {"voltron", "control"},
-    "transfigure": {"spellslinger", "graveyard"},
-    "changeling": {"control"},  # really tribal glue; treat as generic
-    "evoke": {"graveyard", "spellslinger"},
-    "hideaway": {"control"},
-    "prowl": {"voltron"},
-    "reinforce": {"counters"},
-    "devour": {"sacrifice", "tokens", "counters"},
-    "exalted": {"voltron"},
-    "annihilator": {"voltron", "control"},
-    "soulbond": {"voltron"},
-    "mutate": {"counters", "graveyard"},
-    "encore": {"tokens", "graveyard"},
-    "skulk": {"voltron"},
-    "emerge": {"graveyard", "artifacts"},
-    "partner": {"voltron", "control"},
-    "ascend": {"control"},
-    "escape": {"graveyard", "spellslinger"},
-    "companion": {"control"},
-    "mutate": {"counters", "graveyard"},
-    "boast": {"voltron"},
-    "decayed": {"tokens", "graveyard"},
-    "cleave": {"spellslinger"},
-    "read ahead": {"control"},
-    "squad": {"tokens"},
-    "space sculptor": {"control"},
-    "visit": {"control"},
-    "saddle": {"tokens", "voltron"},
+    ("horsemanship", {"voltron"}),
+    ("fading", {"control"}),
+    ("fear", {"voltron"}),
+    ("morph", {"control"}),
+    ("provoke", {"voltron"}),
+    ("transmute", {"spellslinger", "control"}),
+    ("poisonous", {"voltron", "control"}),
+    ("transfigure", {"spellslinger", "graveyard"}),
+    ("changeling", {"control"}),  # really tribal glue; treat as generic
+    ("evoke", {"graveyard", "spellslinger"}),
+    ("hideaway", {"control"}),
+    ("prowl", {"voltron"}),
+    ("reinforce", {"counters"}),
+    ("mutate", {"counters", "graveyard"}),
+    ("skulk", {"voltron"}),
+    ("emerge", {"graveyard", "artifacts"}),
+    ("decayed", {"tokens", "graveyard"}),
+    ("cleave", {"spellslinger"}),
+    ("read ahead", {"control"}),
+]
+
+assert len({kw for kw, _ in _KEYWORD_THEME_PAIRS}) == len(_KEYWORD_THEME_PAIRS), \
+    "duplicate keyword in _KEYWORD_THEME_PAIRS"
+
+# Most keywords share one of a handful of theme sets; intern them so equal
+# sets are a single frozenset object.
+_theme_intern: dict[frozenset[str], frozenset[str]] = {}
+
+def _fs(*names: str) -> frozenset[str]:
+    key = frozenset(names)
+    return _theme_intern.setdefault(key, key)
+
+KEYWORD_THEME_OVERRIDES: dict[str, frozenset[str]] = {
+    kw: _fs(*themes) for kw, themes in _KEYWORD_THEME_PAIRS
 }
 
-BASIC_LAND_NAMES = {
+BASIC_LAND_NAMES: frozenset[str] = frozenset({
     "Plains",
     "Island",
     "Swamp",
     "Mountain",
     "Forest",
     "Wastes",
-}
+})
 
-MASS_LAND_DENIAL_NAMES = {
+MASS_LAND_DENIAL_NAMES: frozenset[str] = frozenset({
     "Armageddon",
     "Ravages of War",
     "Ruination",
@@ -623,13 +566,16 @@ MASS_LAND_DENIAL_NAMES = {
     "Static Orb",
     "Blood Moon",
     "Magus of the Moon",
-}
+})
 
-COMBO_FLAG_CARDS = {
+COMBO_FLAG_CARDS: frozenset[str] = frozenset({
     "Ad Nauseam",
     "Underworld Breach",
     "Thassa's Oracle",
-}
+})
+
+# Smart quotes -> ASCII, applied to card text once at load
+_QUOTE_TBL = str.maketrans({"\u2019": "'", "\u2018": "'", "\u201c": '"', "\u201d": '"'})
 
 #Functions
 def commander_synergy_score(profile: dict, card_row: pd.Series) -> float:
@@ -902,7 +848,9 @@ def get_commander_themes(commander_row: pd.Series) -> set[str]:
 def card_matches_themes(card_row: pd.Series, themes: set[str]) -> bool:
     if not themes:
         return False
-    card_theme_set = detect_card_themes(card_row)
+    card_theme_set = _themes_for_card(
+        str(card_row.get("oracle_text", "")), str(card_row.get("type_line", ""))
+    )
     return bool(card_theme_set & themes)
 
 def compute_curve_metrics(pool: pd.DataFrame) -> dict:
@@ -924,30 +872,27 @@ def compute_curve_metrics(pool: pd.DataFrame) -> dict:
         "high_frac": high / total,
     }
 
-def is_land(row: pd.Series) -> bool:
-    return "Land" in str(row.get("type_line", ""))
+# Mana rocks / dorks / treasures / land tutors
+RAMP_KEYWORDS = (
+    "add {",                      # mana abilities
+    "search your library for a land card",
+    "search your library for up to one basic land",
+    "treasure token",
+    "create a treasure token",
+    "create a treasure artifact token",
+    "gain control of target land until end of turn and untap it",
+)
 
 def is_ramp(row: pd.Series) -> bool:
     text = str(row.get("oracle_text", "")).lower()
     type_line = str(row.get("type_line", "")).lower()
     cmc = row.get("cmc", 0)
 
-    # Mana rocks / dorks / treasures / land tutors
-    ramp_keywords = [
-        "add {",                      # mana abilities
-        "search your library for a land card",
-        "search your library for up to one basic land",
-        "treasure token",
-        "create a treasure token",
-        "create a treasure artifact token",
-        "gain control of target land until end of turn and untap it",
-    ]
-
     if "creature" in type_line and "mana" in text:
         return True
 
     if cmc <= 4:
-        for kw in ramp_keywords:
+        for kw in RAMP_KEYWORDS:
             if kw in text:
                 return True
 
@@ -958,23 +903,33 @@ def is_card_draw(row: pd.Series) -> bool:
     # crude but effective: anything that literally says "draw a card"
     return "draw a card" in text or "draw two cards" in text or "draw three cards" in text
 
+# look for "destroy all" / "each creature" style phrases
+WIPE_PHRASES = (
+    "destroy all creatures",
+    "destroy all nonland permanents",
+    "each creature gets",
+    "all creatures get",
+    "each creature loses",
+    "exile all creatures",
+    "exile all nonland permanents",
+)
+
 def is_board_wipe(row: pd.Series) -> bool:
     text = str(row.get("oracle_text", "")).lower()
-    # look for "destroy all" / "each creature" style phrases
-    wipe_phrases = [
-        "destroy all creatures",
-        "destroy all nonland permanents",
-        "each creature gets",
-        "all creatures get",
-        "each creature loses",
-        "exile all creatures",
-        "exile all nonland permanents",
-    ]
-    for kw in wipe_phrases:
+    for kw in WIPE_PHRASES:
         if kw in text:
             return True
     return False
 
+REMOVAL_KEYWORDS = (
+    "destroy target",
+    "exile target",
+    "counter target",
+    "fight target",
+    "deals damage to target creature",
+    "deals damage to any target",
+)
+
 def is_removal(row: pd.Series) -> bool:
     # single-target removal or counterspells
     text = str(row.get("oracle_text", "")).lower()
@@ -984,15 +939,7 @@ def is_removal(row: pd.Series) -> bool:
     if is_board_wipe(row):
         return False
 
-    removal_keywords = [
-        "destroy target",
-        "exile target",
-        "counter target",
-        "fight target",
-        "deals damage to target creature",
-        "deals damage to any target",
-    ]
-    for kw in removal_keywords:
+    for kw in REMOVAL_KEYWORDS:
         if kw in text:
             return True
 
@@ -1004,6 +951,37 @@ def is_removal(row: pd.Series) -> bool:
 
     return False
 
+def _contains_any(text: pd.Series, keywords) -> pd.Series:
+    mask = pd.Series(False, index=text.index)
+    for kw in keywords:
+        mask |= text.str.contains(kw, regex=False, na=False)
+    return mask
+
+def classify_nonland_roles(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Column-wise is_ramp / is_card_draw / is_board_wipe / is_removal for a
+    whole pool at once (same results as applying the row functions above).
+    """
+    text = df["oracle_text"].fillna("").astype(str).str.lower()
+    type_line = df["type_line"].fillna("").astype(str).str.lower()
+
+    ramp = (type_line.str.contains("creature", regex=False) & text.str.contains("mana", regex=False)) | (
+        (df.get("cmc", 0) <= 4) & _contains_any(text, RAMP_KEYWORDS)
+    )
+    draw = _contains_any(text, ("draw a card", "draw two cards", "draw three cards"))
+    wipe = _contains_any(text, WIPE_PHRASES)
+    aura_removal = (
+        type_line.str.contains("aura", regex=False)
+        & text.str.contains("enchant creature", regex=False)
+        & _contains_any(text, ("can't attack", "can't block", "loses all abilities"))
+    )
+    removal = ~wipe & (_contains_any(text, REMOVAL_KEYWORDS) | aura_removal)
+
+    return pd.DataFrame(
+        {"is_ramp": ramp, "is_draw": draw, "is_wipe": wipe, "is_removal": removal},
+        index=df.index,
+    )
+
 def build_deck_for_commander(df: pd.DataFrame, commander_row: pd.Series) -> pd.DataFrame:
     """
     Build a 99-card list (excluding the commander itself) using:
@@ -1028,8 +1006,9 @@ def build_deck_for_commander(df: pd.DataFrame, commander_row: pd.Series) -> pd.D
         pool["roles"] = pool.apply(get_card_roles, axis=1)
 
     # 2) Split lands / nonlands
-    lands = pool[pool.apply(is_land, axis=1)].copy()
-    nonlands = pool[~pool.apply(is_land, axis=1)].copy()
+    land_mask = pool["type_line"].astype(str).str.contains("Land", regex=False, na=False)
+    lands = pool[land_mask].copy()
+    nonlands = pool[~land_mask].copy()
 
     # 3) Compute commander-specific synergy scores for nonlands
     nonlands = nonlands.copy()
@@ -1090,10 +1069,9 @@ def build_deck_for_commander(df: pd.DataFrame, commander_row: pd.Series) -> pd.D
 
     # 4) Classify roles for nonlands
     nonlands = nonlands.copy()
-    nonlands["is_ramp"] = nonlands.apply(is_ramp, axis=1)
-    nonlands["is_draw"] = nonlands.apply(is_card_draw, axis=1)
-    nonlands["is_wipe"] = nonlands.apply(is_board_wipe, axis=1)
-    nonlands["is_removal"] = nonlands.apply(is_removal, axis=1)
+    role_flags = classify_nonland_roles(nonlands)
+    for col in role_flags.columns:
+        nonlands[col] = role_flags[col]
 
     synergy_pool = synergy_pool.merge(
         nonlands[["name", "is_ramp", "is_draw", "is_wipe", "is_removal"]],
@@ -2228,8 +2206,15 @@ def detect_card_themes(card_row: pd.Series) -> set[str]:
     Inspect a card's oracle_text + type_line and return ALL themes
     it appears to match, based on THEME_KEYWORDS and keyword abilities.
     """
-    text = (str(card_row.get("oracle_text", "")) + " " +
-            str(card_row.get("type_line", ""))).lower()
+    return set(_themes_for_card(
+        str(card_row.get("oracle_text", "")), str(card_row.get("type_line", ""))
+    ))
+
+# The same cards are re-checked for every commander's pool, so the theme scan
+# is memoized on the exact text it reads. _themes_for_card.cache_clear() resets.
+@lru_cache(maxsize=50_000)
+def _themes_for_card(oracle_text: str, type_line: str) -> frozenset[str]:
+    text = (oracle_text + " " + type_line).lower()
 
     matched: set[str] = set()
 
@@ -2254,10 +2239,10 @@ def detect_card_themes(card_row: pd.Series) -> set[str]:
         matched.add("lands")
     if "counters on target" in text or "counters on it" in text:
         matched.add("counters")
-    if "players can't" in text or "players can’t" in text:
+    if "players can't" in text:
         matched.add("control")
 
-    return matched
+    return frozenset(matched)
 
 def filter_commander_legal(df: pd.DataFrame, allow_banned: bool = False) -> pd.DataFrame:
     """
@@ -2527,17 +2512,13 @@ def get_card_roles(row: pd.Series) -> set[str]:
         "spells your opponents cast cost" in text
         or "spells your opponent casts cost" in text
         or "players can't cast more than one spell each turn" in text
-        or "players can’t cast more than one spell each turn" in text
         or "players can't draw more than one card each turn" in text
-        or "players can’t draw more than one card each turn" in text
     ):
         roles.add("tax_piece")
 
     if (
         "doesn't untap during its controller's untap step" in text
-        or "doesn’t untap during its controller’s untap step" in text
         or "tapped creatures don't untap" in text
-        or "tapped creatures don’t untap" in text
     ):
         roles.add("tap_freeze")
 
@@ -2616,7 +2597,6 @@ def get_card_roles(row: pd.Series) -> set[str]:
         "creatures you control have flying" in text
         or "creatures you control gain flying" in text
         or "target creature can't be blocked" in text
-        or "target creature can’t be blocked" in text
     ):
         roles.add("evasion_granter")
 
@@ -2665,6 +2645,10 @@ for idx, batch in enumerate(batches, start=1):
 
 df = pd.json_normalize(all_cards)
 
+for col in ("name", "type_line", "oracle_text"):
+    if col in df.columns:
+        df[col] = df[col].str.translate(_QUOTE_TBL)
+
 # Normalize Scryfall's game_changer to a clean bool
 if "game_changer" in df.columns:
     df["game_changer"] = df["game_changer"].fillna(False).astype(bool)
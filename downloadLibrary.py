@@ -37,6 +37,15 @@ resp2.raise_for_status()
 bulkData = resp2.json()
 
 df = pd.json_normalize(bulkData)
+
+'''
+Normalize smart quotes to ASCII once here, so the phrase tables in
+constants.py only need the straight-apostrophe spelling.
+'''
+QUOTE_TABLE = str.maketrans({"\u2019": "'", "\u2018": "'", "\u201c": '"', "\u201d": '"'})
+for col in ("name", "type_line", "oracle_text"):
+    df[col] = df[col].str.translate(QUOTE_TABLE)
+
 '''
 Export Data to Parquet
 '''
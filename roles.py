@@ -218,17 +218,13 @@ def get_card_roles(row: pd.Series) -> set[str]:
         "spells your opponents cast cost" in text
         or "spells your opponent casts cost" in text
         or "players can't cast more than one spell each turn" in text
-        or "players can’t cast more than one spell each turn" in text
         or "players can't draw more than one card each turn" in text
-        or "players can’t draw more than one card each turn" in text
     ):
         roles.add("tax_piece")
 
     if (
         "doesn't untap during its controller's untap step" in text
-        or "doesn’t untap during its controller’s untap step" in text
         or "tapped creatures don't untap" in text
-        or "tapped creatures don’t untap" in text
     ):
         roles.add("tap_freeze")
 
@@ -307,7 +303,6 @@ def get_card_roles(row: pd.Series) -> set[str]:
         "creatures you control have flying" in text
         or "creatures you control gain flying" in text
         or "target creature can't be blocked" in text
-        or "target creature can’t be blocked" in text
     ):
         roles.add("evasion_granter")
 
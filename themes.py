@@ -1,9 +1,16 @@
 # mtg_analyzer/themes.py
 from __future__ import annotations
+import re
 from typing import Set
+import numpy as np
 import pandas as pd
 
-from constants import THEME_KEYWORDS, KEYWORD_THEME_OVERRIDES
+try:  # optional C Aho-Corasick automaton (pip install pyahocorasick)
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+from constants import THEME_KEYWORDS, KEYWORD_THEME_OVERRIDES, PHRASE_TO_THEMES
 
 def detect_card_themes(card_row: pd.Series) -> set[str]:
     """
@@ -13,19 +20,9 @@ def detect_card_themes(card_row: pd.Series) -> set[str]:
     text = (str(card_row.get("oracle_text", "")) + " " +
             str(card_row.get("type_line", ""))).lower()
 
-    matched: set[str] = set()
-
-    # 1) Phrase-based themes (your existing THEME_KEYWORDS)
-    for theme, keywords in THEME_KEYWORDS.items():
-        for kw in keywords:
-            if kw in text:
-                matched.add(theme)
-                break  # don't double count within one theme
-
+    # 1) Phrase-based themes (your existing THEME_KEYWORDS) and
     # 2) CR keyword abilities → themes (this is where all 702.x live)
-    for kw, themes in KEYWORD_THEME_OVERRIDES.items():
-        if kw in text:
-            matched.update(themes)
+    matched = extract_themes(text)
 
     # 3) Broad backups (catch weird templating)
     if "graveyard" in text:
@@ -36,11 +33,109 @@ def detect_card_themes(card_row: pd.Series) -> set[str]:
         matched.add("lands")
     if "counters on target" in text or "counters on it" in text:
         matched.add("counters")
-    if "players can't" in text or "players can’t" in text:
+    if "players can't" in text:
         matched.add("control")
 
     return matched
 
+# theme -> every phrase that adds it, in first-seen order; phrase-based themes
+# and CR keyword overrides land in the same set so one alternation covers both.
+_THEME_PHRASES: dict[str, list[str]] = {}
+for _theme, _keywords in THEME_KEYWORDS.items():
+    _THEME_PHRASES.setdefault(_theme, []).extend(_keywords)
+for _kw, _themes in KEYWORD_THEME_OVERRIDES.items():
+    for _theme in _themes:
+        _THEME_PHRASES.setdefault(_theme, []).append(_kw)
+
+# phrase -> themes it adds: PHRASE_TO_THEMES plus the keyword overrides
+_PHRASE_THEMES: dict[str, set[str]] = {p: set(t) for p, t in PHRASE_TO_THEMES.items()}
+for _kw, _themes in KEYWORD_THEME_OVERRIDES.items():
+    _PHRASE_THEMES.setdefault(_kw, set()).update(_themes)
+
+# Character trie over every phrase above: each node maps the next character to
+# its child, and _TRIE_END holds the themes of a phrase ending at that node.
+# Phrases are ASCII-only; card text has smart quotes normalized at load.
+_TRIE_END = ""
+_THEME_TRIE: dict = {}
+for _phrase, _themes in _PHRASE_THEMES.items():
+    _node = _THEME_TRIE
+    for _ch in _phrase:
+        _node = _node.setdefault(_ch, {})
+    _node[_TRIE_END] = _themes
+
+# Same phrases in pyahocorasick's automaton when it is installed; its iter()
+# reports overlapping matches too, so results equal the trie walk.
+_AUTOMATON = None
+if ahocorasick is not None:
+    _AUTOMATON = ahocorasick.Automaton()
+    for _phrase, _themes in _PHRASE_THEMES.items():
+        _AUTOMATON.add_word(_phrase, frozenset(_themes))
+    _AUTOMATON.make_automaton()
+
+def extract_themes(text: str) -> set[str]:
+    """
+    Themes whose THEME_KEYWORDS phrases or keyword overrides occur in text.
+
+    Walks the trie from each start position, so every phrase is matched in a
+    single pass over the (already lowercased) text instead of one substring
+    scan per phrase. Same substring semantics as `phrase in text`. Uses the
+    pyahocorasick automaton instead when that package is available.
+    """
+    matched: set[str] = set()
+    if _AUTOMATON is not None:
+        for _, themes in _AUTOMATON.iter(text):
+            matched |= themes
+        return matched
+
+    n = len(text)
+    for i in range(n):
+        node = _THEME_TRIE.get(text[i])
+        j = i + 1
+        while node is not None:
+            themes = node.get(_TRIE_END)
+            if themes:
+                matched |= themes
+            if j == n:
+                break
+            node = node.get(text[j])
+            j += 1
+    return matched
+
+def detect_card_themes_bulk(df: pd.DataFrame) -> pd.Series:
+    """
+    Column-wise detect_card_themes over a whole DataFrame.
+
+    One str.contains scan per theme instead of a Python call (and a boxed
+    row Series) per card; returns a Series of theme sets aligned with df.index.
+    """
+    text = (df["oracle_text"].fillna("").astype(str) + " " +
+            df["type_line"].fillna("").astype(str)).str.lower()
+
+    def has(phrase: str) -> pd.Series:
+        return text.str.contains(phrase, regex=False)
+
+    masks = {
+        theme: text.str.contains("|".join(map(re.escape, phrases)), regex=True)
+        for theme, phrases in _THEME_PHRASES.items()
+    }
+
+    # 3) Broad backups (catch weird templating)
+    backups = {
+        "graveyard": has("graveyard"),
+        "lifegain": has("gain") & has("life"),
+        "lands": has("lands you control") | has("land you control"),
+        "counters": has("counters on target") | has("counters on it"),
+        "control": has("players can't"),
+    }
+    for theme, mask in backups.items():
+        masks[theme] = masks[theme] | mask if theme in masks else mask
+
+    themes: list[set[str]] = [set() for _ in range(len(text))]
+    for theme, mask in masks.items():
+        for pos in np.flatnonzero(mask.to_numpy(dtype=bool)):
+            themes[pos].add(theme)
+    return pd.Series(themes, index=df.index, dtype=object)
+
 def get_commander_themes(commander_row: pd.Series) -> set[str]:
     return detect_card_themes(commander_row)
 